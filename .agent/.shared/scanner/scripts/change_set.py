@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Change Set - restrict a scanner to the files touched by a change
+
+Every scanner accepts the same three options:
+
+    --changed-since REF   files changed in the working tree since REF, plus untracked files
+    --staged              files staged for commit (pre-commit hooks)
+    --files-from FILE     newline-separated paths, '-' for stdin
+
+The resulting paths become the scope of the shared source cache, so file
+discovery only yields changed files; checks of whole-project invariants
+(locale completeness, project detection, dependency audits, the SQL schema
+replay, import graphs and route mounts) ask the cache for unscoped files and
+still see everything.
+
+Usage:
+    from change_set import add_scope_arguments, apply_scope
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    scope = apply_scope(args.path, args)   # None when no option was given
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from source_cache import get_cache
+
+
+class ChangeSetError(Exception):
+    """The change set could not be resolved (bad ref, not a git repository)."""
+
+
+def add_scope_arguments(parser) -> None:
+    group = parser.add_argument_group("change scope")
+    group.add_argument("--changed-since", metavar="REF",
+                       help="Only scan files changed since a git ref (plus untracked files)")
+    group.add_argument("--staged", action="store_true",
+                       help="Only scan files staged for commit")
+    group.add_argument("--files-from", metavar="FILE",
+                       help="Only scan the paths listed in FILE, one per line ('-' for stdin)")
+
+
+def _git(project_path: Path, *args: str) -> List[str]:
+    try:
+        proc = subprocess.run(["git", *args], cwd=project_path, capture_output=True,
+                              text=True, encoding='utf-8', errors='replace', timeout=60)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ChangeSetError(f"git {args[0]} failed: {e}")
+    if proc.returncode != 0:
+        raise ChangeSetError(proc.stderr.strip() or f"git {args[0]} failed")
+    return [line for line in proc.stdout.splitlines() if line.strip()]
+
+
+def git_changed_files(project_path, since: Optional[str] = None, staged: bool = False) -> List[Path]:
+    """Absolute paths of existing files changed since `since` and/or staged for commit."""
+    project_path = Path(project_path).resolve()
+    top = Path(_git(project_path, "rev-parse", "--show-toplevel")[0])
+
+    names = []
+    if staged:
+        names += _git(project_path, "diff", "--cached", "--name-only", "--diff-filter=d")
+    if since:
+        names += _git(project_path, "diff", "--name-only", "--diff-filter=d", since, "--")
+        names += _git(project_path, "ls-files", "--others", "--exclude-standard", "--full-name")
+    return _existing(top / name for name in names)
+
+
+def read_file_list(source: str, base=None) -> List[Path]:
+    """Paths listed one per line in a file ('-' = stdin), relative to `base` or the cwd."""
+    base = Path(base or os.getcwd())
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            lines = Path(source).read_text(encoding='utf-8').splitlines()
+        except OSError as e:
+            raise ChangeSetError(f"cannot read file list {source}: {e}")
+    return _existing(base / line.strip() for line in lines if line.strip())
+
+
+def _existing(paths) -> List[Path]:
+    seen = {}
+    for path in paths:
+        path = Path(os.path.abspath(path))
+        if path.is_file():
+            seen.setdefault(path, None)
+    return list(seen)
+
+
+def resolve_scope(project_path, args) -> Optional[List[Path]]:
+    """The files selected by the scope options, or None when none was given."""
+    since = getattr(args, 'changed_since', None)
+    staged = getattr(args, 'staged', False)
+    files_from = getattr(args, 'files_from', None)
+    if not (since or staged or files_from):
+        return None
+
+    paths = []
+    if since or staged:
+        paths += git_changed_files(project_path, since, staged)
+    if files_from:
+        paths += read_file_list(files_from)
+    return _existing(paths)
+
+
+def apply_scope(project_path, args) -> Optional[List[Path]]:
+    """Resolve the scope options and restrict the project's source cache to them."""
+    scope = resolve_scope(project_path, args)
+    if scope is not None:
+        get_cache(project_path).set_scope(scope)
+    return scope
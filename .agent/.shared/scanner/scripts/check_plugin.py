@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check Plugin - in-process entry point shared by the skill scanners
+
+A scanner that can run inside the check runners (checklist.py, verify_all.py)
+exposes, next to its CLI main():
+
+    def run(project_path, url=None) -> Result
+
+which prints nothing to the real console, never touches sys.argv and never
+calls sys.exit. The runners import the script once and call run() instead of
+spawning a fresh interpreter per check; scripts without it still run as a
+subprocess.
+
+Usage (in a scanner):
+    from check_plugin import Result, capture_check
+
+    def check(project_path) -> int:
+        ...print the report...
+        return 0 if passed else 1
+
+    def run(project_path, url=None) -> Result:
+        return capture_check(check, project_path)
+"""
+
+import io
+import sys
+import threading
+import traceback
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+# passed: exit status 0; output/error: what the CLI would print to stdout/stderr
+Result = namedtuple('Result', ['passed', 'output', 'error', 'duration'])
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """
+    Stand-in for sys.stdout/sys.stderr: writes from a capturing thread go to its
+    buffer, everything else to the real stream. Lets a check's report be captured
+    while other threads keep printing status lines.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    @property
+    def encoding(self):
+        return getattr(self._stream, 'encoding', 'utf-8')
+
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+
+    @contextmanager
+    def capture(self):
+        saved = getattr(self._local, 'buffer', None)
+        buffer = self._local.buffer = io.StringIO()
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = saved
+
+
+_install_lock = threading.Lock()
+
+
+def _routed(name: str) -> _ThreadRoutedStream:
+    with _install_lock:
+        stream = getattr(sys, name)
+        if not isinstance(stream, _ThreadRoutedStream):
+            stream = _ThreadRoutedStream(stream)
+            setattr(sys, name, stream)
+        return stream
+
+
+def capture_check(check, *args, **kwargs) -> Result:
+    """
+    Call a CLI-style check (prints its report, returns an exit code) and
+    capture what it prints on this thread. A stray sys.exit() or an exception
+    becomes a failed Result rather than escaping into the runner.
+    """
+    stdout_stream, stderr_stream = _routed('stdout'), _routed('stderr')
+    with stdout_stream.capture() as stdout, stderr_stream.capture() as stderr:
+        start_time = datetime.now()
+        try:
+            code = check(*args, **kwargs)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                stderr.write(f"{e.code}\n")
+                code = 1
+        except Exception:
+            stderr.write(traceback.format_exc())
+            code = 1
+        duration = (datetime.now() - start_time).total_seconds()
+        return Result(not code, stdout.getvalue(), stderr.getvalue(), duration)
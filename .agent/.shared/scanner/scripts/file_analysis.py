@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File Analysis - per-file results cached by content hash, computed in parallel
+
+Scanners whose verdict for a file depends only on its text (type coverage,
+SEO/GEO page checks) hand a module-level analyzer to analyze_files(). Results
+are stored per content hash under a section of a JSON cache file in
+<project>/.agent/.cache, so a re-run only analyzes files whose content
+changed; those are spread over a process pool when there are enough of them.
+
+Usage:
+    from file_analysis import analyze_files
+
+    def analyze_page(text: str) -> dict:      # top-level, so it pickles
+        ...
+
+    for path, verdict in analyze_files(pages, analyze_page, 'seo', 1, project_path,
+                                       cache_file=Path('.agent/.cache/seo_pages.json')):
+        ...
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from source_cache import get_cache, read_source
+
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 24
+
+
+def _load(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save(path: Path, data: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def analyze_files(files: list, analyzer, section: str, version: int, project_path,
+                  workers: int = 1, use_cache: bool = True, *, cache_file: Path) -> list:
+    """
+    (path, result) for every readable file, in order. Results are cached per
+    content hash under `section` in `cache_file` (relative to the project);
+    a different `version` discards the section. Only changed files are
+    analyzed, in a process pool when workers != 1 (0 = one per CPU) and
+    at least PARALLEL_MIN_FILES of them changed.
+    """
+    project_path = Path(project_path).resolve()
+    cache_path = project_path / cache_file
+    cache = _load(cache_path) if use_cache else {}
+    stored = cache.get(section, {})
+    if stored.get('version') != version:
+        stored = {'version': version, 'files': {}}
+    known = stored['files']
+
+    hashed, misses = [], {}
+    for path in files:
+        text = read_source(path)
+        if text is None:
+            continue
+        digest = hashlib.sha1(text.encode('utf-8', 'replace')).hexdigest()
+        hashed.append((path, digest))
+        if digest not in known:
+            misses.setdefault(digest, text)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(misses) < PARALLEL_MIN_FILES:
+        fresh = map(analyzer, misses.values())
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # multiprocessing costs ~0.1s to import
+        chunksize = max(1, len(misses) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(analyzer, misses.values(), chunksize=chunksize))
+    for digest, result in zip(list(misses), fresh):
+        known[digest] = result
+
+    results = [(path, known[digest]) for path, digest in hashed]
+    if use_cache:
+        # Keep only what the project still contains; a scoped run (changed
+        # files only) saw part of the tree, so it keeps everything
+        if get_cache(project_path).scope is None:
+            live = {digest for _, digest in hashed}
+            stored['files'] = {d: v for d, v in known.items() if d in live}
+        cache[section] = stored
+        _save(cache_path, cache)
+    return results
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JS Lexer - token stream for JavaScript/TypeScript(X) sources
+
+Shared by the scanners that need more than line regexes: the React
+performance checker (awaits, effects, memoized components) and the
+TypeScript type-coverage counter.
+
+Usage:
+    from js_lexer import tokenize, match_brackets
+    tokens = tokenize(text, jsx=path.suffix != '.ts')
+    partner = match_brackets(tokens)
+"""
+
+import re
+from collections import namedtuple
+from typing import List, Optional
+
+# A small hand-rolled lexer so checks can reason about tokens and brackets
+# instead of running DOTALL regexes over whole files. Every pattern
+# is matched anchored at the current offset and always consumes input, so
+# lexing is linear in file size; regex-literal scans are additionally capped
+# at MAX_REGEX_LITERAL characters.
+
+# kind: 'name' | 'punct' | 'string' | 'template' | 'number' | 'regex' | 'jsx'
+# nl: a line break precedes the token (needed for ASI-style statement splits)
+Token = namedtuple('Token', ['kind', 'value', 'start', 'nl'])
+
+MAX_REGEX_LITERAL = 512
+
+CODE_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s*)
+    (?: (?P<comment>//[^\n]*|/\*(?:[^*]|\*(?!/))*(?:\*/)?)
+      | (?P<name>[^\W\d][\w$]*|\$[\w$]*)
+      | (?P<number>\.?\d[\w.]*)
+      | (?P<string>'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?)
+      | (?P<template>`)
+      | (?P<punct>=>|\.\.\.|\?\.|&&|\|\||\?\?|\S)
+    )?
+""", re.VERBOSE | re.DOTALL)
+REGEX_LITERAL_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+TEMPLATE_CHUNK_RE = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.DOTALL)
+JSX_TAG_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<name>[^\W\d][\w$\-:.]*)
+  | (?P<string>"[^"]*"?|'[^']*'?)
+  | (?P<punct>/>|\S)
+""", re.VERBOSE)
+JSX_TEXT_RE = re.compile(r'[^<{]+')
+JSX_CLOSING_TAG_RE = re.compile(r'</[^>]*>?')
+TS_GENERIC_ARROW_RE = re.compile(r'<\s*[A-Za-z_$][\w$]*\s*(?:,|extends\b)')
+
+# After these, '/' starts a regex and '<' may start JSX
+EXPRESSION_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+                       'case', 'do', 'else', 'yield', 'await', 'default', 'extends'}
+EXPRESSION_END_PUNCT = {')', ']', '}'}
+
+
+def _expression_expected(prev: Optional[Token]) -> bool:
+    if prev is None:
+        return True
+    if prev.kind == 'punct':
+        return prev.value not in EXPRESSION_END_PUNCT
+    if prev.kind == 'name':
+        return prev.value in EXPRESSION_KEYWORDS
+    return False
+
+
+def tokenize(text: str, jsx: bool = True) -> List[Token]:
+    """
+    Tokenize JS/TS(X). Comments and whitespace are dropped; template and JSX
+    text are reduced to single tokens. Nesting is tracked with a mode stack:
+    'brace' ({ in code), 'template' (${ in a template literal), 'jsx_expr'
+    ({ inside JSX), 'jsx_tag' and 'jsx_children'.
+    """
+    tokens: List[Token] = []
+    stack: List[str] = []
+    pos, end = 0, len(text)
+    nl = False
+    prev: Optional[Token] = None
+
+    def emit(kind, value, start):
+        nonlocal nl, prev
+        tok = Token(kind, value, start, nl)
+        tokens.append(tok)
+        nl = False
+        prev = tok
+
+    def scan_template(start):
+        """Scan template text from `start`; returns the new offset."""
+        m = TEMPLATE_CHUNK_RE.match(text, start)
+        after = m.end()
+        if text.startswith('${', after):
+            stack.append('template')
+            return after + 2
+        emit('template', '`', start)
+        return after + 1  # past the closing backtick (or end of text)
+
+    while pos < end:
+        mode = stack[-1] if stack else 'brace'
+
+        if mode == 'jsx_children':
+            if text[pos] == '{':
+                stack.append('jsx_expr')
+                emit('punct', '{', pos)
+                pos += 1
+            elif text.startswith('</', pos):
+                m = JSX_CLOSING_TAG_RE.match(text, pos)
+                stack.pop()
+                emit('jsx', m.group(), pos)
+                pos = m.end()
+            elif text[pos] == '<':
+                stack.append('jsx_tag')
+                emit('jsx', '<', pos)
+                pos += 1
+            else:
+                m = JSX_TEXT_RE.match(text, pos)
+                pos = m.end()
+            continue
+
+        if mode == 'jsx_tag':
+            m = JSX_TAG_TOKEN_RE.match(text, pos)
+            kind, value = m.lastgroup, m.group()
+            pos = m.end()
+            if kind == 'ws':
+                continue
+            if value == '{':
+                stack.append('jsx_expr')
+                emit('punct', '{', m.start())
+            elif value == '/>':
+                stack.pop()
+                emit('jsx', value, m.start())
+            elif value == '>':
+                stack[-1] = 'jsx_children'
+                emit('jsx', value, m.start())
+            else:
+                emit('jsx' if kind != 'string' else 'string', value, m.start())
+            continue
+
+        # Leading whitespace is matched together with the token that follows it
+        m = CODE_TOKEN_RE.match(text, pos)
+        kind = m.lastgroup
+        pos = m.end()
+        if text.find('\n', m.start(), m.end('ws')) >= 0:
+            nl = True
+        if kind == 'ws':
+            continue
+        start = m.start(kind)
+        value = m.group(kind)
+
+        if kind in ('name', 'string', 'number'):
+            prev = Token(kind, value, start, nl)
+            tokens.append(prev)
+            nl = False
+        elif kind == 'comment':
+            if '\n' in value:
+                nl = True
+        elif kind == 'template':
+            pos = scan_template(pos)
+        elif value == '{':
+            stack.append('brace')
+            emit('punct', value, start)
+        elif value == '}':
+            popped = stack.pop() if stack else 'brace'
+            if popped == 'template':
+                pos = scan_template(pos)
+            else:
+                emit('punct', value, start)
+        elif value == '/' and _expression_expected(prev):
+            rm = REGEX_LITERAL_RE.match(text, start, min(end, start + MAX_REGEX_LITERAL))
+            if rm:
+                pos = rm.end()
+                emit('regex', rm.group(), start)
+            else:
+                emit('punct', value, start)
+        elif (value == '<' and jsx and _expression_expected(prev) and pos < end
+              and (text[pos] == '>' or text[pos].isalpha() or text[pos] in '_$')
+              and not TS_GENERIC_ARROW_RE.match(text, start)):
+            stack.append('jsx_tag')
+            emit('jsx', value, start)
+        else:
+            emit('punct', value, start)
+
+    return tokens
+
+
+def match_brackets(tokens: List[Token]) -> List[int]:
+    """For every ( [ { token, the index of its closing partner (and vice versa); -1 otherwise."""
+    partner = [-1] * len(tokens)
+    stack = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != 'punct':
+            continue
+        if tok.value in '([{':
+            stack.append(i)
+        elif tok.value in ')]}' and stack:
+            j = stack.pop()
+            partner[i], partner[j] = j, i
+    return partner
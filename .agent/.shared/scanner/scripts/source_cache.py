@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Source Cache - shared file discovery and content loading for skill scanners
+
+Every skill script walks and reads the same project tree. SourceCache walks it
+once with a single ignore policy (SKIP_DIRS plus the root .gitignore), reads
+each file at most once and keeps a line index per file. Scanners ask for the
+process-wide instance, so scripts run in one process (verify_all.py) share it.
+
+Usage:
+    from source_cache import get_cache
+    cache = get_cache(project_path)
+    for path in cache.files({'.tsx', '.jsx'}, under=project_path / 'src'):
+        text = cache.read(path)
+        line = cache.line_index(path).line_of(offset)
+    api_files = cache.glob(['**/routes/*.ts', '**/*api*.py'])
+    pages = find_page_files(project_path, is_page_file, skip_dirs={'docs'})
+
+Benchmark discovery against Path.glob() + post-filtering:
+    python source_cache.py <project_path> --benchmark
+"""
+
+import fnmatch
+import os
+import re
+import sys
+import time
+from bisect import bisect_right
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# ============ IGNORE POLICY ============
+# Directory names never worth scanning, wherever they appear
+SKIP_DIRS = {
+    'node_modules', '.git', 'dist', 'build', 'out', 'coverage', '.next', '.nuxt',
+    '.turbo', '.vercel', '__pycache__', '.venv', 'venv', '.pytest_cache',
+    '.mypy_cache', '.ruff_cache', '.idea',
+}
+
+# (project-relative POSIX path, size in bytes, mtime in ns)
+FileEntry = namedtuple('FileEntry', ['rel', 'path', 'size', 'mtime'])
+
+GitignoreRule = Tuple[str, bool, bool, bool]
+
+
+def load_gitignore(project_path) -> List[GitignoreRule]:
+    """
+    Parse the root .gitignore into (pattern, negated, dir_only, anchored) rules.
+    Only the subset of gitignore syntax used in practice is supported.
+    """
+    rules = []
+    gitignore = Path(project_path) / ".gitignore"
+    try:
+        lines = gitignore.read_text(encoding='utf-8', errors='ignore').splitlines()
+    except OSError:
+        return rules
+
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        anchored = '/' in line
+        line = line.lstrip('/')
+        if line:
+            rules.append((line, negated, dir_only, anchored))
+
+    return rules
+
+
+def is_gitignored(rel_path: str, is_dir: bool, rules: List[GitignoreRule]) -> bool:
+    """Return True if the project-relative POSIX path is excluded by the rules."""
+    ignored = False
+    name = rel_path.rsplit('/', 1)[-1]
+    for pattern, negated, dir_only, anchored in rules:
+        if dir_only and not is_dir:
+            continue
+        target = rel_path if anchored else name
+        if fnmatch.fnmatch(target, pattern):
+            ignored = not negated
+    return ignored
+
+
+def _read_text(path, limit: int = -1) -> Optional[str]:
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read(limit)
+    except OSError:
+        return None
+
+
+# ============ LINE INDEX ============
+class LineIndex:
+    """Offsets of line starts in a text, for offset -> line lookups."""
+
+    __slots__ = ('text', 'starts')
+
+    def __init__(self, text: str):
+        self.text = text
+        starts = [0]
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        self.starts = starts
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number containing the character offset."""
+        return bisect_right(self.starts, offset)
+
+    def line(self, number: int) -> str:
+        """Text of a 1-based line, without its newline."""
+        start = self.starts[number - 1]
+        end = self.starts[number] - 1 if number < len(self.starts) else len(self.text)
+        return self.text[start:end]
+
+
+# ============ SOURCE CACHE ============
+class SourceCache:
+    """One pruned walk of a project plus memoised file contents and line indexes."""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self.rules = load_gitignore(self.root)
+        self._entries: Optional[List[FileEntry]] = None
+        self._by_path: Dict[Path, FileEntry] = {}
+        self._ignored: List[Tuple[str, bool]] = []
+        self._texts: Dict[Path, Optional[str]] = {}
+        self._lines: Dict[Path, LineIndex] = {}
+        self.scope: Optional[Set[str]] = None
+        self.stats = {'walks': 0, 'reads': 0, 'hits': 0}
+
+    # ---------- discovery ----------
+    def _walk(self) -> List[FileEntry]:
+        entries = []
+        root = str(self.root)
+        rules = self.rules
+        self.stats['walks'] += 1
+
+        for dirpath, dirs, files in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            rel_dir = '' if rel_dir == '.' else rel_dir + '/'
+
+            kept = []
+            for d in sorted(dirs):
+                if d in SKIP_DIRS:
+                    continue
+                if rules and is_gitignored(rel_dir + d, True, rules):
+                    self._ignored.append((rel_dir + d, True))
+                    continue
+                kept.append(d)
+            dirs[:] = kept
+
+            for name in sorted(files):
+                rel = rel_dir + name
+                if rules and is_gitignored(rel, False, rules):
+                    self._ignored.append((rel, False))
+                    continue
+                path = Path(dirpath, name)
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append(FileEntry(rel, path, st.st_size, st.st_mtime_ns))
+
+        return entries
+
+    def entries(self) -> List[FileEntry]:
+        """Every non-ignored file under the root, in sorted path order."""
+        if self._entries is None:
+            self._entries = self._walk()
+            self._by_path = {entry.path: entry for entry in self._entries}
+        return self._entries
+
+    def ignored(self) -> List[Tuple[str, bool]]:
+        """(relative path, is_dir) for everything pruned by .gitignore."""
+        self.entries()
+        return self._ignored
+
+    def set_scope(self, paths: Optional[Iterable]) -> None:
+        """
+        Restrict files() to these paths (e.g. the files changed since a git ref);
+        None lifts the restriction. Whole-project checks opt out with scoped=False.
+        """
+        self.scope = None if paths is None else {self.relpath(p) for p in paths}
+
+    def files(self, extensions: Optional[Iterable[str]] = None, under=None,
+              names: Iterable[str] = (), skip_dirs: Iterable[str] = (),
+              scoped: bool = True) -> List[Path]:
+        """
+        Files matching an extension set (case-insensitive suffix) or exact names.
+        `under` restricts to a subdirectory; `skip_dirs` adds directory names
+        to exclude on top of the shared policy (relative to the root). With a
+        scope set, only scoped files are returned unless `scoped` is False.
+        """
+        exts = {e.lower() for e in extensions} if extensions is not None else None
+        names = set(names)
+        skip = set(skip_dirs)
+        prefix = self._prefix(under)
+        scope = self.scope if scoped else None
+
+        matched = []
+        for entry in self.entries():
+            rel = entry.rel
+            if scope is not None and rel not in scope:
+                continue
+            if prefix is not None and not rel.startswith(prefix):
+                continue
+            name = rel.rsplit('/', 1)[-1]
+            if exts is not None and os.path.splitext(name)[1].lower() not in exts and name not in names:
+                continue
+            if skip and not skip.isdisjoint(rel.split('/')[:-1]):
+                continue
+            matched.append(entry.path)
+        return matched
+
+    def glob(self, patterns: Iterable[str], under=None, scoped: bool = True) -> List[Path]:
+        """
+        Files matching any of several pathlib-style globs ('**' spans directories,
+        '*' stays within one), relative to `under` or the root, in a single pass
+        over the walk. Ordered like consecutive Path.glob() calls (pattern by
+        pattern) without their duplicates.
+        """
+        matchers = [glob_regex(p).match for p in patterns]
+        scope = self.scope if scoped else None
+        prefix = self._prefix(under) or ''
+
+        buckets: List[List[Path]] = [[] for _ in matchers]
+        for entry in self.entries():
+            rel = entry.rel
+            if scope is not None and rel not in scope:
+                continue
+            if not rel.startswith(prefix):
+                continue
+            sub = rel[len(prefix):]
+            for bucket, match in zip(buckets, matchers):
+                if match(sub):
+                    bucket.append(entry.path)
+                    break
+        return [path for bucket in buckets for path in bucket]
+
+    def _prefix(self, under) -> Optional[str]:
+        if under is None:
+            return None
+        rel = os.path.relpath(Path(under).resolve(), self.root).replace(os.sep, '/')
+        return None if rel == '.' else rel + '/'
+
+    def entry(self, path) -> Optional[FileEntry]:
+        self.entries()
+        return self._by_path.get(Path(os.path.abspath(path)))
+
+    def relpath(self, path) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, '/')
+
+    # ---------- content ----------
+    def read(self, path) -> Optional[str]:
+        """File text (UTF-8, undecodable bytes replaced), or None if unreadable."""
+        key = Path(os.path.abspath(path))
+        if key in self._texts:
+            self.stats['hits'] += 1
+            return self._texts[key]
+
+        self.stats['reads'] += 1
+        text = _read_text(key)
+        self._texts[key] = text
+        return text
+
+    def read_head(self, path, chars: int) -> Optional[str]:
+        """First `chars` characters of a file; a bounded read unless the full text is cached."""
+        key = Path(os.path.abspath(path))
+        if key in self._texts:
+            self.stats['hits'] += 1
+            text = self._texts[key]
+            return None if text is None else text[:chars]
+        return _read_text(key, chars)
+
+    def line_index(self, path) -> Optional[LineIndex]:
+        key = Path(os.path.abspath(path))
+        index = self._lines.get(key)
+        if index is None:
+            text = self.read(key)
+            if text is None:
+                return None
+            index = self._lines[key] = LineIndex(text)
+        return index
+
+    def forget(self, path) -> None:
+        """Drop cached content for a file (e.g. after a large one-off read)."""
+        key = Path(os.path.abspath(path))
+        self._texts.pop(key, None)
+        self._lines.pop(key, None)
+
+
+def glob_regex(pattern: str) -> 're.Pattern':
+    """Compile a pathlib-style glob over POSIX relative paths."""
+    segments = pattern.split('/')
+    regex = ''
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == '**':
+            regex += '.*' if last else '(?:[^/]+/)*'
+            continue
+        for ch in segment:
+            regex += '[^/]*' if ch == '*' else '[^/]' if ch == '?' else re.escape(ch)
+        if not last:
+            regex += '/'
+    return re.compile(regex + r'\Z')
+
+
+_CACHES: Dict[Path, SourceCache] = {}
+
+
+def get_cache(project_path) -> SourceCache:
+    """
+    Process-wide cache for a project. A path inside an already cached root
+    reuses that root's cache; callers then filter with `under=`.
+    """
+    path = Path(project_path).resolve()
+    if path.is_file():
+        path = path.parent
+
+    cache = _CACHES.get(path)
+    if cache is not None:
+        return cache
+    for root, cache in _CACHES.items():
+        if root in path.parents:
+            return cache
+
+    cache = _CACHES[path] = SourceCache(path)
+    return cache
+
+
+def find_cache(path) -> Optional[SourceCache]:
+    """The existing cache whose root contains `path`, if any."""
+    path = Path(os.path.abspath(path))
+    for root, cache in _CACHES.items():
+        if root == path or root in path.parents:
+            return cache
+    return None
+
+
+def read_source(path) -> Optional[str]:
+    """
+    Read a file through the cache that covers it, or straight from disk when
+    no cache does (single-file runs, worker processes).
+    """
+    cache = find_cache(path)
+    if cache is not None:
+        return cache.read(path)
+    return _read_text(path)
+
+
+def read_head(path, chars: int) -> Optional[str]:
+    """First `chars` characters of a file, without reading (or caching) the rest."""
+    cache = find_cache(path)
+    if cache is not None:
+        return cache.read_head(path, chars)
+    return _read_text(path, chars)
+
+
+# Files the page auditors (seo_checker, geo_checker) look at, in report order
+PAGE_EXTENSIONS = ('.html', '.htm', '.jsx', '.tsx')
+
+
+def find_page_files(project_path, is_page, skip_dirs: Iterable[str] = ()) -> List[Path]:
+    """
+    Page files in one pass over the shared walk: PAGE_EXTENSIONS outside
+    `skip_dirs`, kept when `is_page(relative_path)` says so. The predicate sees
+    the project-relative path, so directories above the project never make
+    a file look like a page. Ordered by extension, then path.
+    """
+    root = Path(project_path).resolve()
+    cache = get_cache(root)
+    order = {ext: i for i, ext in enumerate(PAGE_EXTENSIONS)}
+    pages = [f for f in cache.files(PAGE_EXTENSIONS, under=root, skip_dirs=skip_dirs)
+             if is_page(Path(cache.relpath(f)))]
+    return sorted(pages, key=lambda f: order[f.suffix.lower()])
+
+
+# ============ DISCOVERY BENCHMARK ============
+# Globs the scanners discover with (api_validator, type_coverage, i18n_checker)
+BENCHMARK_PATTERNS = [
+    "**/*api*.ts", "**/*api*.js", "**/*api*.py",
+    "**/routes/*.ts", "**/routes/*.js", "**/routes/*.py",
+    "**/controllers/*.ts", "**/controllers/*.js",
+    "**/endpoints/*.ts", "**/endpoints/*.py",
+    "**/*.ts", "**/*.tsx", "**/*.js", "**/*.jsx", "**/*.py", "**/*.vue",
+]
+# The substring post-filter the scanners used to apply after Path.glob()
+LEGACY_EXCLUDES = ['node_modules', '.git', 'dist', 'build', '__pycache__']
+
+
+def benchmark_discovery(root, patterns=BENCHMARK_PATTERNS, repeat: int = 3) -> dict:
+    """
+    Time Path.glob() per pattern + substring post-filtering against one pruned
+    walk + SourceCache.glob(). Returns best-of-`repeat` timings and whether
+    the pruned result equals the globbed file set.
+    """
+    root = Path(root).resolve()
+
+    def legacy():
+        found = []
+        for pattern in patterns:
+            found.extend(root.glob(pattern))
+        return [f for f in found if not any(x in str(f) for x in LEGACY_EXCLUDES)]
+
+    def pruned():
+        return SourceCache(root).glob(patterns)
+
+    timings, results = {}, {}
+    for label, fn in (('glob+filter', legacy), ('pruned', pruned)):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[label] = fn()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[label] = best
+
+    # Reference set: the globs with the excludes applied per path component
+    # (the substring test also drops e.g. "PlaylistBuilder.test.jsx") and
+    # .gitignore'd paths removed
+    cache = SourceCache(root)
+    ignored = {Path(root, rel) for rel, _ in cache.ignored()}
+    excluded = set(LEGACY_EXCLUDES)
+    reference = set()
+    for pattern in patterns:
+        for p in root.glob(pattern):
+            if (p.is_file() and excluded.isdisjoint(p.relative_to(root).parts)
+                    and not any(d in ignored for d in [p, *p.parents])):
+                reference.add(p)
+    pruned = set(results['pruned'])
+    return {
+        'timings': timings,
+        'files': {label: len(found) for label, found in results.items()},
+        'reference': len(reference),
+        'identical': reference == pruned,
+        'substring_false_positives': len(reference - set(results['glob+filter'])),
+        'walk_entries': len(cache.entries()),
+    }
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Source cache utilities")
+    parser.add_argument("path", nargs="?", default=".", help="Project root")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare Path.glob()+post-filter discovery with the pruned walk")
+    parser.add_argument("--pattern", action="append", help="Glob to benchmark (repeatable)")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        cache = get_cache(args.path)
+        print(f"{len(cache.entries())} files, {len(cache.ignored())} gitignored entries under {cache.root}")
+        return
+
+    report = benchmark_discovery(args.path, args.pattern or BENCHMARK_PATTERNS)
+    print(f"\n[DISCOVERY BENCHMARK] {Path(args.path).resolve()}")
+    print("-" * 50)
+    for label, seconds in report['timings'].items():
+        print(f"  {label:<12} {seconds:8.3f}s  {report['files'][label]:>7} paths")
+    print(f"  speedup      {report['timings']['glob+filter'] / max(report['timings']['pruned'], 1e-9):7.1f}x")
+    print(f"  same files:  {report['identical']} ({report['reference']} unique, "
+          f"excluding .gitignore'd and excluded directories)")
+    if report['substring_false_positives']:
+        print(f"  substring post-filter wrongly dropped {report['substring_false_positives']} file(s)")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
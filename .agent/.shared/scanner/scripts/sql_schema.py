@@ -0,0 +1,625 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQL Schema - the effective Postgres/Supabase schema of a project's .sql files
+
+Splits SQL into statements in one regex-driven pass and replays the DDL that
+decides how tables are indexed: tables and columns, primary/unique/foreign
+keys, indexes and row-level-security policies, including DDL run from DO
+blocks (directly or through EXECUTE '...'), plus the latest definition of
+every function (RPC). Loose scripts apply first in path order, then the
+migration directories in filename (timestamp) order, so the ordered
+migrations have the last word over one-off scripts (demo imports, fixes).
+
+Usage:
+    from sql_schema import find_sql_files, load_schema
+    schema = load_schema(find_sql_files(project_path), project_path)
+    for table, fk in schema.unindexed_foreign_keys():
+        ...
+"""
+
+import re
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from source_cache import get_cache, read_source
+
+# ============================================================================
+#  STATEMENTS
+# ============================================================================
+
+# Everything that can hide a ';': comments (dropped), strings and quoted
+# identifiers (kept), dollar-quoted bodies (kept; skipped to their closing tag)
+SQL_TOKEN_RE = re.compile(r"""
+    --[^\n]*
+  | /\*.*?(?:\*/|\Z)
+  | '[^']*(?:''[^']*)*'
+  | "[^"]*"
+  | \$(?:[A-Za-z_]\w*)?\$
+  | ;
+""", re.VERBOSE | re.DOTALL)
+
+
+def split_statements(text: str) -> Iterator[Tuple[int, str]]:
+    """
+    (offset, statement) for each ';'-terminated statement, comments removed;
+    the offset is that of the statement's first word.
+    """
+    pieces: List[str] = []
+    begin = None
+    pos = start = 0
+    end = len(text)
+    while True:
+        m = SQL_TOKEN_RE.search(text, pos)
+        token = m.group() if m else ';'
+        first = token[0]
+        if first == ';' or first == '-' or first == '/':
+            chunk = text[start:m.start() if m else end]
+            if begin is None and not chunk.isspace() and chunk:
+                begin = start + len(chunk) - len(chunk.lstrip())
+            pieces.append(chunk)
+            if first != ';':
+                pieces.append(' ')
+            elif begin is not None:
+                yield begin, ''.join(pieces).strip()
+                pieces, begin = [], None
+            if m is None:
+                return
+            pos = start = m.end()
+        elif first == '$':
+            close = text.find(token, m.end())
+            pos = end if close < 0 else close + len(token)
+        else:
+            pos = m.end()
+
+
+def matching_paren(text: str, open_at: int) -> int:
+    """Offset of the ')' closing the '(' at `open_at` (len(text) if unclosed), strings skipped."""
+    depth = 0
+    for m in PAREN_SCAN_RE.finditer(text, open_at):
+        token = m.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+            if depth == 0:
+                return m.start()
+    return len(text)
+
+
+def split_top_level(text: str, sep: str = ',') -> List[str]:
+    """Split on `sep` outside parentheses and quotes."""
+    parts, depth, start = [], 0, 0
+    for m in PAREN_SCAN_RE.finditer(text):
+        token = m.group()
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif token == sep and depth == 0:
+            parts.append(text[start:m.start()].strip())
+            start = m.end()
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+
+PAREN_SCAN_RE = re.compile(r"""[(),]|'[^']*(?:''[^']*)*'|"[^"]*"|\$(?:[A-Za-z_]\w*)?\$.*?\$(?:[A-Za-z_]\w*)?\$""",
+                           re.DOTALL)
+
+# ============================================================================
+#  NAMES
+# ============================================================================
+
+IDENT = r'(?:"[^"]+"|[A-Za-z_][\w$]*)'
+QNAME = rf'{IDENT}(?:\s*\.\s*{IDENT})?'
+IDENT_RE = re.compile(IDENT)
+STRING_RE = re.compile(r"'[^']*(?:''[^']*)*'")
+
+
+def _blank(m) -> str:
+    return ' ' * len(m.group())
+
+
+def sql_name(raw: str) -> str:
+    """Normalized (schema-)qualified name: unquoted parts lowercased, 'public.' dropped."""
+    parts = [p[1:-1] if p.startswith('"') else p.lower() for p in IDENT_RE.findall(raw)]
+    if len(parts) > 1 and parts[0] == 'public':
+        parts = parts[1:]
+    return '.'.join(parts)
+
+
+def _column_list(raw: str) -> Tuple[str, ...]:
+    return tuple(sql_name(col) for col in split_top_level(raw))
+
+# ============================================================================
+#  SCHEMA MODEL
+# ============================================================================
+
+# columns: tuple of column names; an expression index member is '(expr)'.
+# source: 'path:line' of the statement that declared it
+Index = namedtuple('Index', ['name', 'table', 'columns', 'unique', 'partial', 'source'])
+ForeignKey = namedtuple('ForeignKey', ['name', 'table', 'columns', 'ref_table', 'ref_columns', 'source'])
+Policy = namedtuple('Policy', ['name', 'table', 'command', 'using', 'check', 'source'])
+# params: names of the named parameters; body: the source between the AS quotes
+Function = namedtuple('Function', ['name', 'params', 'language', 'body', 'source'])
+
+
+class Table:
+    """Columns, keys, indexes and policies of one table as the scripts leave it."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.created = False        # a CREATE TABLE for it was seen
+        self.columns: Dict[str, str] = {}
+        self.indexes: Dict[str, Index] = {}          # includes PK/UNIQUE constraints
+        self.foreign_keys: Dict[str, ForeignKey] = {}
+        self.policies: Dict[str, Policy] = {}
+        self.rls = False
+
+    def covers(self, columns) -> bool:
+        """Whether some index leads with exactly these columns (in any order)."""
+        wanted = set(columns)
+        n = len(wanted)
+        return any(set(index.columns[:n]) == wanted for index in self.indexes.values())
+
+    def drop_column(self, column: str) -> None:
+        # Postgres drops every index and constraint that uses the column
+        self.columns.pop(column, None)
+        self.indexes = {k: v for k, v in self.indexes.items() if column not in v.columns}
+        self.foreign_keys = {k: v for k, v in self.foreign_keys.items() if column not in v.columns}
+
+    def rename_column(self, old: str, new: str) -> None:
+        if old in self.columns:
+            self.columns[new] = self.columns.pop(old)
+        swap = lambda cols: tuple(new if c == old else c for c in cols)  # noqa: E731
+        self.indexes = {k: v._replace(columns=swap(v.columns)) for k, v in self.indexes.items()}
+        self.foreign_keys = {k: v._replace(columns=swap(v.columns)) for k, v in self.foreign_keys.items()}
+
+
+CREATE_TABLE_RE = re.compile(
+    rf'CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+'
+    rf'(?:IF\s+NOT\s+EXISTS\s+)?({QNAME})\s*\(', re.I)
+ALTER_TABLE_RE = re.compile(rf'ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?({QNAME})\s+(.*)', re.I | re.S)
+DROP_TABLE_RE = re.compile(r'DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?(.*?)(?:\s+(?:CASCADE|RESTRICT))?\s*$', re.I | re.S)
+CREATE_INDEX_RE = re.compile(
+    rf'CREATE\s+(UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:(?:IF\s+NOT\s+EXISTS\s+)?({QNAME})\s+)?'
+    rf'ON\s+(?:ONLY\s+)?({QNAME})\s*(?:USING\s+\w+\s*)?\(', re.I)
+DROP_INDEX_RE = re.compile(r'DROP\s+INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+EXISTS\s+)?(.*?)(?:\s+(?:CASCADE|RESTRICT))?\s*$',
+                           re.I | re.S)
+CREATE_POLICY_RE = re.compile(rf'CREATE\s+POLICY\s+({IDENT})\s+ON\s+({QNAME})(.*)', re.I | re.S)
+CREATE_FUNCTION_RE = re.compile(rf'CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+({QNAME})\s*\(', re.I)
+DROP_FUNCTION_RE = re.compile(r'DROP\s+FUNCTION\s+(?:IF\s+EXISTS\s+)?(.*?)(?:\s+(?:CASCADE|RESTRICT))?\s*$', re.I | re.S)
+FUNCTION_BODY_RE = re.compile(r"\bAS\s+(?:(\$(?:[A-Za-z_]\w*)?\$)(.*?)\1|'((?:[^']|'')*)')", re.I | re.S)
+LANGUAGE_RE = re.compile(r"\bLANGUAGE\s+'?(\w+)", re.I)
+PARAM_MODE_RE = re.compile(r'(?:(IN|OUT|INOUT|VARIADIC)\s+)?(.*)', re.I | re.S)
+DROP_POLICY_RE = re.compile(rf'DROP\s+POLICY\s+(?:IF\s+EXISTS\s+)?({IDENT})\s+ON\s+({QNAME})', re.I)
+POLICY_COMMAND_RE = re.compile(r'\bFOR\s+(ALL|SELECT|INSERT|UPDATE|DELETE)\b', re.I)
+POLICY_EXPR_RE = re.compile(r'\b(USING|WITH\s+CHECK)\s*\(', re.I)
+DO_BLOCK_RE = re.compile(r'DO\s+(?:LANGUAGE\s+\w+\s+)?(\$(?:[A-Za-z_]\w*)?\$)(.*)\1', re.I | re.S)
+# DDL inside a DO body, possibly behind IF ... THEN, or an EXECUTE of a literal
+NESTED_DDL_RE = re.compile(r'\b(?:CREATE|ALTER|DROP)\s+(?:UNIQUE\s+)?(?:TABLE|INDEX|POLICY)\b', re.I)
+EXECUTE_RE = re.compile(r"\bEXECUTE\s+'((?:[^']|'')*)'", re.I)
+
+REFERENCES_RE = re.compile(rf'\bREFERENCES\s+({QNAME})\s*(?:\(([^)]*)\))?', re.I)
+TABLE_CONSTRAINT_RE = re.compile(r'(?:CONSTRAINT\s+(' + IDENT + r')\s+)?'
+                                 r'(PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK|EXCLUDE)\b\s*(?:NULLS\s+(?:NOT\s+)?DISTINCT\s*)?'
+                                 r'(?:\(([^)]*)\))?(.*)', re.I | re.S)
+TYPE_RE = re.compile(r'[\w.]+(?:\[\])?')
+LIKE_RE = re.compile(r'LIKE\s', re.I)
+INLINE_PK_RE = re.compile(r'\bPRIMARY\s+KEY\b', re.I)
+INLINE_UNIQUE_RE = re.compile(r'\bUNIQUE\b', re.I)
+ADD_RE = re.compile(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(.*)', re.I | re.S)
+ADD_CONSTRAINT_RE = re.compile(r'ADD\s+(?=CONSTRAINT\b|PRIMARY\b|UNIQUE\b|FOREIGN\b|CHECK\b|EXCLUDE\b)(.*)', re.I | re.S)
+DROP_COLUMN_RE = re.compile(rf'DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?(?!CONSTRAINT\b)({IDENT})', re.I)
+DROP_CONSTRAINT_RE = re.compile(rf'DROP\s+CONSTRAINT\s+(?:IF\s+EXISTS\s+)?({IDENT})', re.I)
+RENAME_COLUMN_RE = re.compile(rf'RENAME\s+(?:COLUMN\s+)?(?!TO\b|CONSTRAINT\b)({IDENT})\s+TO\s+({IDENT})', re.I)
+RENAME_TABLE_RE = re.compile(rf'RENAME\s+TO\s+({IDENT})', re.I)
+RLS_RE = re.compile(r'(ENABLE|DISABLE)\s+ROW\s+LEVEL\s+SECURITY', re.I)
+INDEX_MEMBER_RE = re.compile(rf'({IDENT})(?:\s+(?:ASC|DESC|NULLS\s+(?:FIRST|LAST)|COLLATE\s+\S+|[a-z_]+_ops))*\s*$', re.I)
+WHERE_RE = re.compile(r'\bWHERE\b', re.I)
+
+
+class Schema:
+    """The tables left by replaying DDL statements in order."""
+
+    def __init__(self):
+        self.tables: Dict[str, Table] = {}
+        self.index_owner: Dict[str, str] = {}     # index name -> table (index names are schema-wide)
+        # (name, number of input parameters) -> latest definition
+        self.functions: Dict[Tuple[str, int], Function] = {}
+        self.stats = {'files': 0, 'bytes': 0, 'statements': 0, 'ddl': 0}
+
+    def table(self, name: str) -> Table:
+        table = self.tables.get(name)
+        if table is None:
+            table = self.tables[name] = Table(name)
+        return table
+
+    # ---------- replay ----------
+    def apply_text(self, text: str, source: str) -> None:
+        """Replay every statement of one script; `source` labels findings ('path')."""
+        self.stats['files'] += 1
+        self.stats['bytes'] += len(text)
+        line, counted = 1, 0
+        for offset, statement in split_statements(text):
+            line += text.count('\n', counted, offset)
+            counted = offset
+            self.apply(statement, f'{source}:{line}')
+
+    def apply(self, statement: str, source: str = '') -> None:
+        self.stats['statements'] += 1
+        head = statement[:6].upper()
+        if head.startswith('CREATE'):
+            m = CREATE_FUNCTION_RE.match(statement)
+            if m:
+                return self._create_function(m, statement, source)
+            m = CREATE_TABLE_RE.match(statement)
+            if m:
+                return self._create_table(m, statement, source)
+            m = CREATE_INDEX_RE.match(statement)
+            if m:
+                return self._create_index(m, statement, source)
+            m = CREATE_POLICY_RE.match(statement)
+            if m:
+                return self._create_policy(m, source)
+        elif head.startswith('ALTER'):
+            m = ALTER_TABLE_RE.match(statement)
+            if m:
+                return self._alter_table(m, source)
+        elif head.startswith('DROP'):
+            for regex, handler in ((DROP_TABLE_RE, self._drop_tables), (DROP_INDEX_RE, self._drop_indexes),
+                                   (DROP_POLICY_RE, self._drop_policy), (DROP_FUNCTION_RE, self._drop_functions)):
+                m = regex.match(statement)
+                if m:
+                    return handler(m)
+        elif head.startswith('DO'):
+            m = DO_BLOCK_RE.match(statement)
+            if m:
+                return self._apply_block(m.group(2), source)
+
+    def _apply_block(self, body: str, source: str) -> None:
+        for _, statement in split_statements(body):
+            for m in EXECUTE_RE.finditer(statement):
+                self.apply(m.group(1).replace("''", "'").strip().rstrip(';'), source)
+            # strings blanked so a RAISE NOTICE 'create table ...' is not DDL
+            m = NESTED_DDL_RE.search(STRING_RE.sub(_blank, statement))
+            if m:
+                self.apply(statement[m.start():], source)
+
+    def _create_table(self, m, statement: str, source: str) -> None:
+        self.stats['ddl'] += 1
+        name = sql_name(m.group(1))
+        existing = self.tables.get(name)
+        if existing is not None and existing.created:
+            if 'NOT EXISTS' in statement[:m.end()].upper():
+                return
+            self._drop_table(name)
+        # a table only altered so far (loose scripts have no reliable order) is merged into
+        table = self.table(name)
+        table.created = True
+        body = statement[m.end() - 1:]
+        close = matching_paren(body, 0)
+        for element in split_top_level(body[1:close]):
+            if TABLE_CONSTRAINT_RE.match(element):
+                self._add_constraint(table, element, source)
+            elif not LIKE_RE.match(element):
+                self._add_column(table, element, source)
+
+    def _add_column(self, table: Table, definition: str, source: str) -> None:
+        m = IDENT_RE.match(definition)
+        if m is None:
+            return
+        column = sql_name(m.group())
+        rest = definition[m.end():].strip()
+        kind = TYPE_RE.match(rest)
+        table.columns[column] = kind.group().lower() if kind else ''
+        if INLINE_PK_RE.search(rest):
+            table.indexes[f'{table.name}_pkey'] = Index(f'{table.name}_pkey', table.name, (column,), True, False, source)
+        elif INLINE_UNIQUE_RE.search(rest):
+            key = f'{table.name}_{column}_key'
+            table.indexes[key] = Index(key, table.name, (column,), True, False, source)
+        ref = REFERENCES_RE.search(rest)
+        if ref:
+            key = f'{table.name}_{column}_fkey'
+            ref_cols = _column_list(ref.group(2)) if ref.group(2) else ('id',)
+            table.foreign_keys[key] = ForeignKey(key, table.name, (column,), sql_name(ref.group(1)), ref_cols, source)
+
+    def _add_constraint(self, table: Table, definition: str, source: str) -> None:
+        m = TABLE_CONSTRAINT_RE.match(definition)
+        if m is None or m.group(3) is None:
+            return
+        kind = m.group(2).upper().split()[0]
+        columns = _column_list(m.group(3))
+        if kind == 'PRIMARY':
+            name = sql_name(m.group(1)) if m.group(1) else f'{table.name}_pkey'
+            table.indexes[name] = Index(name, table.name, columns, True, False, source)
+        elif kind == 'UNIQUE':
+            name = sql_name(m.group(1)) if m.group(1) else f"{table.name}_{'_'.join(columns)}_key"
+            table.indexes[name] = Index(name, table.name, columns, True, False, source)
+        elif kind == 'FOREIGN':
+            ref = REFERENCES_RE.search(m.group(4))
+            if ref:
+                name = sql_name(m.group(1)) if m.group(1) else f"{table.name}_{'_'.join(columns)}_fkey"
+                ref_cols = _column_list(ref.group(2)) if ref.group(2) else ('id',)
+                table.foreign_keys[name] = ForeignKey(name, table.name, columns, sql_name(ref.group(1)),
+                                                      ref_cols, source)
+
+    def _alter_table(self, m, source: str) -> None:
+        self.stats['ddl'] += 1
+        table = self.table(sql_name(m.group(1)))
+        for action in split_top_level(m.group(2)):
+            upper = action[:6].upper()
+            if upper.startswith('ADD'):
+                c = ADD_CONSTRAINT_RE.match(action)
+                if c:
+                    self._add_constraint(table, c.group(1), source)
+                else:
+                    a = ADD_RE.match(action)
+                    if a:
+                        self._add_column(table, a.group(1), source)
+            elif upper.startswith('DROP'):
+                c = DROP_CONSTRAINT_RE.match(action)
+                if c:
+                    name = sql_name(c.group(1))
+                    table.indexes.pop(name, None)
+                    table.foreign_keys.pop(name, None)
+                    continue
+                c = DROP_COLUMN_RE.match(action)
+                if c:
+                    table.drop_column(sql_name(c.group(1)))
+            elif upper.startswith('RENAME'):
+                c = RENAME_TABLE_RE.match(action)
+                if c:
+                    self._rename_table(table, sql_name(c.group(1)))
+                    return
+                c = RENAME_COLUMN_RE.match(action)
+                if c:
+                    table.rename_column(sql_name(c.group(1)), sql_name(c.group(2)))
+            else:
+                c = RLS_RE.match(action)
+                if c:
+                    table.rls = c.group(1).upper() == 'ENABLE'
+
+    def _rename_table(self, table: Table, new: str) -> None:
+        old = table.name
+        self.tables.pop(old, None)
+        self._drop_table(new)
+        table.name = new
+        table.indexes = {k: v._replace(table=new) for k, v in table.indexes.items()}
+        table.foreign_keys = {k: v._replace(table=new) for k, v in table.foreign_keys.items()}
+        table.policies = {k: v._replace(table=new) for k, v in table.policies.items()}
+        self.tables[new] = table
+        for index, owner in self.index_owner.items():
+            if owner == old:
+                self.index_owner[index] = new
+
+    def _drop_table(self, name: str) -> None:
+        if self.tables.pop(name, None) is not None:
+            self.index_owner = {k: v for k, v in self.index_owner.items() if v != name}
+
+    def _drop_tables(self, m) -> None:
+        self.stats['ddl'] += 1
+        for raw in split_top_level(m.group(1)):
+            self._drop_table(sql_name(raw))
+
+    def _create_index(self, m, statement: str, source: str) -> None:
+        self.stats['ddl'] += 1
+        table_name = sql_name(m.group(3))
+        open_at = m.end() - 1
+        close = matching_paren(statement, open_at)
+        columns = []
+        for member in split_top_level(statement[open_at + 1:close]):
+            col = INDEX_MEMBER_RE.match(member)
+            columns.append(sql_name(col.group(1)) if col else f'({member})')
+        if m.group(2):
+            name = sql_name(m.group(2)).split('.')[-1]
+        else:
+            name = f"{table_name}_{'_'.join(c if c[0] != '(' else 'expr' for c in columns)}_idx"
+        if name in self.index_owner and 'NOT EXISTS' in statement[:m.end()].upper():
+            return
+        partial = WHERE_RE.search(statement, close) is not None
+        table = self.table(table_name)
+        table.indexes[name] = Index(name, table_name, tuple(columns), bool(m.group(1)), partial, source)
+        self.index_owner[name] = table_name
+
+    def _drop_indexes(self, m) -> None:
+        self.stats['ddl'] += 1
+        for raw in split_top_level(m.group(1)):
+            name = sql_name(raw).split('.')[-1]
+            owner = self.index_owner.pop(name, None)
+            if owner in self.tables:
+                self.tables[owner].indexes.pop(name, None)
+
+    def _create_policy(self, m, source: str) -> None:
+        self.stats['ddl'] += 1
+        name = sql_name(m.group(1))
+        table = self.table(sql_name(m.group(2)))
+        rest = m.group(3)
+        command = POLICY_COMMAND_RE.search(rest)
+        exprs = {}
+        for e in POLICY_EXPR_RE.finditer(rest):
+            open_at = e.end() - 1
+            exprs[e.group(1).split()[0].upper()] = rest[open_at + 1:matching_paren(rest, open_at)].strip()
+        table.policies[name] = Policy(name, table.name, command.group(1).upper() if command else 'ALL',
+                                      exprs.get('USING'), exprs.get('WITH'), source)
+
+    def _drop_policy(self, m) -> None:
+        self.stats['ddl'] += 1
+        table = self.tables.get(sql_name(m.group(2)))
+        if table is not None:
+            table.policies.pop(sql_name(m.group(1)), None)
+
+    def _create_function(self, m, statement: str, source: str) -> None:
+        name = sql_name(m.group(1))
+        open_at = m.end() - 1
+        close = matching_paren(statement, open_at)
+        params = []
+        for param in split_top_level(statement[open_at + 1:close]):
+            mode, rest = PARAM_MODE_RE.match(param).groups()
+            if mode and mode.upper() == 'OUT':
+                continue
+            words = rest.split()
+            # 'p_date TIMESTAMPTZ' is named; a lone type ('uuid') is not
+            params.append(sql_name(words[0]) if len(words) > 1 and words[1].upper() != 'DEFAULT' else None)
+        body = FUNCTION_BODY_RE.search(statement, close)
+        if body is None:
+            return
+        text = body.group(2) if body.group(1) else body.group(3).replace("''", "'")
+        language = LANGUAGE_RE.search(statement, close)
+        self.functions[(name, len(params))] = Function(name, tuple(p for p in params if p),
+                                                       language.group(1).lower() if language else 'sql',
+                                                       text, source)
+
+    def _drop_functions(self, m) -> None:
+        for raw in split_top_level(m.group(1)):
+            paren = raw.find('(')
+            name = sql_name(raw[:paren] if paren >= 0 else raw)
+            if paren < 0:
+                self.functions = {k: v for k, v in self.functions.items() if k[0] != name}
+                continue
+            args = [a for a in split_top_level(raw[paren + 1:matching_paren(raw, paren)])
+                    if PARAM_MODE_RE.match(a).group(1) is None or PARAM_MODE_RE.match(a).group(1).upper() != 'OUT']
+            self.functions.pop((name, len(args)), None)
+
+    # ---------- analysis ----------
+    def public_tables(self) -> List[Table]:
+        """Tables the scripts own (schema-qualified ones like auth.users are Supabase's)."""
+        return [t for name, t in sorted(self.tables.items()) if '.' not in name]
+
+    def unindexed_foreign_keys(self) -> List[Tuple[Table, ForeignKey]]:
+        """Foreign keys with no index leading with their columns (slow joins and cascades)."""
+        return [(table, fk) for table in self.public_tables()
+                for fk in table.foreign_keys.values() if not table.covers(fk.columns)]
+
+    def unindexed_policy_columns(self) -> List[Tuple[Table, str, List[Policy]]]:
+        """
+        (table, column, policies) for RLS filter columns no index leads with.
+        USING filters the rows a query scans; WITH CHECK only tests written
+        rows, so there only its subqueries' lookups count.
+        """
+        by_column: Dict[Tuple[str, str], List[Policy]] = {}
+        for table in self.public_tables():
+            for policy in table.policies.values():
+                pairs = (filter_columns(policy.using, table.name, self)
+                         + filter_columns(policy.check, table.name, self, outer=False))
+                for pair in pairs:
+                    users = by_column.setdefault(pair, [])
+                    if policy not in users:
+                        users.append(policy)
+        found = []
+        for (owner, column), policies in sorted(by_column.items(), key=lambda item: (-len(item[1]), item[0])):
+            owner_table = self.tables.get(owner)
+            if owner_table is None or '.' in owner or owner_table.columns.get(column) in ('boolean', 'bool'):
+                continue          # booleans are too unselective to index on their own
+            if not owner_table.covers((column,)):
+                found.append((owner_table, column, policies))
+        return found
+
+
+# ============================================================================
+#  FILTER COLUMNS
+# ============================================================================
+
+# An identifier (optionally qualified) that is not a function call or a type cast
+REF_RE = re.compile(r'(?<!::)(?<![\w$.])(?:(' + IDENT + r')\s*\.\s*)?(' + IDENT + r')(?![\w$]|\s*[.(])')
+SUBQUERY_RE = re.compile(
+    rf'\(\s*SELECT\b(.*?)\bFROM\s+({QNAME})'
+    rf'(?:\s+(?:AS\s+)?(?!WHERE\b|JOIN\b|LEFT\b|RIGHT\b|INNER\b|FULL\b|CROSS\b|LIMIT\b)({IDENT}))?'
+    rf'(?:\s+WHERE\b(.*))?\s*\)$', re.I | re.S)
+SQL_WORDS = {
+    'and', 'or', 'not', 'is', 'in', 'null', 'true', 'false', 'any', 'all', 'some', 'exists', 'between',
+    'like', 'ilike', 'select', 'from', 'where', 'case', 'when', 'then', 'else', 'end', 'as', 'distinct',
+    'current_user', 'session_user', 'current_date', 'current_timestamp', 'current_role', 'localtime',
+    'localtimestamp', 'user', 'limit', 'join', 'on', 'using', 'array', 'interval', 'text', 'uuid',
+    'integer', 'int', 'bigint', 'boolean', 'timestamp', 'timestamptz', 'jsonb', 'json', 'numeric',
+    'date', 'similar', 'to', 'escape', 'order', 'by', 'group', 'having', 'asc', 'desc', 'nulls',
+    'with', 'time', 'zone', 'cast', 'coalesce', 'row',
+}
+
+
+def filter_columns(expr: Optional[str], table: str, schema: Schema, outer: bool = True) -> List[Tuple[str, str]]:
+    """
+    (table, column) pairs an RLS expression filters on: plain column references
+    of the policy table, plus the WHERE columns of single-table subqueries
+    (`business_id IN (SELECT business_id FROM employees WHERE auth_user_id = auth.uid())`
+    also filters employees.auth_user_id). outer=False keeps only the latter.
+    """
+    if not expr:
+        return []
+    found: List[Tuple[str, str]] = []
+    _collect(STRING_RE.sub("''", expr), {table: table}, table, None, schema, found, outer)
+    return found
+
+
+def _collect(expr: str, aliases: Dict[str, str], table: str, parent: Optional[str], schema: Schema,
+             found: list, outer: bool = True) -> None:
+    # Cut out parenthesized subqueries first, analyzing each against its own table
+    rest, pos = [], 0
+    for m in re.finditer(r'\(\s*SELECT\b', expr, re.I):
+        if m.start() < pos:
+            continue
+        close = matching_paren(expr, m.start())
+        sub = SUBQUERY_RE.match(expr, m.start(), close + 1)
+        if sub and sub.group(4):
+            inner = sql_name(sub.group(2))
+            scope = dict(aliases)
+            scope[inner.split('.')[-1]] = inner
+            if sub.group(3):
+                scope[sql_name(sub.group(3))] = inner
+            _collect(sub.group(4), scope, inner, table, schema, found)
+        rest.append(expr[pos:m.start()])
+        rest.append(' ')
+        pos = close + 1
+    if not outer:
+        return
+    rest.append(expr[pos:])
+
+    known = schema.tables.get(table)
+    for m in REF_RE.finditer(''.join(rest)):
+        qualifier, name = m.group(1), m.group(2)
+        column = sql_name(name)
+        if column in SQL_WORDS:
+            continue
+        if qualifier is not None:
+            owner = aliases.get(sql_name(qualifier))
+            if owner is None:
+                continue
+        else:
+            owner = table
+            # a policy can only name existing columns, so the top level needs no
+            # check; in a subquery a column its table lacks is a correlated one
+            if parent is not None and known is not None and known.created and column not in known.columns:
+                owner = parent
+        if (owner, column) not in found:
+            found.append((owner, column))
+
+# ============================================================================
+#  LOADING
+# ============================================================================
+
+
+def find_sql_files(project_path) -> List[Path]:
+    """
+    Every .sql file in apply order: loose scripts in path order, then files
+    in `migrations` directories sorted by file name (their timestamp
+    prefixes interleave across directories).
+    """
+    project_path = Path(project_path).resolve()
+    cache = get_cache(project_path)
+    files = cache.files(('.sql',), under=project_path, scoped=False)
+    migrations = sorted((f for f in files if f.parent.name == 'migrations'), key=lambda f: (f.name, str(f)))
+    loose = [f for f in files if f.parent.name != 'migrations']
+    return loose + migrations
+
+
+def load_schema(files: List[Path], project_path) -> Schema:
+    """Replay `files` in order into a fresh Schema; sources are project-relative."""
+    project_path = Path(project_path).resolve()
+    cache = get_cache(project_path)
+    schema = Schema()
+    for path in files:
+        text = read_source(path)
+        if text is not None:
+            schema.apply_text(text, cache.relpath(path))
+    return schema
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Check History - Antigravity Kit
+===============================
+Per-check timing history for verify_all.py, kept in a local SQLite store
+(<project>/.agent/.cache/check_history.sqlite), plus regression alerts that
+compare each check's latest duration with its rolling median.
+
+Usage:
+    python .agent/scripts/check_history.py [path]                   # Latest run vs median
+    python .agent/scripts/check_history.py [path] --threshold 3     # Flag >3x slowdowns
+    python .agent/scripts/check_history.py [path] --check "UX Audit" --last 20
+"""
+
+import re
+import sys
+import json
+import sqlite3
+import argparse
+import subprocess
+from pathlib import Path
+from statistics import median
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+HISTORY_FILE = Path(".agent") / ".cache" / "check_history.sqlite"
+
+# Regression rule: latest duration > THRESHOLD x median of the previous WINDOW
+# comparable runs, with at least MIN_SAMPLES of them and MIN_DELTA seconds
+# of absolute slowdown (sub-second checks are mostly noise)
+DEFAULT_THRESHOLD = 2.0
+DEFAULT_WINDOW = 10
+MIN_SAMPLES = 3
+MIN_DELTA = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    runner TEXT NOT NULL,
+    git_rev TEXT,
+    mode TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS check_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    category TEXT,
+    passed INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    files_scanned INTEGER,
+    findings INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_check_results_name ON check_results(name, run_id);
+"""
+
+
+# ============================================================================
+#  METRICS FROM CHECK OUTPUT
+# ============================================================================
+
+# Keys the scanners use in their JSON summaries
+FILE_COUNT_KEYS = ('files_checked', 'pages_checked', 'schemas_checked', 'scanned_files')
+FINDING_COUNT_KEYS = ('issues_found', 'total_findings')
+
+# Fallbacks for scanners that only print text
+FILE_COUNT_PATTERNS = [
+    re.compile(r'(\d+) (?:mobile )?files checked'),
+    re.compile(r'Analyzed (\d+) '),
+    re.compile(r'Found (\d+) [\w/ ]*?(?:files|pages)'),
+]
+FINDING_COUNT_PATTERNS = [
+    re.compile(r'ISSUES \((\d+)\)'),
+    re.compile(r'(\d+) (?:critical )?issues found'),
+]
+
+
+def _last_json_object(output: str) -> Optional[dict]:
+    """The last top-level JSON object printed at the start of a line, if any."""
+    decoder = json.JSONDecoder()
+    pos = len(output)
+    while True:
+        pos = output.rfind('\n{', 0, pos)
+        start = pos + 1 if pos != -1 else (0 if output.startswith('{') else -1)
+        if start == -1:
+            return None
+        try:
+            value, _ = decoder.raw_decode(output, start)
+            if isinstance(value, dict):
+                return value
+        except ValueError:
+            pass
+        if pos <= 0:
+            return None
+
+
+def _find_count(data, keys) -> Optional[int]:
+    """First matching integer key; otherwise the largest hit in nested dicts."""
+    if not isinstance(data, dict):
+        return None
+    for key in keys:
+        if isinstance(data.get(key), int) and not isinstance(data.get(key), bool):
+            return data[key]
+    nested = [_find_count(v, keys) for v in data.values() if isinstance(v, dict)]
+    nested = [n for n in nested if n is not None]
+    return max(nested) if nested else None
+
+
+def extract_metrics(output: str) -> Tuple[Optional[int], Optional[int]]:
+    """(files scanned, findings) from a check's stdout; None where it does not say."""
+    if not output:
+        return None, None
+
+    files = findings = None
+    data = _last_json_object(output)
+    if data is not None:
+        files = _find_count(data, FILE_COUNT_KEYS)
+        findings = _find_count(data, FINDING_COUNT_KEYS)
+        if findings is None and isinstance(data.get('issues'), list):
+            findings = len(data['issues'])
+
+    if files is None:
+        for pattern in FILE_COUNT_PATTERNS:
+            counts = [int(m) for m in pattern.findall(output)]
+            if counts:
+                files = sum(counts)
+                break
+    if findings is None:
+        for pattern in FINDING_COUNT_PATTERNS:
+            match = pattern.search(output)
+            if match:
+                findings = int(match.group(1))
+                break
+
+    return files, findings
+
+
+# ============================================================================
+#  STORE
+# ============================================================================
+
+def _git_rev(project_path: Path) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_path,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+class CheckHistory:
+    """SQLite-backed run history for one project."""
+
+    def __init__(self, project_path):
+        self.project_path = Path(project_path)
+        self.path = self.project_path / HISTORY_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def record_run(self, runner: str, mode: str, duration: float, results: List[dict]) -> int:
+        """
+        Store one run with a row per check that actually ran (results replayed
+        from the result cache say nothing about timing). Returns the run id.
+        """
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (started, runner, git_rev, mode, duration) VALUES (?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec='seconds'), runner,
+                 _git_rev(self.project_path), mode, duration))
+            run_id = cursor.lastrowid
+            rows = []
+            for r in results:
+                if r.get("cached"):
+                    continue
+                files, findings = extract_metrics(r.get("output", ""))
+                rows.append((run_id, r["name"], r.get("category"), int(bool(r["passed"])),
+                             int(bool(r.get("skipped"))), r.get("duration", 0), files, findings))
+            self.db.executemany(
+                "INSERT INTO check_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return run_id
+
+    def latest_run(self, runner: Optional[str] = None) -> Optional[Tuple[int, str, str]]:
+        """(run id, mode, runner) of the newest run."""
+        query = "SELECT id, mode, runner FROM runs"
+        params: tuple = ()
+        if runner:
+            query += " WHERE runner = ?"
+            params = (runner,)
+        return self.db.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+
+    def check_rows(self, run_id: int) -> List[tuple]:
+        return self.db.execute(
+            "SELECT name, category, passed, skipped, duration, files_scanned, findings "
+            "FROM check_results WHERE run_id = ? ORDER BY rowid", (run_id,)).fetchall()
+
+    def previous(self, name: str, before_run: int, mode: str, runner: str,
+                 window: int = DEFAULT_WINDOW) -> List[Tuple[float, Optional[int]]]:
+        """(duration, files) of the check's last `window` comparable, non-skipped runs."""
+        return self.db.execute(
+            "SELECT c.duration, c.files_scanned FROM check_results c JOIN runs r ON r.id = c.run_id "
+            "WHERE c.name = ? AND c.run_id < ? AND c.skipped = 0 AND r.mode = ? AND r.runner = ? "
+            "ORDER BY c.run_id DESC LIMIT ?",
+            (name, before_run, mode, runner, window)).fetchall()
+
+    def history(self, name: str, last: int) -> List[tuple]:
+        return self.db.execute(
+            "SELECT r.started, r.git_rev, r.mode, c.passed, c.skipped, c.duration, c.files_scanned, "
+            "c.findings FROM check_results c JOIN runs r ON r.id = c.run_id WHERE c.name = ? "
+            "ORDER BY c.run_id DESC LIMIT ?", (name, last)).fetchall()
+
+
+# ============================================================================
+#  REGRESSIONS
+# ============================================================================
+
+def compare_run(history: CheckHistory, run_id: int, mode: str, runner: str,
+                threshold: float = DEFAULT_THRESHOLD, window: int = DEFAULT_WINDOW) -> List[dict]:
+    """Each non-skipped check of a run against the rolling median of its earlier runs."""
+    rows = []
+    for name, category, passed, skipped, duration, files, findings in history.check_rows(run_id):
+        if skipped:
+            continue
+        previous = history.previous(name, run_id, mode, runner, window)
+        row = {"name": name, "category": category, "duration": duration, "files": files,
+               "findings": findings, "samples": len(previous), "median": None,
+               "ratio": None, "regressed": False}
+        if previous:
+            baseline = median(d for d, _ in previous)
+            row["median"] = baseline
+            row["ratio"] = duration / baseline if baseline > 0 else None
+            prior_files = [f for _, f in previous if f is not None]
+            row["median_files"] = median(prior_files) if prior_files else None
+            row["regressed"] = (len(previous) >= MIN_SAMPLES and baseline > 0
+                                and duration > threshold * baseline
+                                and duration - baseline >= MIN_DELTA)
+        rows.append(row)
+    return rows
+
+
+def describe_regression(row: dict) -> str:
+    text = (f"{row['name']}: {row['duration']:.1f}s vs median {row['median']:.1f}s "
+            f"({row['ratio']:.1f}x over {row['samples']} runs)")
+    if row.get("median_files") and row["files"] is not None:
+        text += f"; files {row['median_files']:.0f} -> {row['files']}"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-check timing history and regression report")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown factor vs rolling median to flag (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help=f"Earlier runs in the rolling median (default: {DEFAULT_WINDOW})")
+    parser.add_argument("--runner", default="verify_all", help="Runner whose history to read")
+    parser.add_argument("--check", help="Show raw history for one check")
+    parser.add_argument("--last", type=int, default=10, help="Rows to show with --check")
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not (project_path / HISTORY_FILE).exists():
+        print(f"No check history yet ({HISTORY_FILE}); run verify_all.py first.")
+        sys.exit(0)
+
+    history = CheckHistory(project_path)
+    try:
+        if args.check:
+            print(f"{'started':<20} {'rev':<9} {'mode':<14} {'status':<7} {'time':>7} {'files':>6} {'findings':>8}")
+            for started, rev, mode, passed, skipped, duration, files, findings in history.history(args.check, args.last):
+                status = "skip" if skipped else ("pass" if passed else "fail")
+                print(f"{started:<20} {rev or '-':<9} {mode:<14} {status:<7} {duration:>6.1f}s "
+                      f"{files if files is not None else '-':>6} {findings if findings is not None else '-':>8}")
+            return
+
+        latest = history.latest_run(args.runner)
+        if latest is None:
+            print(f"No {args.runner} runs recorded.")
+            return
+        run_id, mode, runner = latest
+        rows = compare_run(history, run_id, mode, runner, args.threshold, args.window)
+
+        print(f"{'check':<24} {'time':>7} {'median':>7} {'ratio':>6} {'files':>6} {'findings':>8}")
+        for row in rows:
+            median_str = f"{row['median']:.1f}s" if row['median'] is not None else "-"
+            ratio_str = f"{row['ratio']:.1f}x" if row['ratio'] is not None else "-"
+            flag = "  << REGRESSED" if row["regressed"] else ""
+            print(f"{row['name']:<24} {row['duration']:>6.1f}s {median_str:>7} {ratio_str:>6} "
+                  f"{row['files'] if row['files'] is not None else '-':>6} "
+                  f"{row['findings'] if row['findings'] is not None else '-':>8}{flag}")
+
+        regressed = [r for r in rows if r["regressed"]]
+        sys.exit(1 if regressed else 0)
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
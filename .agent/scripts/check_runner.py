@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Check Runner - Antigravity Kit
+==============================
+Shared execution engine for checklist.py and verify_all.py.
+
+Checks form a small DAG: explicit ordering edges (e.g. E2E after Lighthouse)
+plus, in fail-fast mode, blocking edges from the required P0/P1 gates to every
+later check, gates included (P0 finishes before P1 starts). Only a failed gate
+stops the run; other failures, required or not, never cancel anything.
+Independent checks run concurrently. Scripts that expose the
+plugin entry point run(project_path, url) -> Result (.shared/scanner/check_plugin.py)
+are imported once and called in-process on a single lane, so they skip the
+interpreter start-up and share one source-cache walk; tool wrappers and
+scripts without run() are spawned as subprocesses alongside them.
+
+Usage:
+    from check_runner import CheckGraph, run_graph
+    graph = CheckGraph(fail_fast=True)
+    graph.add("Security Scan", script, required=True, priority=0)
+    results = run_graph(graph, project_path, jobs=4, on_start=..., on_finish=...)
+"""
+
+import re
+import sys
+import json
+import fnmatch
+import hashlib
+import threading
+import subprocess
+import importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import datetime
+
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[1] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache  # noqa: E402
+
+# Required checks at or below this priority (P0 security, P1 lint) gate the rest
+GATE_PRIORITY = 1
+DEFAULT_JOBS = 4
+
+# Tool wrappers whose time is spent in npm/npx/browsers: they keep their own
+# process so the runner's timeout can kill them. Everything else is called
+# through its run() plugin entry point when it has one.
+SUBPROCESS_SCRIPTS = {
+    "lint_runner.py", "test_runner.py", "lighthouse_audit.py", "playwright_runner.py",
+}
+
+# Scripts that accept --files-from (change_set.py) to scan only changed files.
+# schema_validator.py is project-wide on purpose: a migration's indexes and
+# policies only make sense replayed against every other schema file.
+SCOPED_SCRIPTS = {
+    "security_scan.py", "lint_runner.py", "type_coverage.py", "ux_audit.py",
+    "accessibility_checker.py", "seo_checker.py", "geo_checker.py", "mobile_audit.py",
+    "i18n_checker.py", "react_performance_checker.py", "api_validator.py",
+}
+CHANGED_FILES_LIST = Path(".agent") / ".cache" / "changed_files.txt"
+
+# Scripts that take the target URL as an extra argument
+URL_SCRIPTS = ("lighthouse", "playwright")
+
+# Declared inputs per check script: project-relative globs ('*' crosses '/',
+# a leading '**/' also matches at the root). A check whose inputs are unchanged
+# since its last run reuses that result. Scripts not listed here (Lighthouse,
+# Playwright, anything talking to a live URL) always run.
+_JS = ("**/*.js", "**/*.jsx", "**/*.ts", "**/*.tsx", "**/*.mjs", "**/*.cjs")
+_NODE_CONFIG = ("package.json", "package-lock.json", "tsconfig*.json", "jsconfig.json")
+CHECK_INPUTS = {
+    "security_scan.py": _JS + ("**/*.py", "**/*.go", "**/*.java", "**/*.rb", "**/*.php",
+                               "**/*.json", "**/*.yaml", "**/*.yml", "**/*.toml", "**/.env*",
+                               "requirements.txt", "**/next.config.*", "**/middleware.ts",
+                               "**/nginx.conf", ".gitignore"),
+    "lint_runner.py": _JS + _NODE_CONFIG + ("**/*.py", "**/.eslintrc*", "**/eslint.config.*",
+                                            "pyproject.toml", "requirements.txt", "setup.cfg",
+                                            ".flake8", "ruff.toml", "mypy.ini"),
+    "type_coverage.py": ("**/*.ts", "**/*.tsx", "**/*.py"),
+    "schema_validator.py": ("**/*.prisma", "**/drizzle/*.ts", "**/schema/*.ts", "**/*.sql"),
+    "test_runner.py": _JS + _NODE_CONFIG + ("**/*.py", "**/vitest.config.*", "**/jest.config.*",
+                                            "**/vite.config.*", "pyproject.toml",
+                                            "requirements.txt", "pytest.ini", "setup.cfg"),
+    "ux_audit.py": ("**/*.tsx", "**/*.jsx", "**/*.html", "**/*.vue", "**/*.svelte", "**/*.css"),
+    "accessibility_checker.py": ("**/*.html", "**/*.jsx", "**/*.tsx"),
+    "seo_checker.py": ("**/*.html", "**/*.htm", "**/*.jsx", "**/*.tsx"),
+    "geo_checker.py": ("**/*.html", "**/*.htm", "**/*.jsx", "**/*.tsx"),
+    "mobile_audit.py": ("**/*.tsx", "**/*.ts", "**/*.jsx", "**/*.js", "**/*.dart",
+                        "**/package.json", "**/pubspec.yaml"),
+    "i18n_checker.py": _JS + ("**/*.vue", "**/*.py", "**/*.json", "**/*.po"),
+}
+
+RESULT_CACHE_FILE = Path(".agent") / ".cache" / "check_results.json"
+
+# Characters of stdout/stderr kept per check for the summary, history and
+# result cache; the full stream goes to the terminal (--stream) or a log file
+OUTPUT_TAIL_CHARS = 64 * 1024
+
+
+# ============================================================================
+#  CHECK GRAPH
+# ============================================================================
+
+class CheckNode:
+    """One check: a script plus its place in the DAG."""
+
+    __slots__ = ('name', 'script_path', 'required', 'priority', 'category', 'after', 'exclusive')
+
+    def __init__(self, name: str, script_path: Path, required: bool, priority: int,
+                 category: Optional[str], after: Tuple[str, ...], exclusive: bool):
+        self.name = name
+        self.script_path = script_path
+        self.required = required
+        self.priority = priority
+        self.category = category
+        self.after = after
+        self.exclusive = exclusive
+
+    @property
+    def is_gate(self) -> bool:
+        return self.required and self.priority <= GATE_PRIORITY
+
+
+class CheckGraph:
+    """
+    Checks in declaration (priority) order with their dependency edges.
+    `after` names checks that must finish first; `exclusive` checks run alone
+    (e.g. Lighthouse, whose timings are skewed by concurrent load).
+    """
+
+    def __init__(self, fail_fast: bool = True):
+        self.fail_fast = fail_fast
+        self.nodes: Dict[str, CheckNode] = {}
+
+    def add(self, name: str, script_path: Path, required: bool = False, priority: int = 0,
+            category: Optional[str] = None, after: Tuple[str, ...] = (),
+            exclusive: bool = False) -> CheckNode:
+        node = CheckNode(name, Path(script_path), required, priority, category,
+                         tuple(after), exclusive)
+        self.nodes[name] = node
+        return node
+
+    def dependencies(self, node: CheckNode) -> List[str]:
+        """
+        Checks `node` waits for: its explicit edges plus, when failing fast,
+        the gates of a lower priority (so the gates also run in priority order).
+        """
+        deps = [d for d in node.after if d in self.nodes]
+        if self.fail_fast:
+            deps += [g.name for g in self.nodes.values()
+                     if g.is_gate and g.priority < node.priority and g.name not in deps]
+        return deps
+
+    def blocking(self, node: CheckNode) -> List[str]:
+        """
+        Dependencies whose failure cancels `node`: the gates, when failing fast.
+        Explicit edges only order checks (E2E must not overlap Lighthouse).
+        """
+        if not self.fail_fast:
+            return []
+        return [d for d in self.dependencies(node) if self.nodes[d].is_gate]
+
+
+# ============================================================================
+#  RUNNING A SINGLE CHECK
+# ============================================================================
+
+class OutputTail:
+    """
+    Ring buffer over a line stream: keeps roughly the last `limit` characters,
+    so memory stays flat however much a tool prints.
+    """
+
+    def __init__(self, limit: int = OUTPUT_TAIL_CHARS):
+        self.limit = limit
+        self.lines: deque = deque()
+        self.size = 0
+        self.dropped = 0
+
+    def append(self, line: str) -> None:
+        if len(line) > self.limit:
+            line = line[-self.limit:]
+        self.lines.append(line)
+        self.size += len(line)
+        while self.size > self.limit:
+            self.size -= len(self.lines.popleft())
+            self.dropped += 1
+
+    def getvalue(self) -> str:
+        text = ''.join(self.lines)
+        if self.dropped:
+            text = f"... [{self.dropped} earlier lines dropped]\n" + text
+        return text
+
+
+def last_lines(result: dict, count: int = 5) -> str:
+    """The last non-blank lines of a result's stderr (or stdout), for summaries."""
+    text = result.get("error") or result.get("output") or ""
+    lines = [line for line in text.splitlines() if line.strip()]
+    return "\n".join(lines[-count:])
+
+
+def _check_slug(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _pump(stream, tail: OutputTail, sinks: List[Callable[[str], None]]) -> None:
+    """Read a pipe line by line into the tail and every sink until EOF."""
+    for line in stream:
+        tail.append(line)
+        for sink in sinks:
+            sink(line)
+    stream.close()
+
+
+_in_process_lane = threading.Lock()
+_plugins: Dict[Path, Optional[Callable]] = {}
+_plugins_lock = threading.Lock()
+_PLUGIN_DEF = re.compile(r'^def run\(', re.MULTILINE)
+
+
+def load_plugin(script_path: Path) -> Optional[Callable]:
+    """
+    The script's run() entry point, importing it once per process. None when
+    the script has no top-level run() or fails to import; the caller then
+    falls back to a subprocess. Scripts without run() are never imported, so
+    one lacking a __main__ guard cannot execute inside the runner.
+    """
+    with _plugins_lock:
+        if script_path in _plugins:
+            return _plugins[script_path]
+        plugin = None
+        try:
+            if not _PLUGIN_DEF.search(script_path.read_text(encoding='utf-8', errors='replace')):
+                raise LookupError("no run() entry point")
+            spec = importlib.util.spec_from_file_location(f"check_{script_path.stem}", script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            plugin = getattr(module, "run", None)
+        except Exception:
+            plugin = None
+        _plugins[script_path] = plugin if callable(plugin) else None
+        return _plugins[script_path]
+
+
+def run_check(node: CheckNode, project_path: str, url: Optional[str] = None,
+              isolated: bool = False, timeout: int = 600,
+              on_output: Optional[Callable[[CheckNode, str], None]] = None,
+              log_dir: Optional[Path] = None, files_from: Optional[Path] = None) -> dict:
+    """
+    Run one check and return its result dict (no printing). Output is read
+    as it is produced: each line goes to `on_output` and, with `log_dir`, to
+    <log_dir>/<check>.log, while only the last OUTPUT_TAIL_CHARS of each
+    stream are kept in the result. `files_from` (a list of changed files) is
+    passed to scripts that can limit themselves to it.
+    """
+    script_path = node.script_path
+    result = {"name": node.name, "category": node.category, "passed": False,
+              "output": "", "error": "", "skipped": False, "duration": 0}
+
+    if not (script_path.exists() and script_path.is_file()):
+        result.update(passed=True, skipped=True, reason="Script not found")
+        return result
+
+    cmd = ["python", str(script_path), project_path]
+    if url and any(key in script_path.name.lower() for key in URL_SCRIPTS):
+        cmd.append(url)
+    if files_from is not None and script_path.name in SCOPED_SCRIPTS:
+        cmd += ["--files-from", str(files_from)]
+
+    log = None
+    if log_dir is not None:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        result["log"] = str(log_dir / f"{_check_slug(node.name)}.log")
+        log = open(result["log"], "w", encoding="utf-8", errors="replace")
+    log_lock = threading.Lock()
+
+    def sinks(prefix: str) -> List[Callable[[str], None]]:
+        out = []
+        if on_output:
+            out.append(lambda line: on_output(node, line))
+        if log:
+            def write(line: str) -> None:
+                with log_lock:
+                    log.write(prefix + line)
+            out.append(write)
+        return out
+
+    try:
+        plugin = None
+        if not isolated and script_path.name not in SUBPROCESS_SCRIPTS:
+            plugin = load_plugin(script_path)
+        if plugin is not None:
+            _run_plugin(plugin, result, project_path, url, sinks)
+        else:
+            _run_subprocess(cmd, result, timeout, sinks)
+    finally:
+        if log:
+            log.close()
+    return result
+
+
+def _run_plugin(plugin: Callable, result: dict, project_path: str, url: Optional[str],
+                sinks: Callable[[str], List[Callable[[str], None]]]) -> None:
+    # Plugins share the source cache and module state: one at a time.
+    # The duration excludes the wait for the lane.
+    try:
+        with _in_process_lane:
+            outcome = plugin(project_path, url)
+    except Exception as e:
+        result["error"] = f"run() failed: {e}"
+        return
+
+    result.update(passed=outcome.passed, duration=outcome.duration)
+    for key, text, prefix in (("output", outcome.output, ""), ("error", outcome.error, "[stderr] ")):
+        tail = OutputTail()
+        targets = sinks(prefix)
+        for line in text.splitlines(keepends=True):
+            tail.append(line)
+            for sink in targets:
+                sink(line)
+        result[key] = tail.getvalue()
+
+
+def _run_subprocess(cmd: List[str], result: dict, timeout: int,
+                    sinks: Callable[[str], List[Callable[[str], None]]]) -> None:
+    start_time = datetime.now()
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, encoding="utf-8", errors="replace", bufsize=1)
+    except OSError as e:
+        result["error"] = str(e)
+        return
+
+    stdout, stderr = OutputTail(), OutputTail()
+    readers = [threading.Thread(target=_pump, args=(proc.stdout, stdout, sinks("")), daemon=True),
+               threading.Thread(target=_pump, args=(proc.stderr, stderr, sinks("[stderr] ")), daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+        result["passed"] = returncode == 0
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        result["timed_out"] = True
+    for reader in readers:
+        # After a kill, grandchildren (npx, browsers) may still hold the pipes
+        reader.join(5 if result.get("timed_out") else None)
+
+    result["output"] = stdout.getvalue()
+    result["error"] = "Timeout" if result.get("timed_out") else stderr.getvalue()
+    result["duration"] = (datetime.now() - start_time).total_seconds()
+
+
+# ============================================================================
+#  RESULT CACHE
+# ============================================================================
+
+def _input_matcher(patterns) -> Callable[[str], Optional[re.Match]]:
+    """One compiled regex for a check's input globs."""
+    expanded = []
+    for pattern in patterns:
+        expanded.append(pattern)
+        if pattern.startswith('**/'):
+            expanded.append(pattern[3:])
+    return re.compile('|'.join(fnmatch.translate(p) for p in expanded)).match
+
+
+class ResultCache:
+    """
+    Whole-check results keyed by an input fingerprint: a hash of (path, size,
+    mtime) for every file matching the check's CHECK_INPUTS globs, plus the
+    check script and the shared scanner library. Files come from the shared
+    source cache walk, so .gitignore'd paths (including .agent/.cache) never
+    invalidate anything.
+
+    Only passing results are kept: a failure can come from outside the
+    fingerprinted inputs (npx/npm hitting the network, a missing tool), so a
+    failing check always runs again.
+    """
+
+    def __init__(self, project_path, enabled: bool = True):
+        # Disabled: never answer from the cache, but still record fresh results
+        self.project_path = Path(project_path)
+        self.path = self.project_path / RESULT_CACHE_FILE
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        try:
+            self.entries: Dict[str, dict] = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def fingerprint(self, node: CheckNode, url: Optional[str],
+                    scope: Optional[List[Path]] = None) -> Optional[str]:
+        """Input fingerprint for a check, or None if its results are never reused."""
+        patterns = CHECK_INPUTS.get(node.script_path.name)
+        if patterns is None:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(f"{node.script_path.name}\0{url or ''}\n".encode())
+        if scope is not None and node.script_path.name in SCOPED_SCRIPTS:
+            digest.update(("scope\0" + "\0".join(sorted(map(str, scope))) + "\n").encode())
+        for code_path in [node.script_path] + sorted(SHARED_LIB.glob('*.py')):
+            try:
+                st = code_path.stat()
+            except OSError:
+                continue
+            digest.update(f"{code_path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+
+        matches = _input_matcher(patterns)
+        for entry in get_cache(self.project_path).entries():
+            if matches(entry.rel):
+                digest.update(f"{entry.rel}\0{entry.size}\0{entry.mtime}\n".encode())
+        return digest.hexdigest()
+
+    def lookup(self, node: CheckNode, fingerprint: Optional[str]) -> Optional[dict]:
+        if not self.enabled or fingerprint is None:
+            return None
+        entry = self.entries.get(node.name)
+        if not entry or entry.get("fingerprint") != fingerprint or not entry["result"].get("passed"):
+            return None
+        return dict(entry["result"], cached=True, category=node.category)
+
+    def store(self, node: CheckNode, fingerprint: Optional[str], result: dict) -> None:
+        if fingerprint is None or result.get("skipped"):
+            return
+        with self._lock:
+            if not result.get("passed") or result.get("timed_out"):
+                self.entries.pop(node.name, None)
+                return
+            self.entries[node.name] = {
+                "fingerprint": fingerprint,
+                "stored": datetime.now().isoformat(timespec='seconds'),
+                "result": {key: result.get(key) for key in
+                           ("name", "passed", "output", "error", "skipped", "duration")},
+            }
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.entries), encoding='utf-8')
+        except OSError:
+            pass
+
+
+# ============================================================================
+#  SCHEDULER
+# ============================================================================
+
+def run_graph(graph: CheckGraph, project_path: str, url: Optional[str] = None,
+              jobs: int = DEFAULT_JOBS, isolated: bool = False, timeout: int = 600,
+              on_start: Optional[Callable[[CheckNode], None]] = None,
+              on_finish: Optional[Callable[[CheckNode, dict], None]] = None,
+              result_cache: Optional[ResultCache] = None,
+              on_output: Optional[Callable[[CheckNode, str], None]] = None,
+              log_dir: Optional[Path] = None,
+              changed: Optional[List[Path]] = None) -> List[dict]:
+    """
+    Run every check in the graph with up to `jobs` at once.
+    With a result cache, a check whose input fingerprint matches its last
+    passing run is answered from the cache (result["cached"] is set) instead of running.
+    Callbacks fire on the calling thread as checks start and finish, so status
+    streams in completion order. When failing fast, a failed required check
+    stops new checks from starting; they are reported as skipped. Results come back in
+    declaration order. `on_output` gets every output line as it is read (from
+    worker threads); `log_dir` keeps each check's full output on disk.
+    With `changed` (absolute file paths), scanners only look at those files:
+    in-process through the source-cache scope, in subprocesses via --files-from.
+    """
+    jobs = max(1, jobs)
+    files_from = None
+    if changed is not None:
+        files_from = Path(project_path).resolve() / CHANGED_FILES_LIST
+        files_from.parent.mkdir(parents=True, exist_ok=True)
+        files_from.write_text("".join(f"{p}\n" for p in changed), encoding="utf-8")
+        get_cache(project_path).set_scope(changed)
+
+    results: Dict[str, dict] = {}
+    pending = list(graph.nodes.values())
+    running = {}
+    stopped_by: Optional[str] = None
+
+    def finish(node: CheckNode, result: dict) -> None:
+        results[node.name] = result
+        if on_finish:
+            on_finish(node, result)
+
+    def skip(node: CheckNode, reason: str) -> None:
+        finish(node, {"name": node.name, "category": node.category, "passed": True,
+                      "skipped": True, "reason": reason, "duration": 0})
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            # Start everything whose dependencies are done, in priority order
+            for node in list(pending):
+                if stopped_by:
+                    break
+                deps = graph.dependencies(node)
+                if any(d not in results for d in deps):
+                    continue
+                failed = [d for d in graph.blocking(node)
+                          if not results[d]["passed"] and not results[d].get("skipped")]
+                if failed:
+                    pending.remove(node)
+                    skip(node, f"Blocked by failed {', '.join(failed)}")
+                    continue
+                if not node.script_path.is_file():
+                    pending.remove(node)
+                    skip(node, "Script not found")
+                    continue
+                if any(n.exclusive for n, _ in running.values()):
+                    break
+                fingerprint = result_cache.fingerprint(node, url, changed) if result_cache else None
+                cached = result_cache.lookup(node, fingerprint) if result_cache else None
+                if cached is None and node.exclusive and running:
+                    continue  # Runs alone once the pool drains
+                if cached is None and len(running) >= jobs:
+                    break
+                pending.remove(node)
+                if cached is not None:
+                    finish(node, cached)
+                else:
+                    if on_start:
+                        on_start(node)
+                    future = pool.submit(run_check, node, project_path, url, isolated, timeout,
+                                         on_output, log_dir, files_from)
+                    running[future] = (node, fingerprint)
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node, fingerprint = running.pop(future)
+                result = future.result()
+                if result_cache:
+                    result_cache.store(node, fingerprint, result)
+                finish(node, result)
+                if (graph.fail_fast and node.is_gate
+                        and not result["passed"] and not result.get("skipped")):
+                    stopped_by = stopped_by or node.name
+
+    for node in pending:
+        skip(node, f"Not run: {stopped_by} failed" if stopped_by else "Unresolvable dependencies")
+
+    if result_cache:
+        result_cache.save()
+    if changed is not None:
+        get_cache(project_path).set_scope(None)
+
+    return [results[name] for name in graph.nodes if name in results]
@@ -9,6 +9,14 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --jobs 1           # Run checks one at a time
+    python scripts/checklist.py . --no-cache         # Re-run checks with unchanged inputs
+    python scripts/checklist.py . --stream           # Show check output as it is produced
+    python scripts/checklist.py . --changed-since origin/main   # Scan changed files only
+
+Inside a git hook (GIT_INDEX_FILE is set) the scanners default to the staged
+files, so a pre-commit run scales with the diff rather than the repo.
+Whole-project checks (tsc, locale completeness, dependency audit) still run in full.
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -18,13 +26,26 @@ Priority Order:
     P4: UX Audit (psychology laws, accessibility)
     P5: SEO Check (meta tags, structure)
     P6: Performance (lighthouse - requires URL)
+
+Independent checks run concurrently once the P0/P1 gates have passed;
+status is printed as each check finishes. A passing check whose input
+files are unchanged since that run reuses its result
+(.agent/.cache/check_results.json); failures always run again.
 """
 
+import os
 import sys
-import subprocess
 import argparse
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List
+
+from check_runner import CheckGraph, CheckNode, DEFAULT_JOBS, ResultCache, last_lines, run_graph
+
+# Shared scanner library (.agent/.shared/scanner): changed-files scope
+SHARED_LIB = Path(__file__).resolve().parents[1] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from change_set import ChangeSetError, add_scope_arguments, resolve_scope  # noqa: E402
 
 # ANSI colors for terminal output
 class Colors:
@@ -69,61 +90,54 @@ PERFORMANCE_CHECKS = [
     ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
 ]
 
-def check_script_exists(script_path: Path) -> bool:
-    """Check if script file exists"""
-    return script_path.exists() and script_path.is_file()
+# Ordering edges beyond the P0/P1 gates: E2E traffic must not overlap Lighthouse
+CHECK_DEPENDENCIES = {
+    "Playwright E2E": ("Lighthouse Audit",),
+}
+
+# Checks that run alone; concurrent load skews Lighthouse timings
+EXCLUSIVE_CHECKS = {"Lighthouse Audit"}
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def build_graph(project_path: Path, include_performance: bool) -> CheckGraph:
     """
-    Run a validation script and capture results
-    
-    Returns:
-        dict with keys: name, passed, output, skipped
+    Core checks take their priority from list order; P0/P1 required checks
+    gate everything after them, so a security or lint failure stops the run.
     """
-    if not check_script_exists(script_path):
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "output": "", "skipped": True}
-    
-    print_step(f"Running: {name}")
-    
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
-    # Run script
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False
-        }
-    
-    except subprocess.TimeoutExpired:
+    graph = CheckGraph(fail_fast=True)
+    checks = [(check, "Core") for check in CORE_CHECKS]
+    if include_performance:
+        checks += [(check, "Performance") for check in PERFORMANCE_CHECKS]
+    
+    for priority, ((name, script_path, required), category) in enumerate(checks):
+        graph.add(name, project_path / script_path, required=required, priority=priority,
+                  category=category, after=CHECK_DEPENDENCIES.get(name, ()),
+                  exclusive=name in EXCLUSIVE_CHECKS)
+    return graph
+
+def report_start(node: CheckNode):
+    print_step(f"Running: {node.name}")
+
+def report_output(node: CheckNode, line: str):
+    """--stream: echo a check's output live, prefixed with its name"""
+    print(f"{Colors.CYAN}[{node.name}]{Colors.ENDC} {line.rstrip()}", flush=True)
+
+def report_finish(node: CheckNode, result: dict):
+    """Stream a check's status as soon as it finishes"""
+    name = node.name
+    took = "cached, inputs unchanged" if result.get("cached") else f"{result['duration']:.1f}s"
+    if result.get("skipped"):
+        print_warning(f"{name}: {result.get('reason', 'Skipped')}, skipping")
+    elif result.get("timed_out"):
         print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
-    
-    except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({took})")
+    else:
+        print_error(f"{name}: FAILED ({took})")
+        tail = last_lines(result)
+        if tail:
+            print("  " + tail.replace("\n", "\n  "))
+        if result.get("log"):
+            print(f"  Full output: {result['log']}")
 
 def print_summary(results: List[dict]):
     """Print final summary report"""
@@ -167,11 +181,24 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --staged             # Pre-commit: staged files only
+  git diff --name-only main | python scripts/checklist.py . --files-from -
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"Checks to run concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--isolated", action="store_true",
+                        help="Run every check in its own process (no shared source cache)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Print each check's output live as it runs")
+    parser.add_argument("--log-dir", type=Path,
+                        help="Write each check's full output to DIR/<check>.log")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every check even if its inputs are unchanged (results are still stored)")
+    add_scope_arguments(parser)
     
     args = parser.parse_args()
     
@@ -185,29 +212,37 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
-    results = []
-    
-    # Run core checks
-    print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
-        
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+    # Running from a git hook: check what is being committed
+    if os.environ.get("GIT_INDEX_FILE") and not (args.changed_since or args.files_from):
+        args.staged = True
+    try:
+        changed = resolve_scope(project_path, args)
+    except ChangeSetError as e:
+        print_error(f"Cannot resolve changed files: {e}")
+        sys.exit(1)
+    if changed is not None:
+        source = (f"since {args.changed_since}" if args.changed_since
+                  else "staged" if args.staged else f"from {args.files_from}")
+        print(f"Scope: {len(changed)} changed file(s) {source}")
+    
+    graph = build_graph(project_path, bool(args.url) and not args.skip_performance)
+    
+    print_header(f"📋 CHECKS ({args.jobs} parallel)")
+    results = run_graph(graph, str(project_path), args.url, jobs=args.jobs,
+                        isolated=args.isolated, timeout=300,
+                        on_start=report_start, on_finish=report_finish,
+                        result_cache=ResultCache(project_path, enabled=not args.no_cache),
+                        on_output=report_output if args.stream else None,
+                        log_dir=args.log_dir.resolve() if args.log_dir else None,
+                        changed=changed)
+    
+    # If a P0/P1 gate failed, the remaining checks were not started
+    for r in results:
+        if graph.nodes[r["name"]].is_gate and not r["passed"] and not r.get("skipped"):
+            print_error(f"CRITICAL: {r['name']} failed. Stopping checklist.")
             print_summary(results)
             sys.exit(1)
     
-    # Run performance checks if URL provided
-    if args.url and not args.skip_performance:
-        print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
-    
     # Print summary
     all_passed = print_summary(results)
     
@@ -8,6 +8,14 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --jobs 1   # one check at a time
+    python scripts/verify_all.py . --url <URL> --no-cache # re-run unchanged checks
+    python scripts/verify_all.py . --url <URL> --log-dir .agent/.cache/logs  # full output per check
+
+Independent checks run concurrently and report as they finish. With
+--stop-on-fail, the P0/P1 required checks gate everything after them.
+Checks whose input files are unchanged since their last passing run reuse
+that result; failures always run again. Lighthouse and Playwright always run against the live URL.
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -23,12 +31,21 @@ Includes ALL checks:
 """
 
 import sys
-import subprocess
+import sqlite3
 import argparse
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional
 from datetime import datetime
 
+from check_runner import CheckGraph, CheckNode, DEFAULT_JOBS, ResultCache, last_lines, run_graph
+from check_history import CheckHistory, DEFAULT_THRESHOLD, compare_run, describe_regression
+
+# Shared source cache (.agent/.shared/scanner), used by the in-process scanners
+SHARED_LIB = Path(__file__).resolve().parents[1] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache  # noqa: E402
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -147,57 +164,88 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
-    if not script_path.exists():
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "skipped": True, "duration": 0}
-    
-    print_step(f"Running: {name}")
-    start_time = datetime.now()
-    
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
+# Ordering edges beyond the P0/P1 gates: E2E traffic must not overlap Lighthouse
+CHECK_DEPENDENCIES = {
+    "Playwright E2E": ("Lighthouse Audit",),
+}
+
+# Checks that run alone; concurrent load skews Lighthouse timings
+EXCLUSIVE_CHECKS = {"Lighthouse Audit"}
+
+def build_graph(project_path: Path, url: Optional[str], no_e2e: bool, fail_fast: bool) -> CheckGraph:
+    """
+    One node per check; the category's index in VERIFICATION_SUITE is its
+    priority. With fail_fast (--stop-on-fail), required P0/P1 checks gate
+    everything after them.
+    """
+    graph = CheckGraph(fail_fast=fail_fast)
     
-    # Run
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+    for priority, suite in enumerate(VERIFICATION_SUITE):
+        category = suite["category"]
         
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        # Skip if requires URL and not provided
+        if suite.get("requires_url", False) and not url:
+            continue
         
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+        # Skip E2E if flag set
+        if no_e2e and category == "E2E Testing":
+            continue
         
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False,
-            "duration": duration
-        }
+        for name, script_path, required in suite["checks"]:
+            graph.add(name, project_path / script_path, required=required, priority=priority,
+                      category=category, after=CHECK_DEPENDENCIES.get(name, ()),
+                      exclusive=name in EXCLUSIVE_CHECKS)
     
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
+    return graph
+
+def report_start(node: CheckNode):
+    print_step(f"Running: [{node.category}] {node.name}")
+
+def report_output(node: CheckNode, line: str):
+    """--stream: echo a check's output live, prefixed with its name"""
+    print(f"{Colors.CYAN}[{node.name}]{Colors.ENDC} {line.rstrip()}", flush=True)
+
+def report_finish(node: CheckNode, result: dict):
+    """Stream a check's status as soon as it finishes"""
+    name = f"[{node.category}] {node.name}"
+    duration = result.get("duration", 0)
+    took = "cached, inputs unchanged" if result.get("cached") else f"{duration:.1f}s"
+    if result.get("skipped"):
+        print_warning(f"{name}: {result.get('reason', 'Skipped')}, skipping")
+    elif result.get("timed_out"):
         print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
-    
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({took})")
+    else:
+        print_error(f"{name}: FAILED ({took})")
+        tail = last_lines(result)
+        if tail:
+            print("  " + tail.replace("\n", "\n  "))
+        if result.get("log"):
+            print(f"  Full output: {result['log']}")
+
+def record_history(project_path: Path, results: List[dict], duration: float, mode: str,
+                   threshold: float) -> List[dict]:
+    """Persist this run's per-check timings; return checks slower than threshold x median"""
+    try:
+        history = CheckHistory(project_path)
+        try:
+            run_id = history.record_run("verify_all", mode, duration, results)
+            rows = compare_run(history, run_id, mode, "verify_all", threshold)
+        finally:
+            history.close()
+    except (OSError, sqlite3.Error) as e:
+        print_warning(f"Check history not recorded: {e}")
+        return []
+    return [row for row in rows if row["regressed"]]
+
+def print_regressions(regressed: List[dict]):
+    if not regressed:
+        return
+    print(f"{Colors.BOLD}{Colors.YELLOW}⏱️  TIMING REGRESSIONS (vs rolling median):{Colors.ENDC}")
+    for row in regressed:
+        print_warning(describe_regression(row))
+    print()
 
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
@@ -235,7 +283,12 @@ def print_final_report(results: List[dict], start_time: datetime):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        if r.get("skipped"):
+            duration_str = ""
+        elif r.get("cached"):
+            duration_str = "(cached)"
+        else:
+            duration_str = f"({r.get('duration', 0):.1f}s)"
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
@@ -246,9 +299,9 @@ def print_final_report(results: List[dict], start_time: datetime):
         for r in results:
             if not r["passed"] and not r.get("skipped"):
                 print(f"\n{Colors.RED}✗ {r['name']}{Colors.ENDC}")
-                if r.get("error"):
-                    error_preview = r["error"][:200]
-                    print(f"  Error: {error_preview}")
+                tail = last_lines(r, 3)
+                if tail:
+                    print("  " + tail.replace("\n", "\n  "))
         print()
     
     # Final verdict
@@ -274,6 +327,20 @@ Examples:
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"Checks to run concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--isolated", action="store_true",
+                        help="Run every check in its own process (no shared source cache)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Print each check's output live as it runs")
+    parser.add_argument("--log-dir", type=Path,
+                        help="Write each check's full output to DIR/<check>.log")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every check even if its inputs are unchanged (results are still stored)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="Do not record timings in .agent/.cache/check_history.sqlite")
+    parser.add_argument("--regression-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Flag checks slower than this x their rolling median (default: {DEFAULT_THRESHOLD})")
     
     args = parser.parse_args()
     
@@ -289,37 +356,39 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
+    graph = build_graph(project_path, args.url, args.no_e2e, fail_fast=args.stop_on_fail)
     
-    # Run all verification categories
-    for suite in VERIFICATION_SUITE:
-        category = suite["category"]
-        requires_url = suite.get("requires_url", False)
-        
-        # Skip if requires URL and not provided
-        if requires_url and not args.url:
-            continue
-        
-        # Skip E2E if flag set
-        if args.no_e2e and category == "E2E Testing":
-            continue
-        
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
+    print_header(f"📋 RUNNING {len(graph.nodes)} CHECKS ({args.jobs} parallel)")
+    results = run_graph(graph, str(project_path), args.url, jobs=args.jobs,
+                        isolated=args.isolated, timeout=600,  # 10 minute timeout for slow checks
+                        on_start=report_start, on_finish=report_finish,
+                        result_cache=ResultCache(project_path, enabled=not args.no_cache),
+                        on_output=report_output if args.stream else None,
+                        log_dir=args.log_dir.resolve() if args.log_dir else None)
+    
+    regressed = []
+    if not args.no_history:
+        mode = f"{'isolated' if args.isolated else 'in-process'}/j{args.jobs}"
+        regressed = record_history(project_path, results, (datetime.now() - start_time).total_seconds(),
+                                   mode, args.regression_threshold)
+    
+    # Stop on critical failure if flag set (later checks were not started)
+    if args.stop_on_fail:
+        for r in results:
+            if graph.nodes[r["name"]].is_gate and not r["passed"] and not r.get("skipped"):
+                print_error(f"CRITICAL: {r['name']} failed. Stopping verification.")
                 print_final_report(results, start_time)
+                print_regressions(regressed)
                 sys.exit(1)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
+    print_regressions(regressed)
+    
+    if not args.isolated:
+        stats = get_cache(project_path).stats
+        print(f"Source cache: {stats['walks']} walk(s), {stats['reads']} file reads, "
+              f"{stats['hits']} reads served from cache")
     
     sys.exit(0 if all_passed else 1)
 
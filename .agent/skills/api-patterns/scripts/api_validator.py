@@ -2,12 +2,26 @@
 """
 API Validator - Checks API endpoints for best practices.
 Validates OpenAPI specs, response formats, and common issues.
+
+Also builds a route inventory - Express app/router routes (mounted routers
+included) and serverless handlers under api/ - and reports rate-limit and
+validation coverage per route.
 """
 import sys
 import json
 import re
+import argparse
+from collections import namedtuple
 from pathlib import Path
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache, read_source  # noqa: E402
+from js_lexer import tokenize, match_brackets  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -27,12 +41,10 @@ def find_api_files(project_path: Path) -> list:
         "**/openapi.json", "**/openapi.yaml"
     ]
     
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    # Exclude node_modules, etc.
-    return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
+    # One pruned walk (node_modules, .git, dist, build, __pycache__, .gitignore
+    # are never entered), all patterns matched in the same pass
+    root = project_path.resolve()
+    return [project_path / f.relative_to(root) for f in get_cache(root).glob(patterns, under=root)]
 
 def check_openapi_spec(file_path: Path) -> dict:
     """Check OpenAPI/Swagger specification."""
@@ -40,7 +52,9 @@ def check_openapi_spec(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_source(file_path)
+        if content is None:
+            raise OSError("cannot read file")
         
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -91,85 +105,352 @@ def check_openapi_spec(file_path: Path) -> dict:
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'openapi'}
 
+
+# ============================================================================
+#  FEATURE CLASSES
+# ============================================================================
+#
+# Each class is one precompiled alternation; feature_bits() runs them over a
+# file (or one route handler's span) and returns the classes found as a
+# bitset. Python's re has no DFA, so folding all classes into one pattern
+# (lookahead groups) measured ~3x slower than per-class searches, which stop
+# at the first hit and keep re's literal-prefix scan - the saving is in
+# computing the bits once per file/route and reusing them.
+
+FEATURE_CLASSES = [
+    # (name, case-insensitive, patterns)
+    ('error_handling', False, [r'try\s*{', r'try:', r'\.catch\(', r'except\s+', r'catch\s*\(']),
+    ('status_codes', False, [r'status\s*\(\s*\d{3}\s*\)', r'statusCode\s*[=:]\s*\d{3}', r'HttpStatus\.',
+                             r'status_code\s*=\s*\d{3}', r'\.status\(\d{3}\)', r'res\.status\(']),
+    ('validation', True, [r'validate', r'schema', r'zod', r'joi', r'yup', r'pydantic', r'@Body\(', r'@Query\(']),
+    ('auth', True, [r'auth', r'jwt', r'bearer', r'token', r'middleware', r'guard', r'@Authenticated']),
+    ('rate_limit', True, [r'rateLimit', r'throttle', r'rate.?limit']),
+    ('logging', False, [r'console\.log', r'logger\.', r'logging\.', r'log\.']),
+    # Route inventory only (looser signals, never reported per file): a handler
+    # that answers 400/422 checks its input by hand; `limiter` middleware names
+    ('rejects_input', False, [r'status\(\s*4(?:00|22)\b']),
+    ('limiter', True, [r'limiter']),
+]
+FEATURE_BITS = {name: 1 << i for i, (name, _, _) in enumerate(FEATURE_CLASSES)}
+FEATURE_PATTERNS = [(FEATURE_BITS[name], re.compile('|'.join(patterns), re.I if nocase else 0))
+                    for name, nocase, patterns in FEATURE_CLASSES]
+
+_file_features = {}
+
+
+def feature_bits(text: str, start: int = 0, end: int = None) -> int:
+    """Bitset (FEATURE_BITS) of the feature classes present in text[start:end]."""
+    end = len(text) if end is None else end
+    bits = 0
+    for bit, pattern in FEATURE_PATTERNS:
+        if pattern.search(text, start, end):
+            bits |= bit
+    return bits
+
+
+def file_features(file_path: Path):
+    """Feature bitset of a whole file (computed once per run), or None if unreadable."""
+    key = Path(file_path).resolve()
+    if key not in _file_features:
+        content = read_source(key)
+        _file_features[key] = None if content is None else feature_bits(content)
+    return _file_features[key]
+
+
 def check_api_code(file_path: Path) -> dict:
     """Check API code for common issues."""
     issues = []
     passed = []
     
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        
-        # Check for error handling
-        error_patterns = [
-            r'try\s*{', r'try:', r'\.catch\(',
-            r'except\s+', r'catch\s*\('
-        ]
-        has_error_handling = any(re.search(p, content) for p in error_patterns)
-        if has_error_handling:
-            passed.append("[OK] Error handling present")
-        else:
-            issues.append("[X] No error handling found")
-        
-        # Check for status codes
-        status_patterns = [
-            r'status\s*\(\s*\d{3}\s*\)', r'statusCode\s*[=:]\s*\d{3}',
-            r'HttpStatus\.', r'status_code\s*=\s*\d{3}',
-            r'\.status\(\d{3}\)', r'res\.status\('
-        ]
-        has_status = any(re.search(p, content) for p in status_patterns)
-        if has_status:
-            passed.append("[OK] HTTP status codes used")
-        else:
-            issues.append("[!] No explicit HTTP status codes")
-        
-        # Check for validation
-        validation_patterns = [
-            r'validate', r'schema', r'zod', r'joi', r'yup',
-            r'pydantic', r'@Body\(', r'@Query\('
-        ]
-        has_validation = any(re.search(p, content, re.I) for p in validation_patterns)
-        if has_validation:
-            passed.append("[OK] Input validation present")
-        else:
-            issues.append("[!] No input validation detected")
-        
-        # Check for auth middleware
-        auth_patterns = [
-            r'auth', r'jwt', r'bearer', r'token',
-            r'middleware', r'guard', r'@Authenticated'
-        ]
-        has_auth = any(re.search(p, content, re.I) for p in auth_patterns)
-        if has_auth:
-            passed.append("[OK] Authentication/authorization detected")
-        
-        # Check for rate limiting
-        rate_patterns = [r'rateLimit', r'throttle', r'rate.?limit']
-        has_rate = any(re.search(p, content, re.I) for p in rate_patterns)
-        if has_rate:
-            passed.append("[OK] Rate limiting present")
-        
-        # Check for logging
-        log_patterns = [r'console\.log', r'logger\.', r'logging\.', r'log\.']
-        has_logging = any(re.search(p, content) for p in log_patterns)
-        if has_logging:
-            passed.append("[OK] Logging present")
-        
-    except Exception as e:
-        issues.append(f"[X] Read error: {e}")
+    bits = file_features(file_path)
+    if bits is None:
+        issues.append("[X] Read error: cannot read file")
+        return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
+    
+    if bits & FEATURE_BITS['error_handling']:
+        passed.append("[OK] Error handling present")
+    else:
+        issues.append("[X] No error handling found")
+    
+    if bits & FEATURE_BITS['status_codes']:
+        passed.append("[OK] HTTP status codes used")
+    else:
+        issues.append("[!] No explicit HTTP status codes")
+    
+    if bits & FEATURE_BITS['validation']:
+        passed.append("[OK] Input validation present")
+    else:
+        issues.append("[!] No input validation detected")
+    
+    if bits & FEATURE_BITS['auth']:
+        passed.append("[OK] Authentication/authorization detected")
+    
+    if bits & FEATURE_BITS['rate_limit']:
+        passed.append("[OK] Rate limiting present")
+    
+    if bits & FEATURE_BITS['logging']:
+        passed.append("[OK] Logging present")
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
 
+
+# ============================================================================
+#  ROUTE INVENTORY
+# ============================================================================
+
+# features: bitset of the handler body, its route middleware and the
+# app.use() middleware in force for it; middleware: route-level middleware source
+Route = namedtuple('Route', ['method', 'path', 'file', 'line', 'middleware', 'features'])
+
+ROUTE_METHODS = {'get', 'post', 'put', 'patch', 'delete', 'all', 'options', 'head'}
+MUTATING_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE', 'ALL', 'ANY'}
+JS_EXTENSIONS = ('.js', '.mjs', '.cjs', '.ts')
+APP_DECL_RE = re.compile(r'\b(?:const|let|var)\s+(\w+)\s*=\s*(?:express\s*\(\s*\)|(?:express\s*\.\s*)?Router\s*\()')
+IMPORT_RE = re.compile(r"""\bimport\s+(\w+)\s+from\s+['"]([^'"]+)['"]"""
+                       r"""|\b(?:const|let|var)\s+(\w+)\s*=\s*require\(\s*['"]([^'"]+)['"]\s*\)""")
+EXPRESS_APP_RE = re.compile(r'\bexpress\s*\(\s*\)')
+HANDLER_SIGNATURE_RE = re.compile(r'\(\s*req\s*,\s*res\b')
+METHOD_TEST_RE = re.compile(r"""\breq\.method\s*[!=]==?\s*['"](\w+)['"]""")
+HANDLER_EXPORT_RE = re.compile(r'\bmodule\.exports\s*=|\bexport\s+default\b')
+
+
+def _call_args(tokens, open_index: int, partner: list) -> list:
+    """(first, last) token indexes of each top-level argument of the call opened at `open_index`."""
+    close = partner[open_index]
+    if close < 0:
+        return []
+    args, first, i = [], open_index + 1, open_index + 1
+    while i < close:
+        tok = tokens[i]
+        if tok.kind == 'punct' and tok.value in '([{' and partner[i] > i:
+            i = partner[i] + 1
+            continue
+        if tok.kind == 'punct' and tok.value == ',':
+            if first < i:
+                args.append((first, i - 1))
+            first = i + 1
+        i += 1
+    if first < close:
+        args.append((first, close - 1))
+    return args
+
+
+def _span(tokens, first: int, last: int):
+    return tokens[first].start, tokens[last].start + len(tokens[last].value)
+
+
+def _string_value(tok):
+    if tok.kind == 'string':
+        return tok.value[1:-1]
+    return None
+
+
+def _join_route(prefix: str, path: str) -> str:
+    if not prefix:
+        return path
+    return prefix.rstrip('/') + ('' if path == '/' else path) or '/'
+
+
+def _local_middleware_bits(text: str, tokens, partner) -> dict:
+    """Feature bits of each function defined in the file, by name (for middleware references)."""
+    bodies = {}
+    for i, tok in enumerate(tokens[:-2]):
+        if tok.kind != 'name' or tok.value not in ('const', 'let', 'var', 'function'):
+            continue
+        name = tokens[i + 1]
+        if name.kind != 'name':
+            continue
+        # first '{' of the definition, within a short signature
+        for j in range(i + 2, min(i + 40, len(tokens))):
+            if tokens[j].value == '{' and partner[j] > j:
+                start, end = _span(tokens, j, partner[j])
+                bodies[name.value] = feature_bits(text, start, end)
+                break
+            if tokens[j].value == ';':
+                break
+    return bodies
+
+
+def express_routes(project_path: Path, file_path: Path, prefix: str = '', inherited: int = 0,
+                   seen=None) -> list:
+    """
+    Routes registered on the Express apps/routers of one file, following
+    app.use(path, router) mounts into imported router files.
+    """
+    seen = set() if seen is None else seen
+    file_path = file_path.resolve()
+    if (file_path, prefix) in seen:
+        return []
+    seen.add((file_path, prefix))
+    text = read_source(file_path)
+    if text is None:
+        return []
+
+    cache = get_cache(project_path)
+    lines = cache.line_index(file_path)
+    rel = cache.relpath(file_path)
+    apps = set(APP_DECL_RE.findall(text))
+    imports = {}
+    for m in IMPORT_RE.finditer(text):
+        name, target = (m.group(1), m.group(2)) if m.group(1) else (m.group(3), m.group(4))
+        if target.startswith('.'):
+            imports[name] = (file_path.parent / target).resolve()
+    tokens = tokenize(text, jsx=False)
+    partner = match_brackets(tokens)
+    local = _local_middleware_bits(text, tokens, partner)
+
+    def middleware_bits(first, last):
+        if first == last and tokens[first].kind == 'name' and tokens[first].value in local:
+            return local[tokens[first].value] | feature_bits(tokens[first].value)
+        # Code only: configuration strings such as cors({allowedHeaders: ['Authorization']})
+        # say nothing about what the middleware enforces
+        bits, run = 0, None
+        for j in range(first, last + 2):
+            if j <= last and tokens[j].kind not in ('string', 'template'):
+                run = j if run is None else run
+            elif run is not None:
+                bits |= feature_bits(text, *_span(tokens, run, j - 1))
+                run = None
+        return bits
+
+    routes = []
+    global_bits = inherited
+    scoped = []  # (path prefix, bits) from app.use('/path', middleware)
+    for i in range(len(tokens) - 3):
+        tok = tokens[i]
+        if tok.kind != 'name' or tok.value not in apps or tokens[i + 1].value != '.':
+            continue
+        method, paren = tokens[i + 2], tokens[i + 3]
+        if paren.value != '(' or method.value not in ROUTE_METHODS | {'use'}:
+            continue
+        args = _call_args(tokens, i + 3, partner)
+        if not args:
+            continue
+        path = _string_value(tokens[args[0][0]]) if args[0][0] == args[0][1] else None
+
+        if method.value == 'use':
+            mount = path if path is not None else ''
+            bits = 0
+            for first, last in args[1:] if path is not None else args:
+                target = imports.get(tokens[first].value) if first == last else None
+                if target is not None and target.suffix in JS_EXTENSIONS:
+                    routes.extend(express_routes(project_path, target, _join_route(prefix, mount),
+                                                 global_bits | bits, seen))
+                else:
+                    bits |= middleware_bits(first, last)
+            if path is None:
+                global_bits |= bits
+            elif bits:
+                scoped.append((_join_route(prefix, path), bits))
+            continue
+
+        if path is None or len(args) < 2:
+            continue
+        full = _join_route(prefix, path)
+        middleware = [text[slice(*_span(tokens, first, last))] for first, last in args[1:-1]]
+        bits = global_bits | feature_bits(text, *_span(tokens, *args[-1]))
+        for first, last in args[1:-1]:
+            bits |= middleware_bits(first, last)
+        for scope, scope_bits in scoped:
+            if full == scope or full.startswith(scope.rstrip('/') + '/'):
+                bits |= scope_bits
+        routes.append(Route(method.value.upper(), full, rel, lines.line_of(tok.start) if lines else 0,
+                            middleware, bits))
+    return routes
+
+
+def serverless_routes(project_path: Path) -> list:
+    """Handlers under api/ (one route per file, '_'-prefixed files are helpers)."""
+    cache = get_cache(project_path)
+    api_dir = project_path / 'api'
+    routes = []
+    for file_path in cache.files(JS_EXTENSIONS, under=api_dir, scoped=False):
+        rel_api = file_path.relative_to(api_dir.resolve())
+        if any(part.startswith('_') for part in rel_api.parts):
+            continue
+        text = read_source(file_path)
+        if text is None or not HANDLER_SIGNATURE_RE.search(text):
+            continue
+        route = '/api/' + rel_api.with_suffix('').as_posix()
+        if route.endswith('/index'):
+            route = route[:-len('/index')] or '/api'
+        methods = sorted({m.upper() for m in METHOD_TEST_RE.findall(text)} - {'OPTIONS'}) or ['ANY']
+        export = HANDLER_EXPORT_RE.search(text)
+        lines = cache.line_index(file_path)
+        line = lines.line_of(export.start()) if export and lines else 1
+        bits = file_features(file_path)
+        for method in methods:
+            routes.append(Route(method, route, cache.relpath(file_path), line, [], bits))
+    return routes
+
+
+def build_route_inventory(project_path: Path) -> list:
+    """Every Express route (apps found in any JS file) plus serverless api/ handlers."""
+    project_path = project_path.resolve()
+    cache = get_cache(project_path)
+    routes, seen = [], set()
+    for file_path in cache.files(JS_EXTENSIONS, under=project_path, scoped=False):
+        text = read_source(file_path)
+        # Routers are reached through the app.use() mounts of the app that imports them
+        if text is not None and EXPRESS_APP_RE.search(text):
+            routes.extend(express_routes(project_path, file_path, seen=seen))
+    routes.extend(serverless_routes(project_path))
+    return routes
+
+
+def print_route_inventory(routes: list, limit: int = 25) -> None:
+    rate = FEATURE_BITS['rate_limit'] | FEATURE_BITS['limiter']
+    validation = FEATURE_BITS['validation'] | FEATURE_BITS['rejects_input']
+    auth = FEATURE_BITS['auth']
+    print("\n" + "=" * 60)
+    print(f"[ROUTES] {len(routes)} routes")
+    print("=" * 60)
+    for route in routes:
+        flags = ' '.join(f"{label}{'+' if route.features & bit else '-'}"
+                         for label, bit in (('RL', rate), ('VAL', validation), ('AUTH', auth)))
+        print(f"   {route.method:<7} {route.path:<48} {flags}  {route.file}:{route.line}")
+
+    if not routes:
+        return
+    total = len(routes)
+    for label, bit in (('Rate limiting', rate), ('Input validation', validation), ('Auth', auth)):
+        covered = sum(1 for route in routes if route.features & bit)
+        print(f"   {label}: {covered}/{total} routes ({covered * 100 // total}%)")
+
+    # Unprotected: neither rate limited nor validated; state-changing routes first
+    exposed = [r for r in routes if not r.features & (rate | validation)]
+    exposed.sort(key=lambda r: (r.method not in MUTATING_METHODS, r.path))
+    if exposed:
+        print(f"\n[!] {len(exposed)} routes without rate limiting or input validation:")
+        for route in exposed[:limit]:
+            print(f"   {route.method:<7} {route.path}  ({route.file}:{route.line})")
+        if len(exposed) > limit:
+            print(f"   ... and {len(exposed) - limit} more")
+
 def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+    parser = argparse.ArgumentParser(description="API endpoint best-practices check")
+    parser.add_argument("project_path", nargs="?", default=".", help="Project root")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.project_path, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+    project_path = Path(args.project_path)
     
     print("\n" + "=" * 60)
     print("  API VALIDATOR - Endpoint Best Practices Check")
     print("=" * 60 + "\n")
     
     api_files = find_api_files(project_path)
+    # Mounts are followed across the whole project; a changed-files run then
+    # lists only the routes registered in changed files
+    routes = build_route_inventory(project_path)
+    scope = get_cache(project_path).scope
+    if scope is not None:
+        routes = [route for route in routes if route.file in scope]
     
-    if not api_files:
+    if not api_files and not routes:
         print("[!] No API files found.")
         print("   Looking for: routes/, controllers/, api/, openapi.json/yaml")
         sys.exit(0)
@@ -196,6 +477,8 @@ def main():
             if item.startswith("[X]"):
                 total_issues += 1
     
+    print_route_inventory(routes)
+    
     print("\n" + "=" * 60)
     print(f"[RESULTS] {total_passed} passed, {total_issues} critical issues")
     print("=" * 60)
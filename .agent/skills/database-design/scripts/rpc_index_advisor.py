@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+RPC Index Advisor - composite index suggestions from Postgres function bodies
+
+Reads the latest definition of every SQL/PL/pgSQL function (Supabase RPC) in
+the project's .sql files, extracts the columns each query filters on (WHERE,
+JOIN ... ON), and sorts by (ORDER BY), and checks them against the indexes
+the migrations declare. Missing indexes are ranked by how many RPCs would
+use them. Pure static analysis: no database connection.
+
+Usage:
+    python rpc_index_advisor.py <project_path> [--limit N]
+
+Index shape per query and table (equality, sort, range):
+    equality columns (=, IN, IS NULL) first, then the ORDER BY column, or
+    else the first range column (<, >, BETWEEN, LIKE); boolean columns are
+    too unselective to lead an index and are left out. A table without such
+    filters is reached through a join, so each of its join keys is an
+    access path of its own.
+    Tables the scripts never CREATE are assumed to have an `id` primary key.
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+# Shared scanner library (.agent/.shared/scanner): in-process check entry point, SQL schema replay
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from check_plugin import Result, capture_check  # noqa: E402
+from sql_schema import (STRING_RE, find_sql_files, load_schema, matching_paren,  # noqa: E402
+                        split_statements, split_top_level, sql_name)
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except:
+    pass
+
+
+# ============================================================================
+#  QUERY EXTRACTION
+# ============================================================================
+
+SUBQUERY_START_RE = re.compile(r'\(\s*(?:SELECT|WITH)\b', re.I)
+# DML starts; 'FOR UPDATE' and 'ON CONFLICT DO UPDATE' are clauses, not statements
+DML_RE = re.compile(r'(?<!FOR )(?<!DO )\b(SELECT|UPDATE|DELETE|INSERT)\b', re.I)
+CLAUSE_RE = re.compile(r"""\b(
+    FROM | (?:(?:LEFT|RIGHT|FULL|INNER|CROSS)\s+(?:OUTER\s+)?)?JOIN | ON(?!\s+CONFLICT) | WHERE
+  | GROUP\s+BY | HAVING | ORDER\s+BY | LIMIT | OFFSET | RETURNING | SET | INTO | VALUES
+  | UNION | INTERSECT | EXCEPT | FOR\s+(?:UPDATE|SHARE) | ON\s+CONFLICT | WINDOW
+)\b""", re.I | re.X)
+TABLE_REF_RE = re.compile(r'^(?:ONLY\s+)?((?:"[^"]+"|[A-Za-z_]\w*)(?:\s*\.\s*(?:"[^"]+"|[A-Za-z_]\w*))?)'
+                          r'(?:\s+(?:AS\s+)?(?!ON\b|USING\b|WHERE\b|SET\b)([A-Za-z_]\w*))?\s*$', re.I)
+COLUMN_REF_RE = re.compile(r'^(?:([A-Za-z_]\w*)\s*\.\s*)?("[^"]+"|[A-Za-z_]\w*)$')
+PREDICATE_RE = re.compile(r'^(.+?)\s*(<=|>=|<>|!=|=|<|>|\bNOT\s+IN\b|\bIN\b|\bBETWEEN\b|'
+                          r'\bNOT\s+I?LIKE\b|\bI?LIKE\b|\bIS\b)\s*(.*)$', re.I | re.S)
+AND_RE = re.compile(r'\bAND\b', re.I)
+OR_RE = re.compile(r'\bOR\b', re.I)
+BETWEEN_AND_RE = re.compile(r'\b(BETWEEN\s+\S+)\s+AND\b', re.I)
+DECLARE_RE = re.compile(r'\bDECLARE\b(.*?)\bBEGIN\b', re.I | re.S)
+DECLARED_NAME_RE = re.compile(r'(?:^|;)\s*([A-Za-z_]\w*)\s+(?!:=)', re.M)
+SORT_SUFFIX_RE = re.compile(r'\s+(?:ASC|DESC|NULLS\s+(?:FIRST|LAST))\b.*$', re.I | re.S)
+
+EQUALITY_OPS = {'=', 'IN', 'IS'}
+RANGE_OPS = {'<', '>', '<=', '>=', 'BETWEEN', 'LIKE', 'ILIKE'}
+SQL_WORDS = {'null', 'true', 'false', 'not', 'now', 'current_date', 'current_timestamp', 'current_user'}
+
+
+def _depths(text: str):
+    """Offsets of every '(' / ')' and the paren depth just after each, for _depth_at()."""
+    offsets, depths, depth = [], [], 0
+    for m in re.finditer(r'[()]', text):
+        depth += 1 if m.group() == '(' else -1
+        offsets.append(m.start())
+        depths.append(depth)
+    return offsets, depths
+
+
+def _depth_at(marks, offset: int) -> int:
+    offsets, depths = marks
+    i = bisect_left(offsets, offset)
+    return depths[i - 1] if i else 0
+
+
+def extract_queries(text: str) -> list:
+    """
+    Flat SQL queries in a statement: each parenthesized subquery becomes a
+    query of its own (replaced by '_subquery_' in its parent), and
+    the rest splits at every top-level SELECT/UPDATE/DELETE/INSERT.
+    """
+    queries = []
+    flat, pos = [], 0
+    for m in SUBQUERY_START_RE.finditer(text):
+        if m.start() < pos:
+            continue
+        close = matching_paren(text, m.start())
+        queries.extend(extract_queries(text[m.start() + 1:close]))
+        flat.append(text[pos:m.start()])
+        flat.append(' _subquery_ ')
+        pos = close + 1
+    flat.append(text[pos:])
+    rest = ''.join(flat)
+
+    marks = _depths(rest)
+    starts = [m.start() for m in DML_RE.finditer(rest) if _depth_at(marks, m.start()) == 0]
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else len(rest)
+        queries.append(rest[start:end])
+    return queries
+
+
+def _clauses(query: str) -> list:
+    """(KEYWORD, text) for each top-level clause; the head (SELECT list, UPDATE target) first."""
+    marks = _depths(query)
+    cuts = [m for m in CLAUSE_RE.finditer(query) if _depth_at(marks, m.start()) == 0]
+    head_end = cuts[0].start() if cuts else len(query)
+    first = query.split(None, 1)
+    clauses = [(first[0].upper(), query[len(first[0]):head_end])] if first else []
+    for i, m in enumerate(cuts):
+        end = cuts[i + 1].start() if i + 1 < len(cuts) else len(query)
+        clauses.append((' '.join(m.group(1).upper().split()), query[m.end():end]))
+    return clauses
+
+
+def _conjuncts(expr: str) -> list:
+    """Top-level AND terms; a term with a top-level OR is dropped (no single index serves it)."""
+    expr = BETWEEN_AND_RE.sub(r'\1 _and_', expr)
+    terms = []
+    for term in _split_words(expr, AND_RE):
+        term = term.strip()
+        while term.startswith('(') and matching_paren(term, 0) == len(term) - 1:
+            term = term[1:-1].strip()
+        if _split_words(term, OR_RE)[1:]:
+            continue
+        if AND_RE.search(term) and _split_words(term, AND_RE)[1:]:
+            terms.extend(_conjuncts(term))
+        elif term:
+            terms.append(term)
+    return terms
+
+
+def _split_words(expr: str, word_re) -> list:
+    marks = _depths(expr)
+    parts, start = [], 0
+    for m in word_re.finditer(expr):
+        if _depth_at(marks, m.start()) == 0:
+            parts.append(expr[start:m.start()])
+            start = m.end()
+    parts.append(expr[start:])
+    return parts
+
+
+class QueryScope:
+    """Tables of one query by alias, and resolution of column references."""
+
+    def __init__(self, schema, variables: set):
+        self.schema = schema
+        self.variables = variables
+        self.aliases = {}      # alias or table name -> table
+
+    def add(self, ref: str) -> str:
+        m = TABLE_REF_RE.match(ref.strip())
+        if m is None:
+            return None
+        table = sql_name(m.group(1))
+        self.aliases[table.split('.')[-1]] = table
+        if m.group(2):
+            self.aliases[m.group(2).lower()] = table
+        return table
+
+    def resolve(self, expr: str):
+        """(table, column) for a plain column reference, else None."""
+        m = COLUMN_REF_RE.match(expr.strip())
+        if m is None:
+            return None
+        qualifier, column = m.group(1), sql_name(m.group(2))
+        if column in SQL_WORDS:
+            return None
+        if qualifier is not None:
+            table = self.aliases.get(qualifier.lower())
+            return (table, column) if table else None
+        if column in self.variables:
+            return None
+        tables = set(self.aliases.values())
+        if len(tables) > 1:
+            tables = {t for t in tables if column in self._columns(t)}
+        if len(tables) != 1:
+            return None
+        table = tables.pop()
+        known = self.schema.tables.get(table)
+        if known is not None and known.created and column not in known.columns:
+            return None
+        return table, column
+
+    def _columns(self, table: str):
+        known = self.schema.tables.get(table)
+        return known.columns if known is not None else {}
+
+
+def analyze_query(query: str, schema, variables: set) -> dict:
+    """
+    table -> {'eq': [...], 'range': [...], 'order': [...], 'join': [...]}
+    column usage of one flat query.
+    """
+    scope = QueryScope(schema, variables)
+    predicates, order = [], []
+    for keyword, text in _clauses(query):
+        if keyword in ('FROM',):
+            for item in split_top_level(text):
+                scope.add(item)
+        elif keyword.endswith('JOIN'):
+            scope.add(text)
+        elif keyword in ('UPDATE', 'DELETE'):
+            target = re.sub(r'^\s*FROM\b', '', text, flags=re.I)
+            scope.add(target)
+        elif keyword in ('WHERE', 'ON'):
+            predicates.extend(_conjuncts(text))
+        elif keyword == 'ORDER BY':
+            order = [SORT_SUFFIX_RE.sub('', item) for item in split_top_level(text)]
+
+    usage = {}
+
+    def use(ref, kind):
+        table, column = ref
+        if table not in scope.aliases.values():
+            return
+        slot = usage.setdefault(table, {'eq': [], 'range': [], 'order': [], 'join': []})[kind]
+        if column not in slot:
+            slot.append(column)
+
+    for term in predicates:
+        m = PREDICATE_RE.match(term)
+        if m is None:
+            continue
+        left, op, right = m.group(1), ' '.join(m.group(2).upper().split()), m.group(3)
+        kind = 'eq' if op in EQUALITY_OPS else 'range' if op in RANGE_OPS else None
+        if kind is None:
+            continue
+        lref, rref = scope.resolve(left), scope.resolve(right)
+        if lref and rref:
+            if lref[0] != rref[0] and kind == 'eq':
+                use(lref, 'join')
+                use(rref, 'join')
+        elif lref or rref:
+            use(lref or rref, kind)
+
+    refs = [scope.resolve(item) for item in order]
+    if refs and all(refs) and len({t for t, _ in refs}) == 1:
+        for ref in refs:
+            use(ref, 'order')
+    return usage
+
+
+def function_variables(function) -> set:
+    """Parameter and DECLAREd variable names, which look like columns in queries."""
+    names = set(function.params)
+    for block in DECLARE_RE.finditer(function.body):
+        names.update(name.lower() for name in DECLARED_NAME_RE.findall(block.group(1)))
+    return names
+
+
+def candidate_columns(table, usage: dict) -> list:
+    """
+    (columns, equality column count) for each access path of one table's
+    usage: its filters (equality, then sort, else range) or, for a table
+    with no filters, each join key. Paths a unique index or the primary key
+    already pins are dropped.
+    """
+    flags = {name for name, kind in table.columns.items() if kind in ('boolean', 'bool')}
+    eq = [c for c in usage['eq'] if c not in flags]
+    ranges = usage['range']
+    if eq or ranges:
+        tail = usage['order'][0] if usage['order'] else ranges[0] if ranges else None
+        paths = [(tuple(eq) + ((tail,) if tail and tail not in eq else ()), len(eq))]
+    else:
+        paths = [((key,), 1) for key in usage['join']]
+
+    unique = [set(index.columns) for index in table.indexes.values() if index.unique]
+    if not table.created:
+        unique.append({'id'})
+    return [(columns, eq_count) for columns, eq_count in paths
+            if not any(u <= set(columns[:eq_count]) for u in unique)]
+
+
+def covering_index(table, columns: tuple, eq_count: int):
+    """An existing index serving `columns`: equality columns as a set prefix, then the tail in order."""
+    if table is None:
+        return None
+    for index in table.indexes.values():
+        if set(index.columns[:eq_count]) != set(columns[:eq_count]):
+            continue
+        if index.columns[eq_count:len(columns)] == columns[eq_count:]:
+            return index
+    return None
+
+
+def advise(schema) -> dict:
+    """Rank missing indexes by the RPCs whose queries would use them."""
+    candidates = {}     # (table, columns) -> {'functions': {...}, 'queries': n, 'extends': index}
+    stats = {'functions': 0, 'queries': 0}
+    for function in sorted(schema.functions.values(), key=lambda f: f.name):
+        stats['functions'] += 1
+        variables = function_variables(function)
+        body = STRING_RE.sub("''", function.body)
+        for _, statement in split_statements(body):
+            for query in extract_queries(' '.join(statement.split())):
+                stats['queries'] += 1
+                for table_name, usage in analyze_query(query, schema, variables).items():
+                    table = schema.tables.get(table_name)
+                    if table is None or '.' in table_name:
+                        continue          # CTEs, record variables, Supabase-owned schemas
+                    for columns, eq_count in candidate_columns(table, usage):
+                        if covering_index(table, columns, eq_count):
+                            continue
+                        extends = covering_index(table, columns[:eq_count], eq_count) if eq_count else None
+                        entry = candidates.setdefault((table_name, columns),
+                                                      {'functions': {}, 'queries': 0, 'extends': extends})
+                        entry['functions'].setdefault(function.name, function.source)
+                        entry['queries'] += 1
+
+    # An index on (a, b) also serves queries that only need (a)
+    for key in sorted(candidates, key=lambda k: len(k[1])):
+        table_name, columns = key
+        wider = [other for other in candidates
+                 if other[0] == table_name and len(other[1]) > len(columns) and other[1][:len(columns)] == columns]
+        if wider:
+            target = max(wider, key=lambda k: len(candidates[k]['functions']))
+            candidates[target]['functions'].update(candidates[key]['functions'])
+            candidates[target]['queries'] += candidates.pop(key)['queries']
+
+    ranked = sorted(candidates.items(),
+                    key=lambda item: (-len(item[1]['functions']), -len(item[0][1]), -item[1]['queries'], item[0]))
+    return {'stats': stats, 'ranked': ranked}
+
+
+# ============================================================================
+#  REPORT
+# ============================================================================
+
+def check(target: str, limit: int = 20) -> int:
+    """Print the report for a project; return the CLI exit code."""
+    project_path = Path(target).resolve()
+
+    print(f"\n{'='*60}")
+    print("[RPC INDEX ADVISOR] Indexes for Postgres function queries")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print("-"*60)
+
+    started = time.perf_counter()
+    files = find_sql_files(project_path)
+    schema = load_schema(files, project_path)
+    result = advise(schema)
+    elapsed = time.perf_counter() - started
+    stats = result['stats']
+    ranked = result['ranked']
+    print(f"Analyzed {stats['functions']} functions ({stats['queries']} queries) "
+          f"from {len(files)} SQL files in {elapsed:.2f}s")
+
+    if ranked:
+        print(f"\nMissing indexes, ranked by RPCs that would use them ({len(ranked)}):")
+        for rank, ((table, columns), entry) in enumerate(ranked[:limit], 1):
+            kind = "composite" if len(columns) > 1 else "single-column"
+            extends = f", extends {entry['extends'].name}" if entry['extends'] else ""
+            print(f"\n  {rank}. CREATE INDEX ON {table} ({', '.join(columns)});")
+            print(f"     {kind}: {len(entry['functions'])} RPC(s), {entry['queries']} query(ies){extends}")
+            for name, source in sorted(entry['functions'].items()):
+                print(f"       - {name}  [{source}]")
+        if len(ranked) > limit:
+            print(f"\n  ... and {len(ranked) - limit} more")
+    else:
+        print("\nEvery RPC query is served by a declared index.")
+
+    output = {
+        "script": "rpc_index_advisor",
+        "project": str(project_path),
+        "functions_analyzed": stats['functions'],
+        "queries_analyzed": stats['queries'],
+        "suggestions": [
+            {
+                "table": table,
+                "columns": list(columns),
+                "rpcs": sorted(entry['functions']),
+                "queries": entry['queries'],
+                "extends": entry['extends'].name if entry['extends'] else None,
+            }
+            for (table, columns), entry in ranked
+        ],
+        # Index suggestions are advice, not failures
+        "passed": True,
+    }
+    print("\n" + json.dumps(output, indent=2))
+    return 0
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suggest indexes for the queries inside Postgres RPCs")
+    parser.add_argument("project", nargs="?", default=".", help="Project directory")
+    parser.add_argument("--limit", type=int, default=20, help="Suggestions to print (all are in the JSON)")
+    args = parser.parse_args()
+    sys.exit(check(args.project, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Schema Validator - Database schema validation
-Validates Prisma schemas and checks for common issues.
+Validates Prisma schemas and SQL (Supabase) migrations and checks for common issues.
 
 Usage:
     python schema_validator.py <project_path>
@@ -11,14 +11,24 @@ Checks:
     - Missing relations
     - Index recommendations
     - Naming conventions
+    - SQL: foreign keys without a supporting index
+    - SQL: RLS policies filtering on unindexed columns
 """
 
 import sys
 import json
 import re
+import time
 from pathlib import Path
 from datetime import datetime
 
+# Shared scanner library (.agent/.shared/scanner): in-process check entry point, SQL schema replay
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from check_plugin import Result, capture_check  # noqa: E402
+from sql_schema import find_sql_files, load_schema  # noqa: E402
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -40,8 +50,12 @@ def find_schema_files(project_path: Path) -> list:
     for f in drizzle_files:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
+    schemas = schemas[:10]  # Limit
+    
+    # SQL migrations and scripts, in apply order; they are replayed together
+    schemas.extend(('sql', f) for f in find_sql_files(project_path))
     
-    return schemas[:10]  # Limit
+    return schemas
 
 
 def validate_prisma_schema(file_path: Path) -> list:
@@ -91,8 +105,37 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def validate_sql_schema(files: list, project_path: Path) -> list:
+    """
+    Replay SQL files into one effective schema and report index gaps:
+    foreign keys no index leads with, and RLS policy filter columns
+    (e.g. business_id) without an index.
+    """
+    issues = []
+    started = time.perf_counter()
+    schema = load_schema(files, project_path)
+    elapsed = time.perf_counter() - started
+    stats = schema.stats
+    print(f"Replayed {stats['files']} SQL files ({stats['bytes'] // 1024} KiB, {stats['statements']} statements) "
+          f"in {elapsed:.2f}s: {len(schema.public_tables())} tables")
+    
+    for table, fk in schema.unindexed_foreign_keys():
+        cols = ', '.join(fk.columns)
+        issues.append(f"Foreign key {table.name}({cols}) -> {fk.ref_table} has no index on "
+                      f"{table.name}({cols}) [{fk.source}]")
+    
+    for table, column, policies in schema.unindexed_policy_columns():
+        names = ', '.join(f'"{p.name}"' for p in policies[:3])
+        more = f" and {len(policies) - 3} more" if len(policies) > 3 else ""
+        issues.append(f"RLS filters on {table.name}.{column} without an index: "
+                      f"{names}{more} [{policies[0].source}]")
+    
+    return issues
+
+
+def check(target: str) -> int:
+    """Print the report for a project; return the CLI exit code."""
+    project_path = Path(target).resolve()
     
     print(f"\n{'='*60}")
     print(f"[SCHEMA VALIDATOR] Database Schema Validation")
@@ -115,12 +158,25 @@ def main():
             "message": "No schema files found"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     # Validate each schema
     all_issues = []
     
+    sql_files = [f for schema_type, f in schemas if schema_type == 'sql']
+    if sql_files:
+        print(f"\nValidating: {len(sql_files)} SQL files (sql)")
+        issues = validate_sql_schema(sql_files, project_path)
+        if issues:
+            all_issues.append({
+                "file": f"{len(sql_files)} SQL files",
+                "type": "sql",
+                "issues": issues
+            })
+    
     for schema_type, file_path in schemas:
+        if schema_type == 'sql':
+            continue
         print(f"\nValidating: {file_path.name} ({schema_type})")
         
         if schema_type == 'prisma':
@@ -143,10 +199,11 @@ def main():
     if all_issues:
         for item in all_issues:
             print(f"\n{item['file']} ({item['type']}):")
-            for issue in item["issues"][:5]:  # Limit per file
+            limit = 25 if item['type'] == 'sql' else 5  # Limit per file; SQL is the whole schema
+            for issue in item["issues"][:limit]:
                 print(f"  - {issue}")
-            if len(item["issues"]) > 5:
-                print(f"  ... and {len(item['issues']) - 5} more issues")
+            if len(item["issues"]) > limit:
+                print(f"  ... and {len(item['issues']) - limit} more issues")
     else:
         print("No schema issues found!")
     
@@ -165,7 +222,16 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0)
+    return 0
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    sys.exit(check(sys.argv[1] if len(sys.argv) > 1 else "."))
 
 
 if __name__ == "__main__":
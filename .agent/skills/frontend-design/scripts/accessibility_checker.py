@@ -1,25 +1,40 @@
 #!/usr/bin/env python3
 """
 Accessibility Checker - WCAG compliance audit
-Checks HTML files for accessibility issues.
+Checks HTML/JSX/TSX files for accessibility issues. Each file is tokenized
+once into an element stream (tolerant HTML plus a JSX approximation) and
+every rule consumes that stream.
 
 Usage:
     python accessibility_checker.py <project_path>
+    python accessibility_checker.py <project_path> --changed-since origin/main   # changed files only
+    python accessibility_checker.py <project_path> --benchmark
 
 Checks:
-    - Form labels
-    - ARIA attributes
-    - Color contrast hints
-    - Keyboard navigation
-    - Semantic HTML
+    - Form labels (wrapping <label>, for/htmlFor, ARIA name)
+    - Button and image text alternatives
+    - ARIA roles and keyboard navigation
+    - Heading order
+    - Semantic HTML (lang, skip link)
 """
 
 import sys
+import argparse
 import json
 import re
+import time
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache, read_source  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -29,87 +44,512 @@ except:
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
+    cache = get_cache(project_path)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for ext in ('.html', '.jsx', '.tsx'):
+        files.extend(cache.files((ext,), under=project_path))
     
-    return files[:50]
+    return files
+
+
+# ============================================================================
+#  MARKUP TOKENIZER
+# ============================================================================
+#
+# One forward pass per file turns HTML or JSX into an event stream:
+#   ('start', Element)  an opening or self-closing tag
+#   ('end', tag)        a closing tag (self-closing tags get one too)
+#   ('text', text)      character data between tags; a JSX {expression}
+#                       child is text too, since it usually renders some
+# It is tolerant rather than strict: a '<' that does not begin a well-formed
+# tag is text, JSX attribute values in {...} are skipped by brace matching,
+# and unclosed elements are simply never closed. A '<' that fails as a tag is
+# retried as text from the next offset, so later attempts can re-enter the
+# region it scanned. Brace matches are memoised by offset (one scan matches
+# every brace nested inside), and the attribute scan, which depends only on
+# its offset, stops at any offset where an earlier one failed. Each offset is
+# therefore scanned a bounded number of times, so the pass stays linear even
+# for nested failed tags ('<a {<a {...}}').
+
+# attrs: lowercased attribute name -> value ('"..."' contents, '{...}' source
+# for JSX expressions, True for bare attributes); spread: has {...props}
+Element = namedtuple('Element', ['tag', 'attrs', 'spread', 'self_closing', 'offset'])
+
+TAG_START_RE = re.compile(r'<(/?)([A-Za-z][\w.:\-]*)')
+ATTR_RE = re.compile(r"""
+    \s*(?:
+        (?P<end>/?>)
+      | (?P<spread>\{)
+      | (?P<name>[^\s=/>{}"'<]+)
+        (?:\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<brace>\{)|(?P<bare>[^\s>"'{}]+)))?
+      | (?P<junk>[^<]|$)
+    )""", re.VERBOSE)
+# Inside {...}: braces to count, and strings/templates whose braces do not
+BRACE_SCAN_RE = re.compile(r"""[{}]|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`""")
+RAW_TEXT_TAGS = {'script', 'style'}
+JSX_NEXT_RE = re.compile(r'<|/\*')
+
+
+def _skip_braces(text: str, pos: int, memo: dict) -> int:
+    """
+    Offset just past the '}' matching the '{' before `pos` (end of text if
+    none). `memo` (brace offset -> result) is filled for every brace the scan
+    passes, so a later call for a nested brace is a lookup.
+    """
+    if pos in memo:
+        return memo[pos]
+    opened = [pos]
+    for m in BRACE_SCAN_RE.finditer(text, pos):
+        token = m.group()
+        if token == '{':
+            opened.append(m.end())
+        elif token == '}':
+            memo[opened.pop()] = m.end()
+            if not opened:
+                return m.end()
+    for start in opened:
+        memo[start] = len(text)
+    return len(text)
+
+
+def tokenize_markup(text: str, html: bool = False):
+    """
+    Yield the event stream of an HTML (html=True: tag names lowercased,
+    <script>/<style> bodies skipped) or JSX/TSX source.
+    """
+    pos, end = 0, len(text)
+    text_start = 0
+    braces = {}
+    dead = set()  # offsets from which the attribute scan is known to fail
+    while True:
+        if html:
+            lt = text.find('<', pos)
+        else:
+            # JS block comments ({/* ... */} in JSX) may hold commented-out markup
+            nxt = JSX_NEXT_RE.search(text, pos)
+            lt = nxt.start() if nxt else -1
+            if nxt and nxt.group() == '/*':
+                close = text.find('*/', lt + 2)
+                if text_start < lt:
+                    yield 'text', text[text_start:lt]
+                pos = text_start = end if close < 0 else close + 2
+                continue
+        if lt < 0:
+            break
+        if text.startswith('<!--', lt):
+            close = text.find('-->', lt + 4)
+            if text_start < lt:
+                yield 'text', text[text_start:lt]
+            pos = text_start = end if close < 0 else close + 3
+            continue
+        m = TAG_START_RE.match(text, lt)
+        if m is None:
+            pos = lt + 1
+            continue
+        closing, tag = m.group(1), m.group(2)
+        if html:
+            tag = tag.lower()
+
+        if closing:
+            gt = text.find('>', m.end())
+            if gt < 0:
+                break
+            if text_start < lt:
+                yield 'text', text[text_start:lt]
+            yield 'end', tag
+            pos = text_start = gt + 1
+            continue
+
+        # Attributes up to '>' or '/>'; anything else means this '<' was not a tag
+        attrs, spread, self_closing = {}, False, None
+        p = m.end()
+        visited = []
+        while p not in dead:
+            visited.append(p)
+            a = ATTR_RE.match(text, p)
+            if a is None or a.lastgroup == 'junk' and a.end() == a.start('junk'):
+                break  # hit '<' or the end of the text
+            p = a.end()
+            end_mark, brace_open, name, dq, sq, brace, bare, _ = a.groups()
+            if end_mark is not None:
+                self_closing = end_mark == '/>'
+                break
+            if brace_open is not None:
+                p = _skip_braces(text, p, braces)
+                spread = True
+            elif name is not None:
+                if brace is not None:
+                    start = p - 1
+                    p = _skip_braces(text, p, braces)
+                    value = text[start:p]
+                else:
+                    value = dq if dq is not None else sq if sq is not None else bare or True
+                attrs[name.lower()] = value
+        if self_closing is None:
+            dead.update(visited)
+            pos = lt + 1
+            continue
+
+        if text_start < lt:
+            yield 'text', text[text_start:lt]
+        yield 'start', Element(tag, attrs, spread, self_closing, lt)
+        pos = text_start = p
+        if self_closing:
+            yield 'end', tag
+        elif html and tag in RAW_TEXT_TAGS:
+            close = _find_ci(text, f'</{tag}', p)
+            pos = text_start = end if close < 0 else close
+    if text_start < end:
+        yield 'text', text[text_start:]
+
+
+def _find_ci(text: str, needle: str, start: int) -> int:
+    m = re.compile(re.escape(needle), re.I).search(text, start)
+    return m.start() if m else -1
+
+
+# ============================================================================
+#  RULES
+# ============================================================================
+#
+# A rule subscribes to the element tags it cares about (None = every element)
+# and, if `wants_text`, to text; audit_markup() dispatches each event only to
+# its subscribers. Each rule reports at most one issue per file.
+
+NATIVE_INTERACTIVE = {'a', 'button', 'input', 'select', 'textarea', 'summary', 'option', 'details'}
+NAMING_ATTRS = ('aria-label', 'aria-labelledby', 'title')
+UNLABELED_INPUT_TYPES = {'hidden', 'submit', 'button', 'reset', 'image'}
+
+
+def _is_dynamic(value) -> bool:
+    return isinstance(value, str) and value.startswith('{')
+
+
+def _is_intrinsic(tag: str) -> bool:
+    """An HTML element rather than a React component (<Button>, <motion.div>)."""
+    return tag[:1].islower() and '.' not in tag
+
+
+class Rule:
+    tags = None
+    wants_text = False
+    message = ""
+
+    def __init__(self):
+        self.failed = False
+
+    def start(self, el: Element) -> None:
+        pass
+
+    def end(self, tag: str) -> None:
+        pass
+
+    def text(self, text: str) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+class InputLabelRule(Rule):
+    """Form controls need a <label> (wrapping or via for/htmlFor) or an ARIA name."""
+    tags = {'input', 'select', 'textarea', 'label'}
+    message = "Input without label or aria-label"
+
+    def __init__(self):
+        super().__init__()
+        self.label_depth = 0
+        self.label_targets = set()
+        self.pending_ids = []
+
+    def start(self, el):
+        if el.tag == 'label':
+            target = el.attrs.get('htmlfor', el.attrs.get('for'))
+            if isinstance(target, str):
+                self.label_targets.add(target)
+            if not el.self_closing:
+                self.label_depth += 1
+            return
+        input_type = el.attrs.get('type')
+        if el.tag == 'input' and isinstance(input_type, str) and input_type.lower() in UNLABELED_INPUT_TYPES:
+            return
+        if self.label_depth or el.spread or any(a in el.attrs for a in NAMING_ATTRS):
+            return
+        element_id = el.attrs.get('id')
+        if _is_dynamic(element_id):
+            return
+        if isinstance(element_id, str):
+            self.pending_ids.append(element_id)
+        else:
+            self.failed = True
+
+    def end(self, tag):
+        if tag == 'label' and self.label_depth:
+            self.label_depth -= 1
+
+    def finish(self):
+        if any(i not in self.label_targets for i in self.pending_ids):
+            self.failed = True
+
+
+class ButtonTextRule(Rule):
+    """A <button> needs text, an {expression}, a component child or an ARIA name."""
+    wants_text = True
+    message = "Button without accessible text"
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []  # one "has a name" flag per open <button>
+
+    def start(self, el):
+        if el.tag == 'button':
+            named = el.spread or any(a in el.attrs for a in NAMING_ATTRS)
+            if el.self_closing:
+                self.failed = self.failed or not named
+            else:
+                self.stack.append(named)
+        elif self.stack and not self.stack[-1]:
+            alt = el.attrs.get('alt')
+            # Components may render text; an <img alt> names the button
+            if not _is_intrinsic(el.tag) or (el.tag == 'img' and alt not in (None, True, '')):
+                self.stack[-1] = True
+
+    def text(self, text):
+        if self.stack and not self.stack[-1] and text.strip():
+            self.stack[-1] = True
+
+    def end(self, tag):
+        if tag == 'button' and self.stack:
+            if not self.stack.pop():
+                self.failed = True
+
+
+class HtmlLangRule(Rule):
+    tags = {'html'}
+    message = "Missing lang attribute on <html>"
+
+    def start(self, el):
+        if 'lang' not in el.attrs and not el.spread:
+            self.failed = True
+
+
+class SkipLinkRule(Rule):
+    """Pages with <main>/<body> should offer an in-page skip link."""
+    tags = {'main', 'body', 'a'}
+    wants_text = True
+    message = "Consider adding skip-to-main-content link"
+
+    def __init__(self):
+        super().__init__()
+        self.landmark = False
+        self.skip_link = False
+
+    def start(self, el):
+        if el.tag == 'a':
+            href = el.attrs.get('href')
+            if isinstance(href, str) and href.startswith('#') and len(href) > 1:
+                self.skip_link = True
+        else:
+            self.landmark = True
+
+    def text(self, text):
+        if not self.skip_link and 'skip' in text.lower():
+            self.skip_link = True
+
+    def finish(self):
+        self.failed = self.landmark and not self.skip_link
+
+
+class KeyboardHandlerRule(Rule):
+    """onClick on a non-interactive element needs a key handler too."""
+    message = "onClick without keyboard handler (onKeyDown)"
+
+    def start(self, el):
+        if ('onclick' in el.attrs and _is_intrinsic(el.tag) and el.tag not in NATIVE_INTERACTIVE
+                and not el.spread
+                and not any(k in el.attrs for k in ('onkeydown', 'onkeyup', 'onkeypress'))):
+            self.failed = True
+
+
+class TabIndexRule(Rule):
+    message = "Avoid positive tabIndex values"
+
+    def start(self, el):
+        value = el.attrs.get('tabindex')
+        if isinstance(value, str) and value.strip('{} ').isdigit() and int(value.strip('{} ')) > 0:
+            self.failed = True
+
+
+class AutoplayRule(Rule):
+    tags = {'video', 'audio'}
+    message = "Autoplay media should be muted"
+
+    def start(self, el):
+        if 'autoplay' in el.attrs and 'muted' not in el.attrs and not el.spread:
+            self.failed = True
+
+
+class RoleButtonRule(Rule):
+    """role="button" on a non-button must be focusable."""
+    message = "role='button' without tabindex"
+
+    def start(self, el):
+        if el.attrs.get('role') == 'button' and el.tag != 'button' and 'tabindex' not in el.attrs:
+            self.failed = True
+
+
+class ImageAltRule(Rule):
+    """<img> needs alt (empty alt marks a decorative image)."""
+    tags = {'img'}
+    message = "Image missing alt attribute"
+
+    def start(self, el):
+        if 'alt' not in el.attrs and not el.spread and not any(a in el.attrs for a in NAMING_ATTRS) \
+                and el.attrs.get('aria-hidden') not in ('true', '{true}') \
+                and el.attrs.get('role') not in ('presentation', 'none'):
+            self.failed = True
+
+
+class HeadingOrderRule(Rule):
+    """Headings should not skip levels (h2 followed by h4)."""
+    tags = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+    message = "Heading level skipped"
+
+    def __init__(self):
+        super().__init__()
+        self.level = 0
+
+    def start(self, el):
+        level = int(el.tag[1])
+        if self.level and level > self.level + 1 and not self.failed:
+            self.failed = True
+            self.message = f"Heading level skipped (h{self.level} -> h{level})"
+        self.level = level
+
+
+RULES = [InputLabelRule, ButtonTextRule, HtmlLangRule, SkipLinkRule, KeyboardHandlerRule,
+         TabIndexRule, AutoplayRule, RoleButtonRule, ImageAltRule, HeadingOrderRule]
+
+
+def audit_markup(content: str, html: bool = False, rules=RULES) -> list:
+    """Run `rules` over one pass of the markup event stream; issue messages in rule order."""
+    active = [rule() for rule in rules]
+    by_tag, every_tag = {}, []
+    for rule in active:
+        if rule.tags is None:
+            every_tag.append(rule)
+        else:
+            for tag in rule.tags:
+                by_tag.setdefault(tag, []).append(rule)
+    text_rules = [rule for rule in active if rule.wants_text]
+    for kind, value in tokenize_markup(content, html=html):
+        if kind == 'start':
+            for rule in by_tag.get(value.tag, ()):
+                rule.start(value)
+            for rule in every_tag:
+                rule.start(value)
+        elif kind == 'end':
+            for rule in by_tag.get(value, ()):
+                rule.end(value)
+            for rule in every_tag:
+                rule.end(value)
+        else:
+            for rule in text_rules:
+                rule.text(value)
+    for rule in active:
+        rule.finish()
+    return [rule.message for rule in active if rule.failed]
 
 
 def check_accessibility(file_path: Path) -> list:
     """Check a single file for accessibility issues."""
-    issues = []
-    
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Check for form inputs without labels
-        inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
-        for inp in inputs:
-            if 'type="hidden"' not in inp.lower():
-                if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
-                    issues.append("Input without label or aria-label")
-                    break
-        
-        # Check for buttons without accessible text
-        buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
-        for btn in buttons:
-            # Check if button has text content or aria-label
-            if 'aria-label' not in btn.lower():
-                text = re.sub(r'<[^>]+>', '', btn)
-                if not text.strip():
-                    issues.append("Button without accessible text")
-                    break
-        
-        # Check for missing lang attribute
-        if '<html' in content.lower() and 'lang=' not in content.lower():
-            issues.append("Missing lang attribute on <html>")
-        
-        # Check for missing skip link
-        if '<main' in content.lower() or '<body' in content.lower():
-            if 'skip' not in content.lower() and '#main' not in content.lower():
-                issues.append("Consider adding skip-to-main-content link")
-        
-        # Check for click handlers without keyboard support
-        onclick_count = content.lower().count('onclick=')
-        onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
-        if onclick_count > 0 and onkeydown_count == 0:
-            issues.append("onClick without keyboard handler (onKeyDown)")
-        
-        # Check for tabIndex misuse
-        if 'tabindex=' in content.lower():
-            if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
-                positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
-                if positive_tabindex:
-                    issues.append("Avoid positive tabIndex values")
-        
-        # Check for autoplay media
-        if 'autoplay' in content.lower():
-            if 'muted' not in content.lower():
-                issues.append("Autoplay media should be muted")
-        
-        # Check for role usage
-        if 'role="button"' in content.lower():
-            # Divs with role button should have tabindex
-            div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
-            for div in div_buttons:
-                if 'tabindex' not in div.lower():
-                    issues.append("role='button' without tabindex")
-                    break
-        
+        content = read_source(file_path)
+        if content is None:
+            raise OSError("file could not be read")
+        return audit_markup(content, html=file_path.suffix.lower() in ('.html', '.htm'))
     except Exception as e:
-        issues.append(f"Error reading file: {str(e)[:50]}")
-    
+        return [f"Error reading file: {str(e)[:50]}"]
+
+
+def _regex_check(content: str) -> list:
+    """The per-rule regex/substring scans the element stream replaced, kept for --benchmark."""
+    issues = []
+    lowered = content.lower()
+    for inp in re.findall(r'<input[^>]*>', content, re.IGNORECASE):
+        if 'type="hidden"' not in inp.lower() and 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
+            issues.append("Input without label or aria-label")
+            break
+    for btn in re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE):
+        if 'aria-label' not in btn.lower() and not re.sub(r'<[^>]+>', '', btn).strip():
+            issues.append("Button without accessible text")
+            break
+    if '<html' in lowered and 'lang=' not in lowered:
+        issues.append("Missing lang attribute on <html>")
+    if ('<main' in lowered or '<body' in lowered) and 'skip' not in lowered and '#main' not in lowered:
+        issues.append("Consider adding skip-to-main-content link")
+    if lowered.count('onclick=') and not (lowered.count('onkeydown=') + lowered.count('onkeyup=')):
+        issues.append("onClick without keyboard handler (onKeyDown)")
+    if 'tabindex=' in lowered and 'tabindex="-1"' not in lowered and 'tabindex="0"' not in lowered:
+        if re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE):
+            issues.append("Avoid positive tabIndex values")
+    if 'autoplay' in lowered and 'muted' not in lowered:
+        issues.append("Autoplay media should be muted")
+    if 'role="button"' in lowered:
+        for div in re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE):
+            if 'tabindex' not in div.lower():
+                issues.append("role='button' without tabindex")
+                break
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+PATHOLOGICAL_NESTING = (1000, 2000, 4000, 8000)
+
+
+def benchmark(target: str, repeat: int = 3) -> None:
+    """Time the old per-rule regex scans against the element stream over src/ and index.html."""
+    project_path = Path(target).resolve()
+    cache = get_cache(project_path)
+    files = []
+    if (project_path / 'src').is_dir():
+        files = cache.files(('.html', '.jsx', '.tsx'), under=project_path / 'src')
+    if (project_path / 'index.html').is_file():
+        files.append(project_path / 'index.html')
+    sources = [(read_source(f) or '', f.suffix.lower() == '.html') for f in files]
+    size = sum(len(text) for text, _ in sources)
+
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    events = sum(1 for text, html in sources for _ in tokenize_markup(text, html=html))
+    timings = {
+        "regex, 8 rules": best(lambda: [_regex_check(t) for t, _ in sources]),
+        "tokenize only": best(lambda: [sum(1 for _ in tokenize_markup(t, html=h)) for t, h in sources]),
+        "stream, 1 rule": best(lambda: [audit_markup(t, h, rules=RULES[:1]) for t, h in sources]),
+        f"stream, {len(RULES)} rules": best(lambda: [audit_markup(t, h) for t, h in sources]),
+    }
+    print(f"\n[A11Y BENCHMARK] {len(files)} files, {size / 1024:.0f} KiB, {events} markup events")
+    print("-" * 50)
+    for label, seconds in timings.items():
+        print(f"  {label:<18} {seconds * 1000:8.1f} ms")
+
+    # Nested tags that never close ('<a {' * n + '}' * n): each '<' fails and is
+    # retried as text, so time must grow linearly with n
+    print("\n  nested failed tags ('<a {' * n + '}' * n)")
+    for n in PATHOLOGICAL_NESTING:
+        text = '<a {' * n + '}' * n
+        print(f"  n={n:<16} {best(lambda: sum(1 for _ in tokenize_markup(text))) * 1000:8.1f} ms")
+
+
+def check(target: str) -> int:
+    """Print the report for a project; return the CLI exit code."""
+    project_path = Path(target).resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -132,7 +572,7 @@ def main():
             "message": "No HTML files found"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     # Check each file
     all_issues = []
@@ -176,7 +616,31 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    return 0 if passed else 1
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WCAG accessibility audit")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time the old regex scans against the element stream over src/ and index.html")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.project, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+    
+    if args.benchmark:
+        benchmark(args.project)
+        sys.exit(0)
+    
+    sys.exit(check(args.project))
 
 
 if __name__ == "__main__":
@@ -13,14 +13,29 @@ WHAT IT CHECKS:
     - JSX/TSX files (React page components)
     - NOT markdown files (those are developer docs, not public content)
 
+Every page is checked; verdicts are cached per content hash in
+.agent/.cache/geo_pages.json and changed pages are analyzed in parallel.
+
 Usage:
     python geo_checker.py <project_path>
+    python geo_checker.py <project_path> --workers 4 --no-cache
+    python geo_checker.py <project_path> --changed-since origin/main   # changed files only
 """
 import sys
+import argparse
 import re
 import json
 from pathlib import Path
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import find_page_files, read_source  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+from file_analysis import PARALLEL_MIN_FILES, analyze_files  # noqa: E402
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -43,6 +58,38 @@ SKIP_FILES = {
     'tailwind.config', 'postcss.config', 'next.config'
 }
 
+# Per-page verdicts, cached by content hash; bump the version when checks change
+PAGE_CACHE_FILE = Path(".agent") / ".cache" / "geo_pages.json"
+GEO_ANALYZER_VERSION = 1
+
+# Patterns compiled once; an alternation stands in for any(re.search(p) ...)
+H1_RE = re.compile(r'<h1[^>]*>', re.I)
+H2_RE = re.compile(r'<h2[^>]*>', re.I)
+LIST_RE = re.compile(r'<(ul|ol)[^>]*>', re.I)
+TABLE_RE = re.compile(r'<table[^>]*>', re.I)
+AUTHOR_MARKERS = ('author', 'byline', 'written-by', 'contributor', 'rel="author"')
+DATE_RE = re.compile(r'datePublished|dateModified|datetime=|pubdate|article:published', re.I)
+FAQ_RE = re.compile(r'<details|faq|frequently.?asked|"FAQPage"', re.I)
+ENTITY_RE = re.compile('|'.join([
+    r'"@type"\s*:\s*"Organization"',
+    r'"@type"\s*:\s*"LocalBusiness"',
+    r'"@type"\s*:\s*"Brand"',
+    r'itemtype.*schema\.org/(Organization|Person|Brand)',
+    r'rel="author"',
+]), re.I)
+# Counted one by one: two or more kinds of evidence make a "statistics" page
+STAT_PATTERNS = [re.compile(p, re.I) for p in (
+    r'\d+%',                    # Percentages
+    r'\$[\d,]+',                # Dollar amounts
+    r'study\s+(shows|found)',   # Research citations
+    r'according to',            # Source attribution
+    r'data\s+(shows|reveals)',  # Data-backed claims
+    r'\d+x\s+(faster|better|more)', # Comparison stats
+    r'(million|billion|trillion)', # Large numbers
+)]
+DIRECT_ANSWER_RE = re.compile(
+    r'is defined as|refers to|means that|the answer is|in short,|simply put,|<dfn', re.I)
+
 
 def is_page_file(file_path: Path) -> bool:
     """Check if this file is likely a public-facing page."""
@@ -79,30 +126,12 @@ def is_page_file(file_path: Path) -> bool:
 
 
 def find_web_pages(project_path: Path) -> list:
-    """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:30]  # Limit to 30 pages
+    """Find public-facing web pages only (every page; one pass over the shared walk)."""
+    return find_page_files(project_path, is_page_file, skip_dirs=SKIP_DIRS)
 
 
-def check_page(file_path: Path) -> dict:
-    """Check a single web page for GEO elements."""
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception as e:
-        return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
-    
+def analyze_page(content: str) -> dict:
+    """GEO elements of one page's source: passed/issues lists and a 0-100 score."""
     issues = []
     passed = []
     
@@ -120,8 +149,8 @@ def check_page(file_path: Path) -> dict:
         issues.append("No JSON-LD structured data (AI engines prefer structured content)")
     
     # 2. Heading Structure
-    h1_count = len(re.findall(r'<h1[^>]*>', content, re.I))
-    h2_count = len(re.findall(r'<h2[^>]*>', content, re.I))
+    h1_count = len(H1_RE.findall(content))
+    h2_count = len(H2_RE.findall(content))
     
     if h1_count == 1:
         passed.append("Single H1 heading (clear topic)")
@@ -136,75 +165,47 @@ def check_page(file_path: Path) -> dict:
         issues.append("Add more H2 subheadings for scannable content")
     
     # 3. Author Attribution (E-E-A-T signal)
-    author_patterns = ['author', 'byline', 'written-by', 'contributor', 'rel="author"']
-    has_author = any(p in content.lower() for p in author_patterns)
-    if has_author:
+    lowered = content.lower()
+    if any(marker in lowered for marker in AUTHOR_MARKERS):
         passed.append("Author attribution found")
     else:
         issues.append("No author info (AI prefers attributed content)")
     
     # 4. Publication Date (Freshness signal)
-    date_patterns = ['datePublished', 'dateModified', 'datetime=', 'pubdate', 'article:published']
-    has_date = any(re.search(p, content, re.I) for p in date_patterns)
-    if has_date:
+    if DATE_RE.search(content):
         passed.append("Publication date found")
     else:
         issues.append("No publication date (freshness matters for AI)")
     
     # 5. FAQ Section (Highly citable)
-    faq_patterns = [r'<details', r'faq', r'frequently.?asked', r'"FAQPage"']
-    has_faq = any(re.search(p, content, re.I) for p in faq_patterns)
-    if has_faq:
+    if FAQ_RE.search(content):
         passed.append("FAQ section detected (highly citable)")
     
     # 6. Lists (Structured content)
-    list_count = len(re.findall(r'<(ul|ol)[^>]*>', content, re.I))
+    list_count = len(LIST_RE.findall(content))
     if list_count >= 2:
         passed.append(f"{list_count} lists (structured content)")
     
     # 7. Tables (Comparison data)
-    table_count = len(re.findall(r'<table[^>]*>', content, re.I))
+    table_count = len(TABLE_RE.findall(content))
     if table_count >= 1:
         passed.append(f"{table_count} table(s) (comparison data)")
     
     # 8. Entity Recognition (E-E-A-T signal) - NEW 2025
-    entity_patterns = [
-        r'"@type"\s*:\s*"Organization"',
-        r'"@type"\s*:\s*"LocalBusiness"', 
-        r'"@type"\s*:\s*"Brand"',
-        r'itemtype.*schema\.org/(Organization|Person|Brand)',
-        r'rel="author"'
-    ]
-    has_entity = any(re.search(p, content, re.I) for p in entity_patterns)
-    if has_entity:
+    if ENTITY_RE.search(content):
         passed.append("Entity/Brand recognition (E-E-A-T)")
     
     # 9. Original Statistics/Data (AI citation magnet) - NEW 2025
-    stat_patterns = [
-        r'\d+%',                    # Percentages
-        r'\$[\d,]+',                # Dollar amounts
-        r'study\s+(shows|found)',   # Research citations
-        r'according to',            # Source attribution
-        r'data\s+(shows|reveals)',  # Data-backed claims
-        r'\d+x\s+(faster|better|more)', # Comparison stats
-        r'(million|billion|trillion)', # Large numbers
-    ]
-    stat_matches = sum(1 for p in stat_patterns if re.search(p, content, re.I))
-    if stat_matches >= 2:
-        passed.append("Original statistics/data (citation magnet)")
+    stat_matches = 0
+    for pattern in STAT_PATTERNS:
+        if pattern.search(content):
+            stat_matches += 1
+            if stat_matches >= 2:
+                passed.append("Original statistics/data (citation magnet)")
+                break
     
     # 10. Conversational/Direct answers - NEW 2025
-    direct_answer_patterns = [
-        r'is defined as',
-        r'refers to',
-        r'means that',
-        r'the answer is',
-        r'in short,',
-        r'simply put,',
-        r'<dfn'
-    ]
-    has_direct = any(re.search(p, content, re.I) for p in direct_answer_patterns)
-    if has_direct:
+    if DIRECT_ANSWER_RE.search(content):
         passed.append("Direct answer patterns (LLM-friendly)")
     
     # Calculate score
@@ -212,15 +213,22 @@ def check_page(file_path: Path) -> dict:
     score = (len(passed) / total * 100) if total > 0 else 0
     
     return {
-        'file': str(file_path.name),
         'passed': passed,
         'issues': issues,
         'score': round(score)
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def check_page(file_path: Path) -> dict:
+    """Check a single web page for GEO elements."""
+    content = read_source(file_path)
+    if content is None:
+        return {'file': str(file_path.name), 'passed': [], 'issues': ["Error: cannot read file"], 'score': 0}
+    return {'file': str(file_path.name), **analyze_page(content)}
+
+
+def check(target: str, workers: int = 1, use_cache: bool = True) -> int:
+    """Print the report for a project; return the CLI exit code."""
     target_path = Path(target).resolve()
     
     print("\n" + "=" * 60)
@@ -238,15 +246,14 @@ def main():
         print("    Skipping: docs, tests, config files, node_modules")
         output = {"script": "geo_checker", "pages_found": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     print(f"Found {len(pages)} public pages to analyze\n")
     
-    # Check each page
-    results = []
-    for page in pages:
-        result = check_page(page)
-        results.append(result)
+    # Check each page (unchanged pages reuse their cached verdict)
+    results = [{'file': page.name, **result} for page, result in
+               analyze_files(pages, analyze_page, 'geo', GEO_ANALYZER_VERSION, target_path,
+                             workers=workers, use_cache=use_cache, cache_file=PAGE_CACHE_FILE)]
     
     # Print results
     for result in results:
@@ -282,7 +289,29 @@ def main():
     }
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    return 0 if avg_score >= 60 else 1
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GEO (AI citation readiness) audit of public pages")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--workers", type=int, default=0,
+                        help=f"Worker processes for changed pages (0 = one per CPU; "
+                             f"used once {PARALLEL_MIN_FILES}+ pages need analysis)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-analyze every page instead of reusing verdicts by content hash")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.project, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+    sys.exit(check(args.project, workers=args.workers, use_cache=not args.no_cache))
 
 
 if __name__ == "__main__":
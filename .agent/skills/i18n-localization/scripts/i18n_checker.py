@@ -1,13 +1,33 @@
 #!/usr/bin/env python3
 """
 i18n Checker - Detects hardcoded strings and missing translations.
-Scans for untranslated text in React, Vue, and Python files.
+Scans for untranslated text (English and Hebrew) in React, Vue, and Python
+files. Every code file is scanned; results are cached per content hash in
+.agent/.cache/i18n_strings.json and each finding is printed as file:line.
+Locale completeness indexes the union of keys across all languages once and
+reports a missing/extra matrix per language and namespace.
+
+Usage:
+    python i18n_checker.py <project_path>
+    python i18n_checker.py <project_path> --changed-since origin/main
+    python i18n_checker.py <project_path> --no-cache
 """
+import os
 import sys
+import argparse
 import re
 import json
+import hashlib
 from pathlib import Path
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache, read_source  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,6 +35,9 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+# Hebrew letters (alef..tav): the kiosk UI is Hebrew/English
+HEBREW = 'א-ת'
+
 # Patterns that indicate hardcoded strings (should be translated)
 HARDCODED_PATTERNS = {
     'jsx': [
@@ -24,11 +47,15 @@ HARDCODED_PATTERNS = {
         r'(title|placeholder|label|alt|aria-label)="[A-Z][a-zA-Z\s]{2,}"',
         # Button/heading text
         r'<(button|h[1-6]|p|span|label)[^>]*>\s*[A-Z][a-zA-Z\s!?.,]{3,}\s*</',
+        # Hebrew JSX text and attribute strings
+        rf'>[^<>{{}}\n]*[{HEBREW}][^<>{{}}\n]*</',
+        rf'(title|placeholder|label|alt|aria-label)="[^"\n]*[{HEBREW}][^"\n]*"',
     ],
     'vue': [
         # Vue template text
         r'>\s*[A-Z][a-zA-Z\s]{3,30}\s*</',
         r'(placeholder|label|title)="[A-Z][a-zA-Z\s]{2,}"',
+        rf'>[^<>{{}}\n]*[{HEBREW}][^<>{{}}\n]*</',
     ],
     'python': [
         # print/raise with string literals
@@ -37,150 +64,377 @@ HARDCODED_PATTERNS = {
         r'flash\s*\(\s*["\'][A-Z][^"\']{5,}["\']',
     ]
 }
+COMPILED_PATTERNS = {lang: [re.compile(p) for p in patterns] for lang, patterns in HARDCODED_PATTERNS.items()}
 
 # Patterns that indicate proper i18n usage
 I18N_PATTERNS = [
-    r't\(["\']',           # t('key') - react-i18next
+    r'\bt\(["\']',         # t('key') - react-i18next (not split('...'))
     r'useTranslation',     # React hook
     r'\$t\(',              # Vue i18n
-    r'_\(["\']',           # Python gettext
+    r'\b_\(["\']',         # Python gettext
     r'gettext\(',          # Python gettext
     r'useTranslations',    # next-intl
     r'FormattedMessage',   # react-intl
     r'i18n\.',             # Generic i18n
 ]
+# One alternation: a single search answers "does this file use i18n?"
+I18N_RE = re.compile('|'.join(I18N_PATTERNS))
+
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+# Path components (and file-name markers) excluded from the hardcoded-string scan
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', 'venv',
+             'test', 'tests', '__tests__', 'spec', '__mocks__'}
+TEST_MARKERS = ('.test.', '.spec.')
+
+# Per-file scan results, keyed by content hash; bump the version with the patterns
+STRINGS_CACHE_FILE = Path(".agent") / ".cache" / "i18n_strings.json"
+SCAN_VERSION = 1
+
+# Directories whose JSON files are translations (plus <dir>/messages/*.json)
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}
+
+# Locale completeness result, reused while no locale file changes
+LOCALE_CACHE_FILE = Path(".agent") / ".cache" / "i18n_locales.json"
+# Bump when the completeness report changes (invalidates LOCALE_CACHE_FILE)
+LOCALE_INDEX_VERSION = 2
 
 def find_locale_files(project_path: Path) -> list:
     """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
+    root = project_path.resolve()
+    cache = get_cache(root)
     
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    # Completeness is a whole-project invariant: ignore any change scope
+    for f in cache.files(('.json', '.po'), under=root, scoped=False):
+        if f.suffix == '.po':  # gettext
+            files.append(f)
+            continue
+        dirs = f.relative_to(root).parts[:-1]
+        if not LOCALE_DIRS.isdisjoint(dirs) or (dirs and dirs[-1] == 'messages'):
+            files.append(f)
     
-    return [f for f in files if 'node_modules' not in str(f)]
+    return files
+
+JSON_TOKEN_RE = re.compile(r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<punct>[{}\[\]:,])|(?P<scalar>[^\s{}\[\]:,"]+))')
+JSON_CHUNK_CHARS = 1 << 16
+# Locale files above this size are read incrementally instead of json.load()-ed
+LARGE_LOCALE_BYTES = 8 << 20
+
+
+def _json_tokens(stream):
+    """(kind, text) tokens of a JSON document, read from `stream` in chunks."""
+    buffer, pos, eof = '', 0, False
+    while True:
+        m = JSON_TOKEN_RE.match(buffer, pos)
+        # A token touching the end of the buffer may continue in the next chunk
+        if not eof and (m is None or m.end() == len(buffer)):
+            chunk = stream.read(JSON_CHUNK_CHARS)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+        if m is None:
+            if buffer[pos:].strip():
+                raise ValueError(f"invalid JSON near {buffer[pos:pos + 20]!r}")
+            return
+        pos = m.end()
+        yield m.lastgroup, m.group(m.lastgroup)
+
+
+def iter_leaf_keys(stream):
+    """
+    Dotted paths of every non-object value in a JSON object ('a.b.c'), read
+    incrementally: the document is never materialized, so memory stays
+    bounded by nesting depth rather than file size. Arrays are leaves, empty
+    objects contribute nothing.
+    """
+    tokens = _json_tokens(stream)
+    first = next(tokens, None)
+    if first != ('punct', '{'):
+        raise ValueError("locale file is not a JSON object")
 
-def check_locale_completeness(locale_files: list) -> dict:
-    """Check if all locales have the same keys."""
+    prefixes = ['']       # dotted path of each open object
+    key = None            # pending key in the innermost object
+    for kind, text in tokens:
+        if kind == 'punct':
+            if text == '}':
+                prefixes.pop()
+                if not prefixes:
+                    return
+            elif text == '{':
+                if key is None:
+                    raise ValueError("object without a key")
+                prefixes.append(key)
+                key = None
+            elif text == '[':
+                if key is None:
+                    raise ValueError("array without a key")
+                yield key
+                key = None
+                depth = 1
+                for skip_kind, skip_text in tokens:
+                    if skip_kind == 'punct' and skip_text in '[{':
+                        depth += 1
+                    elif skip_kind == 'punct' and skip_text in ']}':
+                        depth -= 1
+                        if depth == 0:
+                            break
+            elif text == ']':
+                raise ValueError("unbalanced ']'")
+        elif key is None:
+            # A string in key position: the next member's name
+            name = json.loads(text) if kind == 'string' else text
+            key = f"{prefixes[-1]}.{name}" if prefixes[-1] else name
+        else:
+            yield key
+            key = None
+    raise ValueError("unterminated JSON object")
+
+
+def leaf_keys(data: dict):
+    """Dotted paths of every non-object value in a parsed JSON object."""
+    stack = [('', data)]
+    while stack:
+        prefix, obj = stack.pop()
+        for k, v in obj.items():
+            key = f"{prefix}.{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((key, v))
+            else:
+                yield key
+
+
+def read_locale_keys(path: Path):
+    """Leaf keys of a locale file; large files are streamed rather than loaded."""
+    with open(path, encoding='utf-8', errors='replace') as stream:
+        if os.fstat(stream.fileno()).st_size > LARGE_LOCALE_BYTES:
+            yield from iter_leaf_keys(stream)
+            return
+        data = json.load(stream)
+    if not isinstance(data, dict):
+        raise ValueError("locale file is not a JSON object")
+    yield from leaf_keys(data)
+
+
+def locale_of(locale_file: Path, root: Path) -> tuple:
+    """
+    (language, namespace) of a JSON locale file: locales/he/common.json is
+    ('he', 'common'); a flat catalogue such as locales/he.json or
+    messages/he.json is ('he', '').
+    """
+    parent = locale_file.parent.name
+    if parent in LOCALE_DIRS or parent == 'messages' or locale_file.parent == root:
+        return locale_file.stem, ''
+    return parent, locale_file.stem
+
+
+def check_locale_completeness(locale_files: list, root: Path = None) -> dict:
+    """
+    Check that all locales have the same keys. Builds one index over the
+    union of keys (namespace -> key -> bitmask of the languages that have it)
+    in a single pass over the files, then derives the missing/extra matrix:
+    a language misses a key some other language has; a key only one
+    language has is extra there. Cost is linear in keys x languages.
+    """
     issues = []
     passed = []
     
     if not locale_files:
         return {'passed': [], 'issues': ["[!] No locale files found"]}
     
-    # Group by parent folder (language)
-    locales = {}
-    for f in locale_files:
-        if f.suffix == '.json':
-            try:
-                lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
-                if lang not in locales:
-                    locales[lang] = {}
-                locales[lang][f.stem] = set(flatten_keys(content))
-            except:
-                continue
+    root = (root or Path('.')).resolve()
+    langs = []                # bit i <-> langs[i]
+    index = {}                # namespace -> {key: language bitmask}
+    unreadable = []
+    for f in sorted(locale_files):
+        if f.suffix != '.json':
+            continue
+        lang, namespace = locale_of(f, root)
+        if lang not in langs:
+            langs.append(lang)
+        bit = 1 << langs.index(lang)
+        keys = index.setdefault(namespace, {})
+        try:
+            for key in read_locale_keys(f):
+                keys[key] = keys.get(key, 0) | bit
+        except (OSError, ValueError):
+            unreadable.append(f.name)
     
-    if len(locales) < 2:
+    if unreadable:
+        issues.append(f"[!] {len(unreadable)} locale file(s) could not be parsed: {', '.join(unreadable[:3])}")
+    
+    if len(langs) < 2:
         passed.append(f"[OK] Found {len(locale_files)} locale file(s)")
         return {'passed': passed, 'issues': issues}
     
-    passed.append(f"[OK] Found {len(locales)} language(s): {', '.join(locales.keys())}")
+    passed.append(f"[OK] Found {len(langs)} language(s): {', '.join(langs)}")
     
-    # Compare keys across locales
-    all_langs = list(locales.keys())
-    base_lang = all_langs[0]
+    # Missing/extra matrix: one walk over the index, touching only absent bits
+    everyone = (1 << len(langs)) - 1
+    matrix = {}               # (lang, namespace) -> [missing keys, extra keys]
+    total_keys = 0
+    for namespace, keys in index.items():
+        total_keys += len(keys)
+        for key, mask in keys.items():
+            absent = everyone & ~mask
+            if not absent:
+                continue
+            if mask & (mask - 1) == 0:  # a single language has it
+                matrix.setdefault((mask.bit_length() - 1, namespace), [[], []])[1].append(key)
+            while absent:
+                low = absent & -absent
+                matrix.setdefault((low.bit_length() - 1, namespace), [[], []])[0].append(key)
+                absent ^= low
     
-    for namespace in locales.get(base_lang, {}):
-        base_keys = locales[base_lang].get(namespace, set())
-        
-        for lang in all_langs[1:]:
-            other_keys = locales.get(lang, {}).get(namespace, set())
-            
-            missing = base_keys - other_keys
-            if missing:
-                issues.append(f"[X] {lang}/{namespace}: Missing {len(missing)} keys")
-            
-            extra = other_keys - base_keys
-            if extra:
-                issues.append(f"[!] {lang}/{namespace}: {len(extra)} extra keys")
-    
-    if not issues:
+    passed.append(f"[OK] Key index: {total_keys} keys in {len(index)} namespace(s)")
+    
+    for (lang_bit, namespace), (missing, extra) in sorted(
+            matrix.items(), key=lambda item: (langs[item[0][0]], item[0][1])):
+        where = f"{langs[lang_bit]}/{namespace}" if namespace else langs[lang_bit]
+        if missing:
+            sample = ', '.join(sorted(missing)[:3]) + (', ...' if len(missing) > 3 else '')
+            issues.append(f"[X] {where}: Missing {len(missing)} keys ({sample})")
+        if extra:
+            issues.append(f"[!] {where}: {len(extra)} extra keys (only in this language)")
+    
+    if not matrix:
         passed.append("[OK] All locales have matching keys")
     
     return {'passed': passed, 'issues': issues}
 
-def flatten_keys(d, prefix=''):
-    """Flatten nested dict keys."""
-    keys = set()
-    for k, v in d.items():
-        new_key = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            keys.update(flatten_keys(v, new_key))
-        else:
-            keys.add(new_key)
-    return keys
+def cached_locale_completeness(project_path: Path, locale_files: list) -> dict:
+    """
+    check_locale_completeness(), reused from the last run while every locale
+    file has the same size and mtime. Keeps changed-files runs independent of
+    how large the translation catalogue is.
+    """
+    digest = hashlib.sha256(f"index-v{LOCALE_INDEX_VERSION}\n".encode())
+    for f in sorted(locale_files):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        digest.update(f"{f}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    fingerprint = digest.hexdigest()
+
+    cache_path = project_path.resolve() / LOCALE_CACHE_FILE
+    try:
+        stored = json.loads(cache_path.read_text(encoding='utf-8'))
+        if stored.get('fingerprint') == fingerprint:
+            return stored['result']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    result = check_locale_completeness(locale_files, project_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({'fingerprint': fingerprint, 'result': result}),
+                              encoding='utf-8')
+    except OSError:
+        pass
+    return result
+
+def scan_source(content: str, file_type: str) -> dict:
+    """
+    Hardcoded-string findings for one file: {'i18n': bool, 'findings': [[line, text], ...]}.
+    Files that already use i18n are not pattern-scanned at all; overlapping
+    matches ending at the same offset are reported once.
+    """
+    if I18N_RE.search(content):
+        return {'i18n': True, 'findings': []}
+
+    matches = {}
+    for pattern in COMPILED_PATTERNS.get(file_type, ()):
+        for m in pattern.finditer(content):
+            matches.setdefault(m.end(), m)
+
+    findings = []
+    line, offset = 1, 0
+    for m in sorted(matches.values(), key=lambda m: m.start()):
+        line += content.count('\n', offset, m.start())
+        offset = m.start()
+        findings.append([line, ' '.join(m.group().split())[:60]])
+    return {'i18n': False, 'findings': findings}
+
+
+def _load_strings_cache(root: Path) -> dict:
+    try:
+        data = json.loads((root / STRINGS_CACHE_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != SCAN_VERSION:
+        return {}
+    return data.get('files', {})
+
+
+def _save_strings_cache(root: Path, known: dict) -> None:
+    path = root / STRINGS_CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'version': SCAN_VERSION, 'files': known}), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def find_code_files(project_path: Path) -> list:
+    """Source files for the hardcoded-string scan (tests and build output excluded)."""
+    root = project_path.resolve()
+    files = get_cache(root).files(tuple(CODE_EXTENSIONS), under=root)
+    return [f for f in files
+            if SKIP_DIRS.isdisjoint(f.relative_to(root).parts[:-1])
+            and not any(marker in f.name for marker in TEST_MARKERS)]
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
+
+def check_hardcoded_strings(project_path: Path, on_finding=None, use_cache: bool = True) -> dict:
+    """
+    Check every code file for hardcoded strings. Scan results are cached per
+    content hash in STRINGS_CACHE_FILE; `on_finding(location, text)` is called
+    for each finding as files are processed.
+    """
     issues = []
     passed = []
     
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
-    
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    root = project_path.resolve()
+    cache = get_cache(root)
+    code_files = find_code_files(project_path)
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
     
+    known = _load_strings_cache(root) if use_cache else {}
+    live = set()
     files_with_i18n = 0
     files_with_hardcoded = 0
-    hardcoded_examples = []
+    total_findings = 0
     
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
-        except:
+    for file_path in code_files:
+        content = read_source(file_path)
+        if content is None:
             continue
+        file_type = CODE_EXTENSIONS.get(file_path.suffix, 'jsx')
+        digest = hashlib.sha1(f"{file_type}\0{content}".encode('utf-8', 'replace')).hexdigest()
+        live.add(digest)
+        result = known.get(digest)
+        if result is None:
+            result = known[digest] = scan_source(content, file_type)
+        
+        if result['i18n']:
+            files_with_i18n += 1
+        elif result['findings']:
+            files_with_hardcoded += 1
+            total_findings += len(result['findings'])
+            if on_finding is not None:
+                rel = cache.relpath(file_path)
+                for line, text in result['findings']:
+                    on_finding(f"{rel}:{line}", text)
+    
+    if use_cache:
+        # A scoped run only saw part of the tree: keep the other entries
+        if cache.scope is None:
+            known = {d: v for d, v in known.items() if d in live}
+        _save_strings_cache(root, known)
     
     passed.append(f"[OK] Analyzed {len(code_files)} code files")
     
@@ -188,16 +442,16 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         passed.append(f"[OK] {files_with_i18n} files use i18n")
     
     if files_with_hardcoded > 0:
-        issues.append(f"[X] {files_with_hardcoded} files may have hardcoded strings")
-        for ex in hardcoded_examples:
-            issues.append(f"   → {ex}")
+        issues.append(f"[X] {files_with_hardcoded} files may have hardcoded strings "
+                      f"({total_findings} strings)")
     else:
         passed.append("[OK] No obvious hardcoded strings detected")
     
-    return {'passed': passed, 'issues': issues}
+    return {'passed': passed, 'issues': issues, 'files_with_hardcoded': files_with_hardcoded,
+            'findings': total_findings}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def check(target: str, use_cache: bool = True) -> int:
+    """Print the report for a project; return the CLI exit code."""
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -206,12 +460,8 @@ def main():
     
     # Check locale files
     locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
+    locale_result = cached_locale_completeness(project_path, locale_files)
     
-    # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
-    
-    # Print results
     print("[LOCALE FILES]")
     print("-" * 40)
     for item in locale_result['passed']:
@@ -219,8 +469,12 @@ def main():
     for item in locale_result['issues']:
         print(f"  {item}")
     
+    # Check hardcoded strings, printing each finding as its file is scanned
     print("\n[CODE ANALYSIS]")
     print("-" * 40)
+    code_result = check_hardcoded_strings(
+        project_path, on_finding=lambda location, text: print(f"   → {location}: {text}"),
+        use_cache=use_cache)
     for item in code_result['passed']:
         print(f"  {item}")
     for item in code_result['issues']:
@@ -232,10 +486,30 @@ def main():
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] i18n CHECK: PASSED")
-        sys.exit(0)
+        return 0
     else:
         print(f"[X] i18n CHECK: {critical_issues} issues found")
-        sys.exit(1)
+        return 1
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hardcoded strings and locale completeness")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-scan every file instead of reusing results by content hash")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.project, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+    sys.exit(check(args.project, use_cache=not args.no_cache))
+
 
 if __name__ == "__main__":
     main()
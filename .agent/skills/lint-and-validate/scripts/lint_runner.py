@@ -5,6 +5,7 @@ Runs appropriate linters based on project type.
 
 Usage:
     python lint_runner.py <project_path>
+    python lint_runner.py <project_path> --staged   # eslint/ruff on staged files only
 
 Supports:
     - Node.js: npm run lint, npx tsc --noEmit
@@ -14,9 +15,16 @@ Supports:
 import subprocess
 import sys
 import json
+import argparse
 from pathlib import Path
 from datetime import datetime
 
+# Shared scanner library (.agent/.shared/scanner): --changed-since/--staged/--files-from
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from change_set import ChangeSetError, add_scope_arguments, resolve_scope  # noqa: E402
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -67,6 +75,30 @@ def detect_project_type(project_path: Path) -> dict:
     return result
 
 
+# Linters that take file arguments, and the files they understand. The rest
+# (npm run lint, tsc, mypy) check whole-project invariants and always run in full.
+FILE_LINTERS = {
+    "eslint": {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs'},
+    "ruff": {'.py'},
+}
+
+
+def scope_linters(linters: list, scope: list, project_path: Path) -> list:
+    """Point file-based linters at the changed files; drop them if none apply."""
+    scoped = []
+    for linter in linters:
+        extensions = FILE_LINTERS.get(linter["name"])
+        if extensions is None:
+            scoped.append(linter)
+            continue
+        files = sorted(str(p.relative_to(project_path)) for p in scope
+                       if p.suffix.lower() in extensions and project_path in p.parents)
+        if files:
+            cmd = [arg for arg in linter["cmd"] if arg != "."] + files
+            scoped.append({**linter, "cmd": cmd})
+    return scoped
+
+
 def run_linter(linter: dict, cwd: Path) -> dict:
     """Run a single linter and return results."""
     result = {
@@ -102,7 +134,15 @@ def run_linter(linter: dict, cwd: Path) -> dict:
 
 
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    parser = argparse.ArgumentParser(description="Run the project's linters and type checker")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    project_path = Path(args.project).resolve()
+    try:
+        scope = resolve_scope(project_path, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
     
     print(f"\n{'='*60}")
     print(f"[LINT RUNNER] Unified Linting")
@@ -112,6 +152,9 @@ def main():
     
     # Detect project type
     project_info = detect_project_type(project_path)
+    if scope is not None:
+        project_info["linters"] = scope_linters(project_info["linters"], scope, project_path)
+        print(f"Scope: {len(scope)} changed file(s)")
     print(f"Type: {project_info['type']}")
     print(f"Linters: {len(project_info['linters'])}")
     print("-"*60)
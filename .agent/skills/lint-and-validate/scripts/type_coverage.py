@@ -2,12 +2,36 @@
 """
 Type Coverage Checker - Measures TypeScript/Python type coverage.
 Identifies untyped functions, any usage, and type safety issues.
+
+Every file is analyzed: Python with `ast`, TypeScript (.ts/.tsx) with the
+shared JS/TS lexer (functions, methods and arrows; parameter and return
+annotations; `any`), with a per-directory breakdown. Per-file results are
+cached by content hash in .agent/.cache/type_coverage.json, so only changed
+files are re-parsed.
+
+Usage:
+    python type_coverage.py <project_path>
+    python type_coverage.py <project_path> --workers 4    # parse changed files in 4 processes
+    python type_coverage.py <project_path> --benchmark
 """
 import sys
+import ast
+import time
+import argparse
 import re
 import subprocess
 from pathlib import Path
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache, read_source  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+from js_lexer import tokenize, match_brackets  # noqa: E402
+from file_analysis import PARALLEL_MIN_FILES, analyze_files  # noqa: E402
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,40 +39,277 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
-    """Check TypeScript type coverage."""
+# ============================================================================
+#  TYPESCRIPT: LEXER-BASED ANALYSIS
+# ============================================================================
+
+# Bump when the per-file stats change shape or meaning (invalidates the cache)
+TS_ANALYZER_VERSION = 2
+TS_STAT_KEYS = ('functions', 'typed_functions', 'partially_typed', 'untyped_functions',
+                'params', 'annotated_params', 'annotated_returns', 'callbacks', 'any_count')
+# Directories listed in the per-directory breakdown (lowest coverage first)
+BREAKDOWN_ROWS = 10
+
+# `name(...) {` after these is control flow or a call, never a method
+NOT_METHOD_NAMES = {'if', 'for', 'while', 'switch', 'catch', 'with', 'return', 'function',
+                    'typeof', 'await', 'new', 'super', 'import', 'yield', 'delete', 'void'}
+MEMBER_START = {'{', '}', ';', ',', '*', '#'}
+MEMBER_MODIFIERS = {'public', 'private', 'protected', 'static', 'readonly', 'async', 'get', 'set',
+                    'override', 'abstract', 'declare', 'accessor'}
+# Punctuation that can appear inside a type annotation outside brackets
+TYPE_PUNCT = {'<', '>', '|', '&', '.', '?', '=>', '[', ']'}
+# `any` is a type (not a value named any) when it follows one of these or `as`
+ANY_TYPE_CONTEXT = {':', '<', ',', '|', '&', '['}
+# An arrow or function expression right after these is an inline callback
+# (or a JSX handler) and is contextually typed by whatever receives it
+CALLBACK_CONTEXT = {'(', ',', '{'}
+
+
+def _is(tok, value: str) -> bool:
+    return tok.kind == 'punct' and tok.value == value
+
+
+def _skip_angles(tokens, i: int, step: int) -> int:
+    """From a < (step 1) or > (step -1) at i, the index just past its partner."""
+    depth = 0
+    while 0 <= i < len(tokens):
+        tok = tokens[i]
+        if tok.kind == 'punct':
+            if tok.value == ('<' if step > 0 else '>'):
+                depth += 1
+            elif tok.value == ('>' if step > 0 else '<'):
+                depth -= 1
+                if depth == 0:
+                    return i + step
+            elif tok.value in ';{}':
+                break
+        i += step
+    return i
+
+
+def _annotation_start(tokens, partner, j: int) -> int:
+    """
+    Index of the ':' when tokens[..j] end in a type annotation (`: Foo<Bar>[]`,
+    `: { a: string }`), else -1. Scans backwards over at most 64 tokens.
+    """
+    angle = 0
+    for _ in range(64):
+        if j < 0:
+            return -1
+        tok = tokens[j]
+        if tok.kind == 'punct':
+            if tok.value == ':':
+                return j
+            if tok.value in ')]}' and partner[j] >= 0:
+                j = partner[j] - 1
+                continue
+            if tok.value == '>':
+                angle += 1
+            elif tok.value == '<':
+                angle -= 1
+            elif tok.value == ',' and angle > 0:
+                pass
+            elif tok.value not in TYPE_PUNCT:
+                return -1
+        elif tok.kind not in ('name', 'string', 'number', 'template'):
+            return -1
+        j -= 1
+    return -1
+
+
+def _params(tokens, partner, open_i: int, close_i: int) -> tuple:
+    """
+    (parameters, typed parameters) of a ( ) group. A parameter is typed when
+    annotated or given a default (its type is inferred from it); a TS `this`
+    parameter is not counted.
+    """
+    total = annotated = 0
+    i = open_i + 1
+    param_start, has_type, in_default, angle = i, False, False, 0
+    while i <= close_i:
+        tok = tokens[i]
+        if i == close_i or (_is(tok, ',') and angle == 0):
+            first = tokens[param_start] if param_start < i else None
+            if first is not None and not (first.kind == 'name' and first.value == 'this'):
+                total += 1
+                annotated += has_type or in_default
+            param_start, has_type, in_default, angle = i + 1, False, False, 0
+        elif tok.kind == 'punct':
+            if tok.value in '([{' and partner[i] > i:
+                i = partner[i] + 1
+                continue
+            if tok.value == ':' and angle == 0 and not in_default:
+                has_type = True
+            elif tok.value == '=' and angle == 0:
+                in_default = True
+            elif has_type and not in_default:
+                if tok.value == '<':
+                    angle += 1
+                elif tok.value == '>':
+                    angle -= 1
+        i += 1
+    return total, annotated
+
+
+def _member_name_start(tokens, i: int) -> bool:
+    """True when the name at i begins a class/object member (after modifiers)."""
+    j = i - 1
+    while j >= 0 and tokens[j].kind == 'name' and tokens[j].value in MEMBER_MODIFIERS:
+        j -= 1
+    return j < 0 or (tokens[j].kind == 'punct' and tokens[j].value in MEMBER_START)
+
+
+def analyze_typescript_source(text: str, jsx: bool = True) -> dict:
+    """
+    Per-file annotation stats from the JS/TS token stream. Functions are
+    function declarations/expressions, arrows and class/object methods; each
+    non-`this` parameter is a slot. Inline callbacks (arguments, JSX handlers)
+    are contextually typed, so they are counted apart rather than as untyped,
+    and so are the parameters of arrows assigned to an annotated variable
+    (`const C: FC<Props> = ({ a }) => ...`).
+
+    >>> analyze_typescript_source('const v: any = 1; let w = x as any[];')['any_count']
+    2
+    """
+    stats = dict.fromkeys(TS_STAT_KEYS, 0)
+    tokens = tokenize(text, jsx=jsx)
+    partner = match_brackets(tokens)
+    last = len(tokens) - 1
+
+    def record(open_i, close_i, context_i, returns_typed, has_return=True):
+        before = tokens[context_i] if context_i >= 0 else None
+        if before is not None and before.kind == 'name' and before.value == 'async':
+            context_i -= 1
+            before = tokens[context_i] if context_i >= 0 else None
+        if before is not None and before.kind == 'punct' and before.value in CALLBACK_CONTEXT:
+            stats['callbacks'] += 1
+            return
+        if open_i is None:  # single bare parameter: `x => ...`
+            total, annotated = 1, 0
+        else:
+            total, annotated = _params(tokens, partner, open_i, close_i)
+        if before is not None and _is(before, '=') and _annotation_start(tokens, partner, context_i - 1) >= 0:
+            annotated = total  # typed by the variable's declared type
+        stats['functions'] += 1
+        stats['params'] += total
+        stats['annotated_params'] += annotated
+        if has_return and returns_typed:
+            stats['annotated_returns'] += 1
+        if annotated == total:
+            stats['typed_functions'] += 1
+        elif annotated:
+            stats['partially_typed'] += 1
+        else:
+            stats['untyped_functions'] += 1
+
+    for i, tok in enumerate(tokens):
+        if tok.kind == 'name':
+            if tok.value == 'any':
+                prev = tokens[i - 1] if i else None
+                if prev is not None and (prev.kind == 'punct' and prev.value in ANY_TYPE_CONTEXT
+                                         or prev.kind == 'name' and prev.value == 'as'):
+                    stats['any_count'] += 1
+            elif tok.value == 'function':
+                j = i + 1
+                if j <= last and _is(tokens[j], '*'):
+                    j += 1
+                if j <= last and tokens[j].kind == 'name':
+                    j += 1
+                if j <= last and _is(tokens[j], '<'):
+                    j = _skip_angles(tokens, j, 1)
+                if j <= last and _is(tokens[j], '(') and partner[j] > j:
+                    close = partner[j]
+                    record(j, close, i - 1, close < last and _is(tokens[close + 1], ':'))
+
+        elif tok.kind != 'punct':
+            continue
+
+        elif tok.value == '=>' and i:
+            prev = tokens[i - 1]
+            if _is(prev, ')') and partner[i - 1] >= 0:
+                open_i = partner[i - 1]
+                if open_i and _is(tokens[open_i - 1], '>'):
+                    start = _skip_angles(tokens, open_i - 1, -1)  # <T,>(x: T) => ...
+                else:
+                    start = open_i
+                record(open_i, i - 1, start - 1, False)
+                continue
+            colon = _annotation_start(tokens, partner, i - 1)
+            if colon > 0 and _is(tokens[colon - 1], ')') and partner[colon - 1] >= 0:
+                open_i = partner[colon - 1]
+                start = _skip_angles(tokens, open_i - 1, -1) if open_i and _is(tokens[open_i - 1], '>') else open_i
+                record(open_i, colon - 1, start - 1, True)
+            elif prev.kind == 'name':
+                record(None, None, i - 2, False)
+
+        elif tok.value == '(' and i and partner[i] > i:
+            # Methods: `name(...) {`, `name(...): T`, `name<T>(...)`, `name?(...)`
+            j = i - 1
+            if _is(tokens[j], '>'):
+                j = _skip_angles(tokens, j, -1)
+            if j >= 0 and _is(tokens[j], '?'):
+                j -= 1
+            if j < 0 or tokens[j].kind not in ('name', 'string') or tokens[j].value in NOT_METHOD_NAMES:
+                continue
+            if j and tokens[j - 1].kind == 'name' and tokens[j - 1].value == 'function':
+                continue
+            close = partner[i]
+            after = tokens[close + 1] if close < last else None
+            if after is None or not (_is(after, '{') or _is(after, ':')):
+                continue
+            if not _member_name_start(tokens, j):
+                continue
+            record(i, close, -1, _is(after, ':'), has_return=tokens[j].value != 'constructor')
+
+    return stats
+
+
+def analyze_ts_source(text: str) -> dict:
+    return analyze_typescript_source(text, jsx=False)
+
+
+def analyze_tsx_source(text: str) -> dict:
+    return analyze_typescript_source(text, jsx=True)
+
+
+def _directory_key(relpath: str) -> str:
+    """Breakdown bucket: the first two directories of a file's path (src/components)."""
+    parts = relpath.replace('\\', '/').split('/')[:-1]
+    return '/'.join(parts[:2]) or '.'
+
+
+def _param_coverage(stats: dict):
+    return stats['annotated_params'] / stats['params'] * 100 if stats['params'] else None
+
+
+def check_typescript_coverage(project_path: Path, workers: int = 1, use_cache: bool = True) -> dict:
+    """Check TypeScript type coverage across every .ts/.tsx file (lexer, cached per content hash)."""
     issues = []
     passed = []
-    stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
+    stats = dict.fromkeys(TS_STAT_KEYS, 0)
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    cache = get_cache(project_path)
+    ts_files = [f for f in cache.files(('.ts',), under=project_path) if not f.name.endswith('.d.ts')]
+    tsx_files = cache.files(('.tsx',), under=project_path)
     
-    if not ts_files:
+    if not ts_files and not tsx_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
-    for file_path in ts_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
-            
-        except Exception:
-            continue
+    # .ts and .tsx lex differently (`<T>x` is a cast in one, JSX in the other)
+    per_file = analyze_files(ts_files, analyze_ts_source, 'typescript', TS_ANALYZER_VERSION,
+                             project_path, workers=workers, use_cache=use_cache,
+                             cache_file=COVERAGE_CACHE_FILE)
+    per_file += analyze_files(tsx_files, analyze_tsx_source, 'tsx', TS_ANALYZER_VERSION,
+                              project_path, workers=workers, use_cache=use_cache,
+                              cache_file=COVERAGE_CACHE_FILE)
+    
+    by_dir = {}
+    for path, file_stats in per_file:
+        bucket = by_dir.setdefault(_directory_key(cache.relpath(path)), dict.fromkeys(TS_STAT_KEYS, 0))
+        bucket['files'] = bucket.get('files', 0) + 1
+        for key in TS_STAT_KEYS:
+            stats[key] += file_stats.get(key, 0)
+            bucket[key] += file_stats.get(key, 0)
     
     # Analyze results
     if stats['any_count'] == 0:
@@ -58,61 +319,159 @@ def check_typescript_coverage(project_path: Path) -> dict:
     else:
         issues.append(f"[X] {stats['any_count']} 'any' types found (too many)")
     
-    if stats['total_functions'] > 0:
-        typed_ratio = (stats['total_functions'] - stats['untyped_functions']) / stats['total_functions'] * 100
+    typed_ratio = _param_coverage(stats)
+    if typed_ratio is not None:
+        detail = f"{stats['annotated_params']}/{stats['params']} params"
         if typed_ratio >= 80:
-            passed.append(f"[OK] Type coverage: {typed_ratio:.0f}%")
+            passed.append(f"[OK] Type coverage: {typed_ratio:.0f}% ({detail})")
         elif typed_ratio >= 50:
-            issues.append(f"[!] Type coverage: {typed_ratio:.0f}% (improve)")
+            issues.append(f"[!] Type coverage: {typed_ratio:.0f}% ({detail}; improve)")
         else:
-            issues.append(f"[X] Type coverage: {typed_ratio:.0f}% (too low)")
+            issues.append(f"[X] Type coverage: {typed_ratio:.0f}% ({detail}; too low)")
+    if stats['functions']:
+        passed.append(f"[OK] Functions: {stats['typed_functions']} typed, {stats['partially_typed']} partial, "
+                      f"{stats['untyped_functions']} untyped, {stats['annotated_returns']} with return types "
+                      f"(+{stats['callbacks']} inline callbacks, contextually typed)")
+    
+    passed.append(f"[OK] Analyzed {len(per_file)} TypeScript files")
     
-    passed.append(f"[OK] Analyzed {len(ts_files)} TypeScript files")
+    breakdown = []
+    rows = sorted(by_dir.items(), key=lambda item: (_param_coverage(item[1]) is None,
+                                                    _param_coverage(item[1]) or 0, item[0]))
+    for name, bucket in rows[:BREAKDOWN_ROWS]:
+        ratio = _param_coverage(bucket)
+        coverage = f"{ratio:3.0f}%" if ratio is not None else "   -"
+        breakdown.append(f"{name:<28} {bucket['files']:>5} files  {coverage} params  "
+                         f"{bucket['untyped_functions']:>4} untyped  {bucket['any_count']:>4} any")
+    if len(rows) > BREAKDOWN_ROWS:
+        breakdown.append(f"... {len(rows) - BREAKDOWN_ROWS} more directories")
     
-    return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
+    return {'type': 'typescript', 'files': len(per_file), 'passed': passed, 'issues': issues,
+            'stats': stats, 'breakdown': breakdown}
+
+# ============================================================================
+#  PYTHON: AST ANALYSIS
+# ============================================================================
+
+# Bump when the per-file stats change shape or meaning (invalidates the cache)
+PY_ANALYZER_VERSION = 1
+COVERAGE_CACHE_FILE = Path(".agent") / ".cache" / "type_coverage.json"
 
-def check_python_coverage(project_path: Path) -> dict:
-    """Check Python type hints coverage."""
+PY_STAT_KEYS = ('functions', 'fully_typed', 'partially_typed', 'untyped_functions',
+                'params', 'annotated_params', 'returns', 'annotated_returns',
+                'any_count', 'syntax_errors')
+
+
+def _mentions_any(annotation) -> int:
+    """Occurrences of Any / typing.Any inside an annotation expression."""
+    count = 0
+    for node in ast.walk(annotation):
+        if isinstance(node, ast.Name) and node.id == 'Any':
+            count += 1
+        elif isinstance(node, ast.Attribute) and node.attr == 'Any':
+            count += 1
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            # String (forward-reference) annotations
+            count += len(re.findall(r'\bAny\b', node.value))
+    return count
+
+
+def analyze_python_source(text: str) -> dict:
+    """
+    Per-file annotation stats from the AST. Every parameter is a slot except
+    the implicit self/cls of methods; every function has a return slot except
+    __init__ (always None). A function is fully typed when all its slots are
+    annotated, untyped when none are.
+    """
+    stats = dict.fromkeys(PY_STAT_KEYS, 0)
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        stats['syntax_errors'] = 1
+        return stats
+
+    methods = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            methods.update(id(child) for child in node.body
+                           if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)))
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AnnAssign):
+            stats['any_count'] += _mentions_any(node.annotation)
+            continue
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        args = node.args
+        params = args.posonlyargs + args.args
+        decorators = {d.id for d in node.decorator_list if isinstance(d, ast.Name)}
+        if id(node) in methods and params and 'staticmethod' not in decorators:
+            params = params[1:]  # self / cls
+        params = params + args.kwonlyargs + [a for a in (args.vararg, args.kwarg) if a]
+
+        slots = len(params)
+        annotated = 0
+        for arg in params:
+            if arg.annotation is not None:
+                annotated += 1
+                stats['any_count'] += _mentions_any(arg.annotation)
+        stats['params'] += len(params)
+        stats['annotated_params'] += annotated
+
+        if node.name != '__init__':
+            slots += 1
+            stats['returns'] += 1
+            if node.returns is not None:
+                annotated += 1
+                stats['annotated_returns'] += 1
+                stats['any_count'] += _mentions_any(node.returns)
+
+        stats['functions'] += 1
+        if slots == 0 or annotated == slots:
+            stats['fully_typed'] += 1
+        elif annotated:
+            stats['partially_typed'] += 1
+        else:
+            stats['untyped_functions'] += 1
+
+    return stats
+
+
+def check_python_coverage(project_path: Path, workers: int = 1, use_cache: bool = True) -> dict:
+    """Check Python type hints coverage across every file (AST, cached per content hash)."""
     issues = []
     passed = []
-    stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    py_files = get_cache(project_path).files(('.py',), under=project_path)
+    stats = dict.fromkeys(PY_STAT_KEYS, 0)
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
-    for file_path in py_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
-            
-        except Exception:
-            continue
-    
-    total = stats['typed_functions'] + stats['untyped_functions']
+    per_file = analyze_files(py_files, analyze_python_source, 'python', PY_ANALYZER_VERSION,
+                             project_path, workers=workers, use_cache=use_cache,
+                             cache_file=COVERAGE_CACHE_FILE)
+    unparsable = []
+    for path, file_stats in per_file:
+        for key in PY_STAT_KEYS:
+            stats[key] += file_stats.get(key, 0)
+        if file_stats.get('syntax_errors'):
+            unparsable.append(get_cache(project_path).relpath(path))
     
-    if total > 0:
-        typed_ratio = stats['typed_functions'] / total * 100
+    slots = stats['params'] + stats['returns']
+    if slots > 0:
+        typed_ratio = (stats['annotated_params'] + stats['annotated_returns']) / slots * 100
+        detail = (f"{stats['annotated_params']}/{stats['params']} params, "
+                  f"{stats['annotated_returns']}/{stats['returns']} returns")
         if typed_ratio >= 70:
-            passed.append(f"[OK] Type hints coverage: {typed_ratio:.0f}%")
+            passed.append(f"[OK] Type hints coverage: {typed_ratio:.0f}% ({detail})")
         elif typed_ratio >= 40:
-            issues.append(f"[!] Type hints coverage: {typed_ratio:.0f}%")
+            issues.append(f"[!] Type hints coverage: {typed_ratio:.0f}% ({detail})")
         else:
-            issues.append(f"[X] Type hints coverage: {typed_ratio:.0f}% (add type hints)")
+            issues.append(f"[X] Type hints coverage: {typed_ratio:.0f}% ({detail}; add type hints)")
+        passed.append(f"[OK] Functions: {stats['fully_typed']} fully typed, "
+                      f"{stats['partially_typed']} partial, {stats['untyped_functions']} untyped")
     
     if stats['any_count'] == 0:
         passed.append("[OK] No 'Any' types found")
@@ -121,12 +480,80 @@ def check_python_coverage(project_path: Path) -> dict:
     else:
         issues.append(f"[X] {stats['any_count']} 'Any' types found")
     
-    passed.append(f"[OK] Analyzed {len(py_files)} Python files")
+    if unparsable:
+        shown = ', '.join(unparsable[:3]) + (', ...' if len(unparsable) > 3 else '')
+        issues.append(f"[!] {len(unparsable)} file(s) could not be parsed: {shown}")
+    
+    passed.append(f"[OK] Analyzed {len(per_file)} Python files")
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def _regex_sample_python(files: list) -> int:
+    """The pre-AST estimate (first 30 files, regex), kept for --benchmark."""
+    typed = 0
+    for file_path in files[:30]:
+        content = read_source(file_path) or ''
+        typed += len(re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content))
+        typed += len(re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content))
+        re.findall(r'def\s+\w+\s*\(', content)
+        re.findall(r':\s*Any\b', content)
+    return typed
+
+
+def _regex_sample_typescript(files: list) -> int:
+    """The pre-lexer estimate (first 30 files, regex), kept for --benchmark."""
+    typed = 0
+    for file_path in files[:30]:
+        content = read_source(file_path) or ''
+        re.findall(r':\s*any\b', content)
+        re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
+        re.findall(r'=\s*\([^:)]*\)\s*=>', content)
+        typed += len(re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content))
+        typed += len(re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content))
+    return typed
+
+
+def benchmark(target: str, workers: int = 0) -> None:
+    """Time the 30-file regex samples against full coverage: serial, parallel, cached."""
+    project_path = Path(target)
+    cache = get_cache(project_path)
+    languages = [
+        ('Python', 'ast', cache.files(('.py',), under=project_path), _regex_sample_python,
+         analyze_python_source, 'python', PY_ANALYZER_VERSION),
+        ('TSX', 'lexer', cache.files(('.tsx',), under=project_path), _regex_sample_typescript,
+         analyze_tsx_source, 'tsx', TS_ANALYZER_VERSION),
+    ]
+    for language, method, files, regex_sample, analyzer, section, version in languages:
+        for path in files:
+            read_source(path)  # Warm the source cache so only analysis is timed
+
+        timings = {}
+        start = time.perf_counter()
+        regex_sample(files)
+        timings['regex, 30 files'] = time.perf_counter() - start
+
+        runs = [(f'{method}, serial', 1, False), (f'{method}, parallel', workers, False),
+                (f'{method}, cached', 1, True)]
+        reports = {}
+        for label, count, use_cache in runs:
+            if use_cache:
+                analyze_files(files, analyzer, section, version, project_path, workers=1,
+                              cache_file=COVERAGE_CACHE_FILE)  # Fill the cache
+            start = time.perf_counter()
+            reports[label] = analyze_files(files, analyzer, section, version, project_path,
+                                           workers=count, use_cache=use_cache, cache_file=COVERAGE_CACHE_FILE)
+            timings[label] = time.perf_counter() - start
+
+        print(f"\n[TYPE COVERAGE BENCHMARK] {len(files)} {language} files in {target}")
+        print("-" * 50)
+        for label, seconds in timings.items():
+            print(f"  {label:<18} {seconds:7.3f}s")
+        same = len({repr(report) for report in reports.values()}) == 1
+        print(f"  identical stats: {same}")
+
+
+def check(target: str, workers: int = 1, use_cache: bool = True) -> int:
+    """Print the report for a project; return the CLI exit code."""
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -136,18 +563,18 @@ def main():
     results = []
     
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, workers=workers, use_cache=use_cache)
     if ts_result['files'] > 0:
         results.append(ts_result)
     
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, workers=workers, use_cache=use_cache)
     if py_result['files'] > 0:
         results.append(py_result)
     
     if not results:
         print("[!] No TypeScript or Python files found.")
-        sys.exit(0)
+        return 0
     
     # Print results
     critical_issues = 0
@@ -160,14 +587,48 @@ def main():
             print(f"  {item}")
             if item.startswith("[X]"):
                 critical_issues += 1
+        if result.get('breakdown'):
+            print("\n  By directory (lowest coverage first):")
+            for line in result['breakdown']:
+                print(f"    {line}")
     
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
-        sys.exit(0)
+        return 0
     else:
         print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
-        sys.exit(1)
+        return 1
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Type coverage for TypeScript and Python sources")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--workers", type=int, default=0,
+                        help=f"Worker processes for parsing changed files (0 = one per CPU; "
+                             f"used once {PARALLEL_MIN_FILES}+ files need parsing)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse every file instead of reusing results by content hash")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare the old 30-file regex samples with full coverage, then exit")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.project, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+    
+    if args.benchmark:
+        benchmark(args.project, args.workers)
+        sys.exit(0)
+    
+    sys.exit(check(args.project, workers=args.workers, use_cache=not args.no_cache))
+
 
 if __name__ == "__main__":
     main()
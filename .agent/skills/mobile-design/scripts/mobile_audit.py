@@ -69,23 +69,110 @@ import sys
 import os
 import re
 import json
+import time
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache, read_head, read_source  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+
+# Immutable per-file outcome; safe to return from worker processes and merge later.
+# `checked` is False when the file could not be read (non-mobile files still count).
+FileResult = namedtuple('FileResult', ['path', 'checked', 'issues', 'warnings', 'passed'])
+
+# Framework markers live in the import header; peek at this much before reading the rest
+HEADER_SNIFF_CHARS = 8 * 1024
+FRAMEWORK_MARKERS = re.compile(r"react-native|@react-navigation|React\.Native|import 'package:flutter|MaterialApp|Widget\.build")
+
+# Dependencies that make a package.json a mobile project
+MOBILE_DEPENDENCIES = ('react-native', 'expo')
+MOBILE_DEPENDENCY_PREFIXES = ('react-native-', '@react-native', '@react-navigation/', 'expo-', '@expo/')
+MANIFEST_SEARCH_DEPTH = 3
+
+
+def is_mobile_manifest(filepath: str) -> bool:
+    """True if a package.json or pubspec.yaml declares React Native / Expo / Flutter."""
+    text = read_source(filepath)
+    if text is None:
+        return False
+
+    if os.path.basename(filepath) == 'pubspec.yaml':
+        return bool(re.search(r'^\s*flutter\s*:', text, re.MULTILINE))
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return False
+    names = set()
+    for section in ('dependencies', 'devDependencies', 'peerDependencies'):
+        deps = data.get(section)
+        if isinstance(deps, dict):
+            names.update(deps)
+    return any(n in MOBILE_DEPENDENCIES or n.startswith(MOBILE_DEPENDENCY_PREFIXES) for n in names)
+
+
+def detect_mobile_project(directory: str):
+    """
+    Project-level pass over package.json / pubspec.yaml manifests (a few levels deep).
+    Returns True if any declares a mobile framework, False if manifests exist but none do,
+    and None if there are no manifests to judge by.
+    """
+    cache = get_cache(directory)
+    seen_manifest = False
+
+    # Project detection ignores any change scope: manifests rarely change with the code
+    manifests = cache.files((), under=directory, names=('package.json', 'pubspec.yaml'),
+                            skip_dirs=MobileAuditor.PLATFORM_DIRS, scoped=False)
+    for path in manifests:
+        parts = Path(os.path.relpath(path, os.path.abspath(directory))).parts[:-1]
+        if len(parts) >= MANIFEST_SEARCH_DEPTH or any(p.startswith('.') for p in parts):
+            continue
+        seen_manifest = True
+        if is_mobile_manifest(str(path)):
+            return True
+
+    return False if seen_manifest else None
+
+
+def audit_path(filepath: str) -> FileResult:
+    """Audit a single file with a fresh auditor and return its findings."""
+    auditor = MobileAuditor()
+    auditor.audit_file(filepath)
+    return FileResult(filepath, auditor.files_checked > 0, tuple(auditor.issues),
+                      tuple(auditor.warnings), auditor.passed_count)
+
+
 class MobileAuditor:
+    EXTENSIONS = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
+    # Native platform projects; their sources are not React Native / Flutter UI
+    PLATFORM_DIRS = {'ios', 'android'}
+
     def __init__(self):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.skipped = None
 
     def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except:
+        header = read_head(filepath, HEADER_SNIFF_CHARS)
+        if header is None:
             return
-
         self.files_checked += 1
+        if not FRAMEWORK_MARKERS.search(header):
+            return  # Skip non-mobile files without reading the rest
+
+        content = read_source(filepath)
+        if content is None:
+            return
+
         filename = os.path.basename(filepath)
 
         # Detect framework
@@ -610,13 +697,43 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+    def merge(self, result: FileResult) -> None:
+        if not result.checked:
+            return
+        self.files_checked += 1
+        self.issues.extend(result.issues)
+        self.warnings.extend(result.warnings)
+        self.passed_count += result.passed
+
+    def find_files(self, directory: str) -> list:
+        cache = get_cache(directory)
+        files = cache.files(self.EXTENSIONS, under=directory, skip_dirs=self.PLATFORM_DIRS)
+        return [str(path) for path in files]
+
+    def audit_directory(self, directory: str, workers: int = 1, force: bool = False) -> None:
+        """
+        Audit every matching file under `directory`.
+        Unless `force` is set, the audit is skipped when the project's manifests
+        declare no mobile framework.
+        With workers != 1, files are audited in a process pool (0 = one per CPU);
+        results are merged in path order, so the report matches a serial run.
+        """
+        if not force and detect_mobile_project(directory) is False:
+            self.skipped = "No React Native, Expo or Flutter dependency in project manifests"
+            return
+
+        files = self.find_files(directory)
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(files) < 2:
+            for filepath in files:
+                self.audit_file(filepath)
+            return
+
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(audit_path, files, chunksize=chunksize):
+                self.merge(result)
 
     def get_report(self):
         return {
@@ -624,29 +741,71 @@ class MobileAuditor:
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
-            "compliant": len(self.issues) == 0
+            "compliant": len(self.issues) == 0,
+            "skipped": self.skipped
         }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
-        sys.exit(1)
+def benchmark(directory: str, workers: int, force: bool = False) -> None:
+    """Time a serial and a parallel directory audit and confirm identical reports."""
+    timings = {}
+    reports = {}
+    for label, count in (("serial", 1), ("parallel", workers or os.cpu_count() or 1)):
+        auditor = MobileAuditor()
+        start = time.perf_counter()
+        auditor.audit_directory(directory, workers=count, force=force)
+        timings[label] = time.perf_counter() - start
+        reports[label] = auditor.get_report()
+
+    files = reports["serial"]["files_checked"]
+    print(f"\n[MOBILE AUDIT BENCHMARK] {files} files in {directory}")
+    print("-" * 50)
+    for label, seconds in timings.items():
+        print(f"  {label:<9} {seconds:7.3f}s  ({seconds / max(files, 1) * 1000:.2f} ms/file)")
+    print(f"  speedup   {timings['serial'] / max(timings['parallel'], 1e-9):7.2f}x")
+    print(f"  identical reports: {reports['serial'] == reports['parallel']}")
 
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
 
+def main():
+    parser = argparse.ArgumentParser(description="Mobile UX and touch interaction audit")
+    parser.add_argument("path", help="File or directory to audit")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for directory audits (0 = one per CPU)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare serial and parallel directory audits, then exit")
+    parser.add_argument("--force", action="store_true",
+                        help="Audit files even if no mobile framework is declared in the project")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.path, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+
+    if args.benchmark:
+        benchmark(args.path, args.workers if args.workers != 1 else 0, force=args.force)
+        sys.exit(0)
+
+    sys.exit(check(args.path, is_json=args.json, workers=args.workers, force=args.force))
+
+
+def check(path: str, is_json: bool = False, workers: int = 1, force: bool = False) -> int:
+    """Print the audit report for a file or directory; return the CLI exit code."""
     auditor = MobileAuditor()
     if os.path.isfile(path):
         auditor.audit_file(path)
     else:
-        auditor.audit_directory(path)
+        auditor.audit_directory(path, workers=workers, force=force)
 
     report = auditor.get_report()
 
     if is_json:
         print(json.dumps(report, indent=2))
     else:
+        if report['skipped']:
+            print(f"\n[MOBILE AUDIT] Skipped: {report['skipped']}")
+            return 0
         print(f"\n[MOBILE AUDIT] {report['files_checked']} mobile files checked")
         print("-" * 50)
         if report['issues']:
@@ -661,10 +820,13 @@ def main():
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
-    sys.exit(0 if report['compliant'] else 1)
+    return 0 if report['compliant'] else 1
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
 
 
 if __name__ == "__main__":
-    # Fix missing import
-    import re
     main()
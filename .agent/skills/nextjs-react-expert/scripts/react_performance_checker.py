@@ -7,13 +7,766 @@ Based on Vercel Engineering best practices
 
 import os
 import re
+import sys
+import argparse
 import json
+import time
+from collections import namedtuple
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Iterator, Set
+
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import SourceCache, get_cache  # noqa: E402
+from js_lexer import Token, tokenize, match_brackets  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+LARGE_COMPONENT_CHARS = 10000
+
+# kind: 'static' | 'type' (erased at compile time) | 'dynamic' (import()) | 'require'
+ImportEdge = namedtuple('ImportEdge', ['source', 'specifier', 'target', 'kind', 'names', 'line'])
+
+IMPORT_FROM_RE = re.compile(
+    r"""^[ \t]*import\s+(?P<type>type\s+)?(?P<clause>[\w$*{}\s,]+?)\s+from\s+['"](?P<spec>[^'"\n]+)['"]""",
+    re.MULTILINE)
+IMPORT_BARE_RE = re.compile(r"""^[ \t]*import\s+['"](?P<spec>[^'"\n]+)['"]""", re.MULTILINE)
+EXPORT_FROM_RE = re.compile(
+    r"""^[ \t]*export\s+(?P<type>type\s+)?(?:\*(?:\s+as\s+[\w$]+)?|\{[^}]*\})\s*from\s+['"](?P<spec>[^'"\n]+)['"]""",
+    re.MULTILINE)
+DYNAMIC_IMPORT_RE = re.compile(r"""\bimport\(\s*['"](?P<spec>[^'"\n]+)['"]\s*\)""")
+REQUIRE_RE = re.compile(r"""\brequire\(\s*['"](?P<spec>[^'"\n]+)['"]\s*\)""")
+
+
+class SourceFile:
+    """A source file read once through the shared cache, with its line index."""
+
+    __slots__ = ('path', 'rel', 'content', 'size', '_cache', '_lines', '_tokens', '_brackets')
+
+    def __init__(self, path: Path, rel: str, content: str, size: int, cache: SourceCache):
+        self.path = path
+        self.rel = rel
+        self.content = content
+        self.size = size
+        self._cache = cache
+        self._lines = None
+        self._tokens = None
+        self._brackets = None
+
+    @property
+    def suffix(self) -> str:
+        return self.path.suffix
+
+    def line_of(self, offset: int) -> int:
+        if self._lines is None:
+            self._lines = self._cache.line_index(self.path)
+        return self._lines.line_of(offset)
+
+    def tokens(self) -> List['Token']:
+        """Lexed once on first use; JSX is off for plain .ts where <T>x is a cast."""
+        if self._tokens is None:
+            self._tokens = tokenize(self.content, jsx=self.suffix not in ('.ts', '.mts', '.cts'))
+        return self._tokens
+
+    def brackets(self) -> List[int]:
+        if self._brackets is None:
+            self._brackets = match_brackets(self.tokens())
+        return self._brackets
+
+
+def strip_json_comments(text: str) -> str:
+    """Drop // and /* */ comments from tsconfig-style JSON, leaving strings intact."""
+    out = []
+    i, n = 0, len(text)
+    while i < n:
+        ch = text[i]
+        if ch == '"':
+            j = i + 1
+            while j < n and text[j] != '"':
+                j += 2 if text[j] == '\\' else 1
+            out.append(text[i:j + 1])
+            i = j + 1
+        elif text.startswith('//', i):
+            i = text.find('\n', i)
+            i = n if i < 0 else i
+        elif text.startswith('/*', i):
+            i = text.find('*/', i + 2)
+            i = n if i < 0 else i + 2
+        else:
+            out.append(ch)
+            i += 1
+    return re.sub(r',(\s*[}\]])', r'\1', ''.join(out))
+
+
+def parse_import_names(clause: str) -> Tuple[str, ...]:
+    """Local binding names from an import clause, e.g. "A, { b as c }" -> ('A', 'c')."""
+    names = []
+    braced = re.search(r'\{([^}]*)\}', clause)
+    if braced:
+        for part in braced.group(1).split(','):
+            part = re.sub(r'^\s*type\s+', '', part).strip()
+            if part:
+                names.append(part.split(' as ')[-1].strip())
+        clause = clause[:braced.start()] + clause[braced.end():]
+    for part in clause.split(','):
+        part = part.strip()
+        if part.startswith('*'):
+            names.append(part.split(' as ')[-1].strip())
+        elif part:
+            names.append(part)
+    return tuple(names)
+
+
+# --- Scope-aware analyses -----------------------------------------------------
+
+PARALLEL_HELPERS = {'all', 'allSettled', 'race', 'any'}
+DECLARATION_KEYWORDS = {'const', 'let', 'var'}
+CONTINUATION_PUNCT = set('.,([{=+-*/%&|^!~?:<>') | {'=>', '&&', '||', '??', '?.', '...'}
+LEADING_CONTINUATION = set('.,)]}=+-*/%&|^?:<>') | {'=>', '&&', '||', '??', '?.'}
+EFFECT_HOOKS = {'useEffect', 'useLayoutEffect'}
+GLOBAL_OBJECTS = {'window', 'globalThis', 'self'}
+
+
+class _Statement:
+    __slots__ = ('start', 'awaits', 'parallel', 'declaring', 'declared', 'used', 'assigned')
+
+    def __init__(self, start: int):
+        self.start = start
+        self.awaits = False
+        self.parallel = False
+        self.declaring = False
+        self.declared: Set[str] = set()
+        self.used: Set[str] = set()
+        self.assigned = False
+
+
+class _Frame:
+    __slots__ = ('depth', 'statement', 'previous', 'names')
+
+    def __init__(self, start: int):
+        self.depth = 0          # ( and [ nesting inside this block
+        self.statement = _Statement(start)
+        self.previous: Optional[_Statement] = None
+        self.names: Set[str] = set()
+
+
+def find_sequential_awaits(tokens: List[Token]) -> List[int]:
+    """
+    Token offsets of independent sequential awaits: two consecutive statements
+    in the same block, each awaiting at statement level, where the second does
+    not use anything the first declared. Awaits of Promise.all/allSettled/...
+    are already parallel and never count.
+    """
+    findings = []
+    frames = [_Frame(0)]
+
+    def close_statement(frame: _Frame, next_start: int):
+        stmt = frame.statement
+        prev = frame.previous
+        if stmt.awaits and not stmt.parallel:
+            if (prev is not None and prev.awaits and not prev.parallel and prev.declared
+                    and not (prev.declared & stmt.used)):
+                findings.append(tokens[prev.start].start)
+            frame.previous = stmt
+        elif stmt.used or stmt.awaits:
+            frame.previous = None
+        frame.statement = _Statement(next_start)
+
+    for i, tok in enumerate(tokens):
+        frame = frames[-1]
+        stmt = frame.statement
+        kind, value = tok.kind, tok.value
+
+        # ASI: a line break at statement level ends the statement unless either side continues it
+        if (tok.nl and frame.depth == 0 and i > stmt.start
+                and not (kind == 'punct' and value in LEADING_CONTINUATION)):
+            last = tokens[i - 1]
+            if not (last.kind == 'punct' and last.value in CONTINUATION_PUNCT):
+                close_statement(frame, i)
+                stmt = frame.statement
+
+        if kind == 'name':
+            frame.names.add(value)
+            if i == stmt.start and value in DECLARATION_KEYWORDS:
+                stmt.declaring = True
+            elif stmt.declaring and not stmt.assigned:
+                stmt.declared.add(value)
+            else:
+                stmt.used.add(value)
+                if value == 'await' and frame.depth == 0:
+                    stmt.awaits = True
+                    if (i + 3 < len(tokens) and tokens[i + 1].value == 'Promise'
+                            and tokens[i + 2].value == '.' and tokens[i + 3].value in PARALLEL_HELPERS):
+                        stmt.parallel = True
+        elif kind != 'punct':
+            continue
+        elif value == ';' and frame.depth == 0:
+            close_statement(frame, i + 1)
+        elif value == '=' and stmt.declaring and frame.depth == 0:
+            stmt.assigned = True
+        elif value in '([' or (value == '{' and stmt.declaring and not stmt.assigned):
+            frame.depth += 1  # destructuring patterns stay part of the declaration
+        elif value in ')]' or (value == '}' and frame.depth > 0 and stmt.declaring and not stmt.assigned):
+            frame.depth = max(0, frame.depth - 1)
+        elif value == '{':
+            frames.append(_Frame(i + 1))
+        elif value == '}' and len(frames) > 1:
+            close_statement(frame, i + 1)
+            frames.pop()
+            parent = frames[-1]
+            parent.names |= frame.names
+            parent.statement.used |= frame.names
+            # A nested block breaks any await sequence in the parent
+            parent.previous = None
+
+    return findings
+
+
+def _call_arguments(tokens: List[Token], partner: List[int], i: int) -> Optional[Tuple[int, int]]:
+    """(open, close) indices of the argument list for a call at token i, if it is one."""
+    j = i + 1
+    if j < len(tokens) and tokens[j].kind == 'punct' and tokens[j].value == '(' and partner[j] > j:
+        return j, partner[j]
+    return None
+
+
+def find_effect_fetches(tokens: List[Token], partner: List[int]) -> List[int]:
+    """Token offsets of useEffect callbacks that call fetch() or axios directly."""
+    findings = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != 'name' or tok.value not in EFFECT_HOOKS:
+            continue
+        call = _call_arguments(tokens, partner, i)
+        if call is None:
+            continue
+        open_i, close_i = call
+        # Only the first argument (the effect callback); the deps array follows the first top-level comma
+        j = open_i + 1
+        while j < close_i:
+            t = tokens[j]
+            if t.kind == 'punct':
+                if t.value in '([{' and partner[j] > j:
+                    j = partner[j]
+                elif t.value == ',':
+                    break
+            j += 1
+        callback_end = j
+        for k in range(open_i + 1, callback_end):
+            t = tokens[k]
+            if t.kind != 'name':
+                continue
+            before = tokens[k - 1]
+            is_member = (before.kind == 'punct' and before.value in ('.', '?.')
+                         and tokens[k - 2].value not in GLOBAL_OBJECTS)
+            after = tokens[k + 1] if k + 1 < len(tokens) else None
+            if t.value == 'fetch' and not is_member and after is not None and after.value == '(':
+                findings.append(tok.start)
+                break
+            if t.value == 'axios' and not is_member and after is not None and after.value in ('.', '('):
+                findings.append(tok.start)
+                break
+    return findings
+
+
+# name, token offset, takes props, memoized
+Component = namedtuple('Component', ['name', 'start', 'has_props', 'memoized'])
+
+
+def find_components(tokens: List[Token], partner: List[int]) -> List[Component]:
+    """
+    Module-level React components: `function Name(...)` and
+    `const Name = (...) => ...` / `function` / `memo(...)` / `forwardRef(...)`.
+    A component counts as memoized if its initializer is memo(...) or its
+    name is passed to memo()/React.memo() anywhere in the file.
+    """
+    n = len(tokens)
+    memo_wrapped = set()
+    for i, tok in enumerate(tokens):
+        if tok.kind == 'name' and tok.value == 'memo' and i + 2 < n and tokens[i + 1].value == '(':
+            if tokens[i + 2].kind == 'name':
+                memo_wrapped.add(tokens[i + 2].value)
+
+    def is_component_name(value: str) -> bool:
+        return value[:1].isupper() and not value.isupper()
+
+    def params_nonempty(open_i: int) -> bool:
+        return partner[open_i] > open_i + 1
+
+    def skip_type_annotation(j: int) -> int:
+        """From a ':' after a binding, skip to the '=' at the same level."""
+        while j < n and not (tokens[j].kind == 'punct' and tokens[j].value in ('=', ';')):
+            if tokens[j].kind == 'punct' and tokens[j].value in '([{' and partner[j] > j:
+                j = partner[j]
+            j += 1
+        return j
+
+    components = []
+    i = 0
+    while i < n:
+        tok = tokens[i]
+        if tok.kind == 'punct' and tok.value in '([{' and partner[i] > i:
+            i = partner[i] + 1
+            continue
+        if tok.kind != 'name':
+            i += 1
+            continue
+
+        if tok.value == 'function' and i + 2 < n and tokens[i + 1].kind == 'name' \
+                and is_component_name(tokens[i + 1].value) and tokens[i + 2].value == '(':
+            name = tokens[i + 1].value
+            components.append(Component(name, tokens[i + 1].start, params_nonempty(i + 2), name in memo_wrapped))
+            i += 2
+            continue
+
+        if tok.value in DECLARATION_KEYWORDS and i + 2 < n and tokens[i + 1].kind == 'name' \
+                and is_component_name(tokens[i + 1].value):
+            name = tokens[i + 1].value
+            j = i + 2
+            if tokens[j].value == ':':
+                j = skip_type_annotation(j)
+            if j + 1 >= n or tokens[j].value != '=':
+                i += 1
+                continue
+            j += 1
+            if tokens[j].value == 'async':
+                j += 1
+            head = tokens[j]
+            following = tokens[j + 1] if j + 1 < n else None
+            has_props = None
+            memoized = name in memo_wrapped
+            if head.value in ('memo', 'React') and (head.value == 'memo' or (
+                    following is not None and following.value == '.' and j + 2 < n and tokens[j + 2].value == 'memo')):
+                has_props, memoized = True, True
+            elif head.value in ('forwardRef', 'React') and (head.value == 'forwardRef' or (
+                    following is not None and following.value == '.' and j + 2 < n
+                    and tokens[j + 2].value == 'forwardRef')):
+                has_props = True
+            elif head.value == 'function' and following is not None:
+                k = j + 1 if following.value == '(' else j + 2
+                if k < n and tokens[k].value == '(':
+                    has_props = params_nonempty(k)
+            elif head.value == '(' and partner[j] > j:
+                k = partner[j] + 1
+                if k < n and tokens[k].value == ':':
+                    while k < n and tokens[k].value != '=>':
+                        if tokens[k].value in '([{' and partner[k] > k:
+                            k = partner[k]
+                        k += 1
+                if k < n and tokens[k].value == '=>':
+                    has_props = params_nonempty(j)
+            elif head.kind == 'name' and following is not None and following.value == '=>':
+                has_props = True
+            if has_props is not None:
+                components.append(Component(name, tokens[i + 1].start, has_props, memoized))
+        i += 1
+    return components
+
+
+class ProjectModel:
+    """
+    One-time model of a JS/TS project: every source file read once, plus a
+    parsed import graph with forward (imports) and reverse (importers) edges.
+    The graph always covers the whole project; with a change scope on the
+    source cache, iter_files() yields only the changed files.
+    """
+
+    def __init__(self, project_path: Path):
+        self.root = Path(project_path)
+        self.files: Dict[str, SourceFile] = {}
+        self.imports: Dict[str, List[ImportEdge]] = {}
+        self.importers: Dict[str, List[ImportEdge]] = {}
+        self.aliases: List[Tuple[str, List[Path]]] = []
+        self.scope: Optional[Set[str]] = None
+        self.loaded = False
+
+    def load(self) -> 'ProjectModel':
+        if self.loaded:
+            return self
+        self.aliases = self._load_aliases()
+        cache = get_cache(self.root)
+        base = self.root.resolve()
+        if cache.scope is not None:
+            self.scope = {path.relative_to(base).as_posix() for path in cache.files(SOURCE_EXTENSIONS, under=base)}
+        for path in cache.files(SOURCE_EXTENSIONS, under=base, scoped=False):
+            if path.name.endswith('.d.ts'):
+                continue
+            content = cache.read(path)
+            if content is None:
+                continue
+            rel = path.relative_to(base).as_posix()
+            self.files[rel] = SourceFile(self.root / rel, rel, content, cache.entry(path).size, cache)
+
+        for rel, source in self.files.items():
+            edges = list(self._parse_imports(source))
+            self.imports[rel] = edges
+            for edge in edges:
+                if edge.target is not None:
+                    self.importers.setdefault(edge.target, []).append(edge)
+        self.loaded = True
+        return self
+
+    def _load_aliases(self) -> List[Tuple[str, List[Path]]]:
+        """Path aliases from tsconfig.json / jsconfig.json, e.g. '@/' -> [<root>/src/]."""
+        aliases = []
+        for name in ('tsconfig.json', 'jsconfig.json'):
+            config_path = self.root / name
+            if not config_path.exists():
+                continue
+            try:
+                config = json.loads(strip_json_comments(config_path.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                continue
+            options = config.get('compilerOptions') or {}
+            base = self.root / options.get('baseUrl', '.')
+            for pattern, targets in (options.get('paths') or {}).items():
+                prefix = pattern[:-1] if pattern.endswith('*') else pattern
+                dirs = [base / (t[:-1] if t.endswith('*') else t) for t in targets]
+                if not any(prefix == p for p, _ in aliases):
+                    aliases.append((prefix, dirs))
+        # Longest prefix first so '@/components/' wins over '@/'
+        aliases.sort(key=lambda a: len(a[0]), reverse=True)
+        return aliases
+
+    def _parse_imports(self, source: SourceFile) -> Iterator[ImportEdge]:
+        content = source.content
+        if 'import' not in content and 'require' not in content:
+            return
+        for m in IMPORT_FROM_RE.finditer(content):
+            kind = 'type' if m.group('type') else 'static'
+            yield self._edge(source, m, kind, parse_import_names(m.group('clause')))
+        for m in IMPORT_BARE_RE.finditer(content):
+            yield self._edge(source, m, 'static', ())
+        for m in EXPORT_FROM_RE.finditer(content):
+            yield self._edge(source, m, 'type' if m.group('type') else 'static', ())
+        for m in DYNAMIC_IMPORT_RE.finditer(content):
+            yield self._edge(source, m, 'dynamic', ())
+        for m in REQUIRE_RE.finditer(content):
+            yield self._edge(source, m, 'require', ())
+
+    def _edge(self, source: SourceFile, match, kind: str, names: Tuple[str, ...]) -> ImportEdge:
+        spec = match.group('spec')
+        return ImportEdge(source.rel, spec, self.resolve(source, spec), kind, names,
+                          source.line_of(match.start('spec')))
+
+    def resolve(self, source: SourceFile, specifier: str) -> Optional[str]:
+        """Resolve a specifier to a project file (relative path), or None for packages/assets."""
+        if specifier.startswith('.'):
+            bases = [source.path.parent / specifier]
+        else:
+            bases = [d / specifier[len(prefix):] for prefix, dirs in self.aliases
+                     if specifier.startswith(prefix) for d in dirs]
+        for base in bases:
+            base = Path(os.path.normpath(base))
+            candidates = [base] + [base.with_name(base.name + ext) for ext in SOURCE_EXTENSIONS]
+            candidates += [base / ('index' + ext) for ext in SOURCE_EXTENSIONS]
+            for candidate in candidates:
+                try:
+                    rel = candidate.relative_to(self.root).as_posix()
+                except ValueError:
+                    continue
+                if rel in self.files:
+                    return rel
+        return None
+
+    def in_scope(self, rel: str) -> bool:
+        return self.scope is None or rel in self.scope
+
+    def iter_files(self, extensions: Tuple[str, ...] = SOURCE_EXTENSIONS) -> Iterator[SourceFile]:
+        for source in self.files.values():
+            if source.suffix in extensions and self.in_scope(source.rel):
+                yield source
+
+    def static_importers(self, rel: str) -> List[ImportEdge]:
+        """Edges that pull `rel` into its importers' chunk (type-only and import() excluded)."""
+        return [e for e in self.importers.get(rel, []) if e.kind in ('static', 'require')]
+
+
+NODE_BUILTINS = {'fs', 'path', 'os', 'url', 'http', 'https', 'crypto', 'stream', 'util', 'events',
+                 'child_process', 'buffer', 'zlib', 'net', 'tls', 'readline', 'assert', 'process'}
+BUNDLE_SPLIT_MIN_BYTES = 30 * 1024
+
+
+def package_name(specifier: str) -> Optional[str]:
+    """'@scope/pkg/sub' -> '@scope/pkg', 'pkg/sub' -> 'pkg'; None for builtins and relative paths."""
+    if specifier.startswith(('.', '/', 'node:')):
+        return None
+    parts = specifier.split('/')
+    name = '/'.join(parts[:2]) if specifier.startswith('@') else parts[0]
+    return None if name in NODE_BUILTINS else name
+
+
+def is_test_file(rel: str) -> bool:
+    return bool(re.search(r'(^|/)(tests?|__tests__)/|\.(test|spec)\.[jt]sx?$', rel))
+
+
+def format_kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+class BundleEstimator:
+    """
+    Static initial-load estimate over the ProjectModel import graph.
+
+    Each entry (the index.html script and every route module in the pages
+    directory) loads its closure over static imports; import() is a chunk
+    boundary and type-only imports are erased. npm packages are graph nodes
+    too, linked through package-lock.json, so totals are reported with and
+    without node_modules. Package bytes come from a --package-sizes snapshot
+    or the installed package's entry file; otherwise they count as unsized.
+    """
+
+    def __init__(self, model: ProjectModel, pages_dir: str = 'src/pages',
+                 package_sizes: Optional[Dict[str, int]] = None):
+        self.model = model
+        self.pages_dir = pages_dir.strip('/') + '/'
+        self.package_sizes = dict(package_sizes or {})
+        self.lock_packages: Dict[str, dict] = {}
+        self.unsized_packages = set()
+        self.graph: Dict[str, List[Tuple[str, Optional[ImportEdge]]]] = {}
+        self.sizes: Dict[str, int] = {}
+        self.preloaded = set()
+
+    # --- Graph ---------------------------------------------------------------
+
+    def _load_lockfile(self) -> None:
+        lock_path = self.model.root / 'package-lock.json'
+        try:
+            self.lock_packages = json.loads(lock_path.read_text(encoding='utf-8')).get('packages', {})
+        except (OSError, ValueError):
+            self.lock_packages = {}
+
+    def _lock_key(self, name: str, parent_key: str = '') -> Optional[str]:
+        """npm v2/v3 lock lookup: nested node_modules first, then hoisted."""
+        key = f"{parent_key}/node_modules/{name}" if parent_key else f"node_modules/{name}"
+        while key not in self.lock_packages:
+            if not parent_key:
+                return None
+            parent_key = parent_key.rsplit('/node_modules/', 1)[0] if '/node_modules/' in parent_key else ''
+            key = f"{parent_key}/node_modules/{name}" if parent_key else f"node_modules/{name}"
+        return key
+
+    def _package_size(self, name: str) -> int:
+        if name in self.package_sizes:
+            return self.package_sizes[name]
+        pkg_dir = self.model.root / 'node_modules' / name
+        try:
+            manifest = json.loads((pkg_dir / 'package.json').read_text(encoding='utf-8'))
+            entry = manifest.get('module') or manifest.get('main') or 'index.js'
+            entry_path = pkg_dir / entry
+            if entry_path.is_dir() or not entry_path.suffix:
+                entry_path = next((c for c in (entry_path.with_suffix('.js'), entry_path / 'index.js')
+                                   if c.is_file()), entry_path)
+            size = entry_path.stat().st_size
+        except (OSError, ValueError, StopIteration):
+            self.unsized_packages.add(name)
+            size = 0
+        self.package_sizes[name] = size
+        return size
+
+    def _add_package(self, name: str, lock_key: Optional[str]) -> str:
+        node = f"pkg:{name}"
+        if node in self.graph:
+            return node
+        self.graph[node] = []
+        self.sizes[node] = self._package_size(name)
+        info = self.lock_packages.get(lock_key, {}) if lock_key else {}
+        for dep in info.get('dependencies', {}):
+            dep_node = self._add_package(dep, self._lock_key(dep, lock_key))
+            self.graph[node].append((dep_node, None))
+        return node
+
+    def build(self) -> 'BundleEstimator':
+        self.model.load()
+        self._load_lockfile()
+        for rel, source in self.model.files.items():
+            self.sizes[rel] = source.size
+            self.graph.setdefault(rel, [])
+        for rel, edges in self.model.imports.items():
+            for edge in edges:
+                if edge.kind not in ('static', 'require'):
+                    continue
+                if edge.target is not None:
+                    self.graph[rel].append((edge.target, edge))
+                    continue
+                name = package_name(edge.specifier)
+                lock_key = self._lock_key(name) if name else None
+                if lock_key or (name and (self.model.root / 'node_modules' / name).is_dir()):
+                    self.graph[rel].append((self._add_package(name, lock_key), edge))
+        return self
+
+    # --- Entries -------------------------------------------------------------
+
+    def app_entries(self) -> List[str]:
+        """Module scripts referenced from index.html."""
+        try:
+            html = (self.model.root / 'index.html').read_text(encoding='utf-8')
+        except OSError:
+            return []
+        entries = []
+        for src in re.findall(r'<script[^>]+type=["\']module["\'][^>]*src=["\']/?([^"\']+)["\']', html):
+            if src in self.model.files:
+                entries.append(src)
+        return entries
+
+    def _page_importers(self, rel: str) -> List[str]:
+        return [e.source for e in self.model.importers.get(rel, [])
+                if not e.source.startswith(self.pages_dir) and not is_test_file(e.source)
+                and e.kind != 'type']
+
+    def route_entries(self) -> List[str]:
+        """Modules in the pages directory imported from outside it (i.e. by a router)."""
+        return [rel for rel in self.model.files
+                if rel.startswith(self.pages_dir) and self._page_importers(rel)]
+
+    def router_entries(self) -> List[str]:
+        """Modules outside the pages directory that import route modules."""
+        routers = set()
+        for rel in self.route_entries():
+            routers.update(self._page_importers(rel))
+        return sorted(routers)
+
+    # --- Analysis ------------------------------------------------------------
+
+    def _reachable(self, entry: str) -> List[str]:
+        """Reverse postorder of nodes statically reachable from entry (iterative DFS)."""
+        seen = {entry} | self.preloaded
+        order = []
+        stack = [(entry, iter(self.graph[entry]))]
+        while stack:
+            node, children = stack[-1]
+            for child, _ in children:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append((child, iter(self.graph[child])))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+        order.reverse()
+        return order
+
+    def _dominators(self, order: List[str]) -> Dict[str, str]:
+        """Immediate dominators (Cooper, Harvey & Kennedy) over the reachable subgraph."""
+        index = {node: i for i, node in enumerate(order)}
+        preds: Dict[str, List[str]] = {node: [] for node in order}
+        for node in order:
+            for child, _ in self.graph[node]:
+                if child in preds:
+                    preds[child].append(node)
+
+        idom = {order[0]: order[0]}
+        changed = True
+        while changed:
+            changed = False
+            for node in order[1:]:
+                new_idom = None
+                for pred in preds[node]:
+                    if pred not in idom:
+                        continue
+                    if new_idom is None:
+                        new_idom = pred
+                        continue
+                    a, b = pred, new_idom
+                    while a != b:
+                        while index[a] > index[b]:
+                            a = idom[a]
+                        while index[b] > index[a]:
+                            b = idom[b]
+                    new_idom = a
+                if idom.get(node) != new_idom:
+                    idom[node] = new_idom
+                    changed = True
+        return idom
+
+    def analyze_entry(self, entry: str) -> Dict:
+        order = self._reachable(entry)
+        idom = self._dominators(order)
+
+        # Bytes each node keeps alive: itself plus everything it dominates
+        own = {node: self.sizes[node] for node in order}
+        dominated_src = {node: (0 if node.startswith('pkg:') else own[node]) for node in order}
+        dominated_all = dict(own)
+        for node in reversed(order[1:]):
+            parent = idom[node]
+            dominated_src[parent] += dominated_src[node]
+            dominated_all[parent] += dominated_all[node]
+
+        # An edge u -> v cuts v's dominated bytes iff u is v's only importer in this closure
+        importers: Dict[str, Dict[str, ImportEdge]] = {}
+        for node in order:
+            for child, edge in self.graph[node]:
+                if edge is not None and child in own:
+                    importers.setdefault(child, {}).setdefault(node, edge)
+        cuttable = []
+        for child, by_source in importers.items():
+            if len(by_source) == 1 and child != entry:
+                (edge,) = by_source.values()
+                cuttable.append((edge, child, dominated_src[child], dominated_all[child]))
+
+        packages = [n[4:] for n in order if n.startswith('pkg:')]
+        return {
+            'entry': entry,
+            'modules': len(order) - len(packages),
+            'packages': packages,
+            'source_bytes': dominated_src[entry],
+            'total_bytes': dominated_all[entry],
+            'cuttable': cuttable,
+        }
+
+    def estimate(self, top: int = 10) -> Dict:
+        """
+        Analyze the app shell (index.html entries) first; route and router
+        entries are then measured on top of it, since the shell is already loaded.
+        """
+        if not self.graph:
+            self.build()
+        results = []
+        shell = set()
+        for entry in self.app_entries():
+            results.append(self.analyze_entry(entry))
+            shell.update(self._reachable(entry))
+        self.preloaded = shell
+        for entry in self.router_entries() + self.route_entries():
+            if entry not in shell:
+                results.append(self.analyze_entry(entry))
+        self.preloaded = set()
+
+        # Aggregate per edge across every entry whose initial load it sits on
+        candidates: Dict[Tuple[str, str], Dict] = {}
+        for result in results:
+            for edge, target, src_bytes, all_bytes in result['cuttable']:
+                item = candidates.setdefault((edge.source, edge.specifier), {
+                    'file': edge.source, 'line': edge.line, 'specifier': edge.specifier,
+                    'target': target[4:] if target.startswith('pkg:') else target,
+                    'source_bytes': 0, 'total_bytes': 0, 'initial_bytes_cut': 0, 'entries': 0})
+                item['source_bytes'] = max(item['source_bytes'], src_bytes)
+                item['total_bytes'] = max(item['total_bytes'], all_bytes)
+                item['initial_bytes_cut'] += all_bytes
+                item['entries'] += 1
+
+        ranked = sorted(candidates.values(),
+                        key=lambda i: (-i['initial_bytes_cut'], -i['total_bytes'], i['file'], i['line']))
+        for result in results:
+            del result['cuttable']
+            result['packages'] = len(result['packages'])
+
+        return {
+            'entries': results,
+            'split_candidates': ranked[:top],
+            'unsized_packages': sorted(self.unsized_packages),
+        }
+
 
 class PerformanceChecker:
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, pages_dir: str = 'src/pages',
+                 package_sizes: Optional[Dict[str, int]] = None, top: int = 10):
         self.project_path = Path(project_path)
+        self.model = ProjectModel(self.project_path)
+        self.bundle_estimator = BundleEstimator(self.model, pages_dir, package_sizes)
+        self.bundle = None
+        self.top = top
         self.issues = []
         self.warnings = []
         self.passed = []
@@ -22,161 +775,161 @@ class PerformanceChecker:
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.model.iter_files(('.ts', '.tsx', '.js', '.jsx')):
+            if source.content.count('await') < 2:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: multiple awaits in sequence without Promise.all
-                sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
-
-                if sequential_awaits:
-                    self.issues.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Sequential awaits detected (waterfall)',
-                        'fix': 'Use Promise.all() for parallel fetching',
-                        'section': '1-async-eliminating-waterfalls.md'
-                    })
-            except Exception as e:
-                continue
+            # Independent awaits in consecutive statements of the same block
+            sequential_awaits = find_sequential_awaits(source.tokens())
+
+            if sequential_awaits:
+                self.issues.append({
+                    'file': source.rel,
+                    'line': source.line_of(sequential_awaits[0]),
+                    'type': 'CRITICAL',
+                    'issue': 'Sequential awaits detected (waterfall)',
+                    'fix': 'Use Promise.all() for parallel fetching',
+                    'section': '1-async-eliminating-waterfalls.md',
+                    'lines': [source.line_of(offset) for offset in sequential_awaits]
+                })
 
     def check_barrel_imports(self):
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for source in self.model.iter_files(('.ts', '.tsx', '.js', '.jsx')):
+            content = source.content
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: import from index files or barrel exports
-                barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
-                barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
-
-                if barrel_imports:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Potential barrel imports detected',
-                        'fix': 'Import directly from specific files',
-                        'section': '2-bundle-bundle-size-optimization.md'
-                    })
-            except Exception as e:
-                continue
+            # Pattern: import from index files or barrel exports
+            barrel_imports = [m.start() for m in re.finditer(r"import.*from\s+['\"](@/.*?)/index['\"]", content)]
+            barrel_imports += [m.start() for m in re.finditer(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)]
+
+            if barrel_imports:
+                self.warnings.append({
+                    'file': source.rel,
+                    'line': source.line_of(min(barrel_imports)),
+                    'type': 'CRITICAL',
+                    'issue': 'Potential barrel imports detected',
+                    'fix': 'Import directly from specific files',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_dynamic_imports(self):
         """Check if large components use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.model.iter_files(('.ts', '.tsx')):
+            # Check file size - if > 10KB, should probably use dynamic import
+            if len(source.content) <= LARGE_COMPONENT_CHARS:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
-                continue
+            # Reverse edges answer "who imports this statically" without re-reading the tree
+            importers = self.model.static_importers(source.rel)
+            if importers:
+                self.warnings.append({
+                    'file': importers[0].source,
+                    'line': importers[0].line,
+                    'type': 'CRITICAL',
+                    'issue': f'Large component {source.path.stem} imported statically',
+                    'fix': 'Use dynamic() for code splitting',
+                    'section': '2-bundle-bundle-size-optimization.md',
+                    'importers': sorted({e.source for e in importers})
+                })
 
     def check_useEffect_fetching(self):
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.model.iter_files(('.ts', '.tsx')):
+            if 'useEffect' not in source.content:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: fetch or axios in useEffect
-                if 'useEffect' in content:
-                    if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM-HIGH',
-                            'issue': 'Data fetching in useEffect',
-                            'fix': 'Consider using SWR or React Query for deduplication',
-                            'section': '4-client-client-side-data-fetching.md'
-                        })
-            except Exception as e:
-                continue
+            # fetch() or axios called inside the effect callback itself
+            effect_fetches = find_effect_fetches(source.tokens(), source.brackets())
+            if effect_fetches:
+                self.warnings.append({
+                    'file': source.rel,
+                    'line': source.line_of(effect_fetches[0]),
+                    'type': 'MEDIUM-HIGH',
+                    'issue': 'Data fetching in useEffect',
+                    'fix': 'Consider using SWR or React Query for deduplication',
+                    'section': '4-client-client-side-data-fetching.md'
+                })
 
     def check_missing_memoization(self):
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for source in self.model.iter_files(('.tsx',)):
+            # Module-level components that take props but are not wrapped in memo()
+            unmemoized = [c for c in find_components(source.tokens(), source.brackets())
+                          if c.has_props and not c.memoized]
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for component definitions without memo
-                components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
-
-                if components and 'React.memo' not in content and 'memo(' not in content:
-                    # Check if component receives props
-                    if 'props:' in content or 'Props>' in content:
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM',
-                            'issue': 'Component with props not memoized',
-                            'fix': 'Consider using React.memo if props are stable',
-                            'section': '5-rerender-re-render-optimization.md'
-                        })
-            except Exception as e:
-                continue
+            if unmemoized:
+                self.warnings.append({
+                    'file': source.rel,
+                    'line': source.line_of(unmemoized[0].start),
+                    'type': 'MEDIUM',
+                    'issue': 'Component with props not memoized',
+                    'fix': 'Consider using React.memo if props are stable',
+                    'section': '5-rerender-re-render-optimization.md',
+                    'components': [c.name for c in unmemoized]
+                })
 
     def check_image_optimization(self):
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for source in self.model.iter_files(('.ts', '.tsx', '.js', '.jsx')):
+            content = source.content
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for <img> tags instead of next/image
-                if '<img' in content and 'next/image' not in content:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'MEDIUM',
-                        'issue': 'Using <img> instead of next/image',
-                        'fix': 'Use next/image for automatic optimization',
-                        'section': '6-rendering-rendering-performance.md'
-                    })
-            except Exception as e:
+            # Check for <img> tags instead of next/image
+            if '<img' in content and 'next/image' not in content:
+                self.warnings.append({
+                    'file': source.rel,
+                    'line': source.line_of(content.index('<img')),
+                    'type': 'MEDIUM',
+                    'issue': 'Using <img> instead of next/image',
+                    'fix': 'Use next/image for automatic optimization',
+                    'section': '6-rendering-rendering-performance.md'
+                })
+
+    def check_bundle_size(self):
+        """Estimate initial JS per entry and rank static imports worth splitting (Section 2)"""
+        print("[*] Estimating initial bundle size per route...")
+
+        self.bundle = self.bundle_estimator.estimate(self.top)
+        for candidate in self.bundle['split_candidates']:
+            if candidate['total_bytes'] < BUNDLE_SPLIT_MIN_BYTES:
                 continue
+            self.warnings.append({
+                'file': candidate['file'],
+                'line': candidate['line'],
+                'type': 'HIGH',
+                'issue': f"Static import of {candidate['target']} adds {format_kb(candidate['total_bytes'])} "
+                         f"to the initial load of {candidate['entries']} entr{'y' if candidate['entries'] == 1 else 'ies'}",
+                'fix': 'Load it with React.lazy()/dynamic() behind a Suspense boundary',
+                'section': '2-bundle-bundle-size-optimization.md'
+            })
+
+    def print_bundle_estimate(self):
+        if not self.bundle:
+            return
+        print("\n[BUNDLE ESTIMATE] initial load per entry (static imports only)")
+        for entry in sorted(self.bundle['entries'], key=lambda e: -e['total_bytes'])[:self.top]:
+            print(f"  {format_kb(entry['total_bytes']):>10}  {entry['entry']}  "
+                  f"({entry['modules']} modules, {format_kb(entry['source_bytes'])} source, "
+                  f"{entry['packages']} packages)")
+
+        print("\n[SPLIT CANDIDATES] static imports that would cut the most initial bytes if dynamic")
+        for c in self.bundle['split_candidates']:
+            print(f"  {format_kb(c['initial_bytes_cut']):>10}  {c['file']}:{c['line']} -> {c['specifier']}  "
+                  f"({format_kb(c['total_bytes'])} deferred, {c['entries']} entries)")
+
+        unsized = self.bundle['unsized_packages']
+        if unsized:
+            print(f"\n  Note: {len(unsized)} npm packages have no known size and count as 0 bytes "
+                  f"(install node_modules or pass --package-sizes).")
 
     def generate_report(self):
         """Generate final report"""
@@ -187,14 +940,14 @@ class PerformanceChecker:
         print(f"\n[CRITICAL ISSUES] ({len([i for i in self.issues if i['type'] == 'CRITICAL'])})")
         for issue in self.issues:
             if issue['type'] == 'CRITICAL':
-                print(f"  - {issue['file']}")
+                print(f"  - {issue['file']}:{issue['line']}")
                 print(f"    Issue: {issue['issue']}")
                 print(f"    Fix: {issue['fix']}")
                 print(f"    Reference: {issue['section']}\n")
 
         print(f"\n[WARNINGS] ({len(self.warnings)})")
         for warning in self.warnings[:10]:  # Show first 10
-            print(f"  - {warning['file']}")
+            print(f"  - {warning['file']}:{warning['line']}")
             print(f"    Issue: {warning['issue']}")
             print(f"    Fix: {warning['fix']}")
             print(f"    Reference: {warning['section']}\n")
@@ -202,6 +955,8 @@ class PerformanceChecker:
         if len(self.warnings) > 10:
             print(f"  ... and {len(self.warnings) - 10} more warnings")
 
+        self.print_bundle_estimate()
+
         print("\n" + "="*60)
         print(f"SUMMARY:")
         print(f"  Critical Issues: {len([i for i in self.issues if i['type'] == 'CRITICAL'])}")
@@ -221,30 +976,116 @@ class PerformanceChecker:
         print("="*60)
         print(f"Scanning: {self.project_path}")
 
+        self.model.load()
+        edge_count = sum(len(edges) for edges in self.model.imports.values())
+        print(f"[*] Indexed {len(self.model.files)} source files, {edge_count} imports")
+
         self.check_waterfalls()
         self.check_barrel_imports()
         self.check_dynamic_imports()
         self.check_useEffect_fetching()
         self.check_missing_memoization()
         self.check_image_optimization()
+        self.check_bundle_size()
+
+        # Changed-files run: report findings located in changed files only (the
+        # importer for dynamic imports and split candidates); the bundle
+        # estimate itself stays project-wide
+        self.issues = [i for i in self.issues if self.model.in_scope(i['file'])]
+        self.warnings = [w for w in self.warnings if self.model.in_scope(w['file'])]
 
         self.generate_report()
 
 
+# Inputs that make backtracking regexes blow up; each is (name, unit repeated N times)
+PATHOLOGICAL_INPUTS = [
+    ('useEffect without fetch', 'useEffect(() => { load(); }, []);\n'),
+    ('awaits on one line', 'await step; '),
+    ('unterminated literals', "x = '/[ ` ${ /* "),
+    ('deep nesting', '({['),
+    ('JSX text with quotes', "<p>Don't {a} it's</p>\n"),
+]
+
+
+def benchmark_analysis(sizes: Tuple[int, ...] = (1000, 2000, 4000, 8000)) -> None:
+    """
+    Time the tokenizer-based analyses against the regexes they replaced on
+    synthetic worst-case inputs. Linear code roughly doubles per row; the
+    legacy regexes grow quadratically and are skipped once they pass 5 s.
+    """
+    legacy = [
+        re.compile(r'await\s+\w+.*?\n\s*await\s+\w+'),
+        re.compile(r'useEffect.*?fetch\(', re.DOTALL),
+    ]
+
+    print("=" * 60)
+    print("Analysis benchmark (pathological inputs)")
+    print("=" * 60)
+    for name, unit in PATHOLOGICAL_INPUTS:
+        print(f"\n[{name}]")
+        print(f"  {'size':>10}  {'tokenizer':>10}  {'legacy regex':>12}")
+        legacy_budget_exceeded = False
+        for count in sizes:
+            text = unit * count
+
+            start = time.perf_counter()
+            tokens = tokenize(text)
+            brackets = match_brackets(tokens)
+            find_sequential_awaits(tokens)
+            find_effect_fetches(tokens, brackets)
+            find_components(tokens, brackets)
+            new_time = time.perf_counter() - start
+
+            legacy_cell = 'skipped'
+            if not legacy_budget_exceeded:
+                start = time.perf_counter()
+                for pattern in legacy:
+                    pattern.findall(text)
+                legacy_time = time.perf_counter() - start
+                legacy_cell = f"{legacy_time * 1000:.1f} ms"
+                legacy_budget_exceeded = legacy_time > 5
+            print(f"  {format_kb(len(text)):>10}  {new_time * 1000:>7.1f} ms  {legacy_cell:>12}")
+
+
 def main():
-    import sys
+    parser = argparse.ArgumentParser(description="React performance audit")
+    parser.add_argument("project_path", nargs="?", help="Project root")
+    parser.add_argument("--pages-dir", default="src/pages",
+                        help="Directory holding route modules (default: src/pages)")
+    parser.add_argument("--package-sizes", metavar="FILE",
+                        help="JSON map of npm package name -> minified bytes, for offline package sizing")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Entries and split candidates to list in the bundle estimate")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time the analyses on pathological inputs instead of auditing a project")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
 
-    if len(sys.argv) < 2:
-        print("Usage: python react_performance_checker.py <project_path>")
-        sys.exit(1)
+    if args.benchmark:
+        benchmark_analysis()
+        sys.exit(0)
+    if args.project_path is None:
+        parser.error("project_path is required unless --benchmark is given")
+    try:
+        apply_scope(args.project_path, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
 
-    project_path = sys.argv[1]
+    project_path = args.project_path
 
     if not os.path.exists(project_path):
         print(f"[ERROR] Path not found: {project_path}")
         sys.exit(1)
 
-    checker = PerformanceChecker(project_path)
+    package_sizes = None
+    if args.package_sizes:
+        try:
+            package_sizes = json.loads(Path(args.package_sizes).read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Could not read package sizes: {e}")
+            sys.exit(1)
+
+    checker = PerformanceChecker(project_path, args.pages_dir, package_sizes, args.top)
     checker.run()
 
 
@@ -14,15 +14,30 @@ WHAT IT CHECKS:
     - JSX/TSX files (React page components)
     - Only files that are likely PUBLIC pages
 
+Every page is checked; verdicts are cached per content hash in
+.agent/.cache/seo_pages.json and changed pages are analyzed in parallel.
+
 Usage:
     python seo_checker.py <project_path>
+    python seo_checker.py <project_path> --workers 4 --no-cache
+    python seo_checker.py <project_path> --changed-since origin/main   # changed files only
 """
 import sys
+import argparse
 import json
 import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import find_page_files, read_source  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+from file_analysis import PARALLEL_MIN_FILES, analyze_files  # noqa: E402
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -44,6 +59,13 @@ SKIP_PATTERNS = [
     '.test.', '.spec.', '_test.', '_spec.'
 ]
 
+# Per-page verdicts, cached by content hash; bump the version when checks change
+PAGE_CACHE_FILE = Path(".agent") / ".cache" / "seo_pages.json"
+SEO_ANALYZER_VERSION = 1
+
+H1_RE = re.compile(r'<h1[^>]*>', re.I)
+IMG_RE = re.compile(r'<img[^>]+>', re.I)
+
 
 def is_page_file(file_path: Path) -> bool:
     """Check if this file is likely a public-facing page."""
@@ -76,59 +98,40 @@ def is_page_file(file_path: Path) -> bool:
 
 
 def find_pages(project_path: Path) -> list:
-    """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:50]  # Limit to 50 files
+    """Find page files to check (every page; one pass over the shared walk)."""
+    return find_page_files(project_path, is_page_file, skip_dirs=SKIP_DIRS)
 
 
-def check_page(file_path: Path) -> dict:
-    """Check a single page for SEO issues."""
+def analyze_page(content: str) -> dict:
+    """SEO issues of one page's source."""
     issues = []
-    
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception as e:
-        return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
+    lowered = content.lower()
     
     # Detect if this is a layout/template file (has Head component)
-    is_layout = 'Head>' in content or '<head' in content.lower()
+    is_layout = 'Head>' in content or '<head' in lowered
     
     # 1. Title tag
-    has_title = '<title' in content.lower() or 'title=' in content or 'Head>' in content
+    has_title = '<title' in lowered or 'title=' in content or 'Head>' in content
     if not has_title and is_layout:
         issues.append("Missing <title> tag")
     
     # 2. Meta description
-    has_description = 'name="description"' in content.lower() or 'name=\'description\'' in content.lower()
+    has_description = 'name="description"' in lowered or 'name=\'description\'' in lowered
     if not has_description and is_layout:
         issues.append("Missing meta description")
     
     # 3. Open Graph tags
-    has_og = 'og:' in content or 'property="og:' in content.lower()
+    has_og = 'og:' in content or 'property="og:' in lowered
     if not has_og and is_layout:
         issues.append("Missing Open Graph tags")
     
     # 4. Heading hierarchy - multiple H1s
-    h1_matches = re.findall(r'<h1[^>]*>', content, re.I)
-    if len(h1_matches) > 1:
-        issues.append(f"Multiple H1 tags ({len(h1_matches)})")
+    h1_count = len(H1_RE.findall(content))
+    if h1_count > 1:
+        issues.append(f"Multiple H1 tags ({h1_count})")
     
     # 5. Images without alt
-    img_pattern = r'<img[^>]+>'
-    imgs = re.findall(img_pattern, content, re.I)
-    for img in imgs:
+    for img in IMG_RE.findall(content):
         if 'alt=' not in img.lower():
             issues.append("Image missing alt attribute")
             break
@@ -137,16 +140,22 @@ def check_page(file_path: Path) -> dict:
             break
     
     # 6. Check for canonical link (nice to have)
-    # has_canonical = 'rel="canonical"' in content.lower()
+    # has_canonical = 'rel="canonical"' in lowered
     
-    return {
-        "file": str(file_path.name),
-        "issues": issues
-    }
+    return {"issues": issues}
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def check_page(file_path: Path) -> dict:
+    """Check a single page for SEO issues."""
+    content = read_source(file_path)
+    if content is None:
+        return {"file": str(file_path.name), "issues": ["Error: cannot read file"]}
+    return {"file": str(file_path.name), **analyze_page(content)}
+
+
+def check(target: str, workers: int = 1, use_cache: bool = True) -> int:
+    """Print the report for a project; return the CLI exit code."""
+    project_path = Path(target).resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -163,16 +172,16 @@ def main():
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
         output = {"script": "seo_checker", "files_checked": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     print(f"Found {len(pages)} page files to analyze\n")
     
-    # Check each page
+    # Check each page (unchanged pages reuse their cached verdict)
     all_issues = []
-    for f in pages:
-        result = check_page(f)
+    for f, result in analyze_files(pages, analyze_page, 'seo', SEO_ANALYZER_VERSION, project_path,
+                                   workers=workers, use_cache=use_cache, cache_file=PAGE_CACHE_FILE):
         if result["issues"]:
-            all_issues.append(result)
+            all_issues.append({"file": f.name, **result})
     
     # Summary
     print("=" * 60)
@@ -212,7 +221,29 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    return 0 if passed else 1
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SEO audit of public pages")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--workers", type=int, default=0,
+                        help=f"Worker processes for changed pages (0 = one per CPU; "
+                             f"used once {PARALLEL_MIN_FILES}+ pages need analysis)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-analyze every page instead of reusing verdicts by content hash")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    try:
+        apply_scope(args.project, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
+    sys.exit(check(args.project, workers=args.workers, use_cache=not args.no_cache))
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--offline] [--advisories FILE] [--no-cache]
 Output: JSON with validation findings
 
 This script verifies:
@@ -18,10 +18,20 @@ import os
 import sys
 import re
 import argparse
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 
+# Shared source cache (.agent/.shared/scanner): one walk, one ignore policy, cached reads
+SHARED_LIB = Path(__file__).resolve().parents[3] / ".shared" / "scanner" / "scripts"
+if str(SHARED_LIB) not in sys.path:
+    sys.path.insert(0, str(SHARED_LIB))
+from source_cache import get_cache  # noqa: E402
+from check_plugin import Result, capture_check  # noqa: E402
+from change_set import ChangeSetError, add_scope_arguments, apply_scope  # noqa: E402
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -85,19 +95,262 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
-SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+# Dependency audit tools, keyed by package manager:
+# (lockfiles whose content keys the cache, audit command)
+AUDIT_TOOLS = {
+    "npm": (["package-lock.json", "npm-shrinkwrap.json"], ["npm", "audit", "--json"]),
+    "pip": (["requirements.txt"], ["pip-audit", "-r", "requirements.txt", "-f", "json"]),
+}
+AUDIT_CACHE_FILE = Path(".agent") / ".cache" / "dependency_audit.json"
+
+# File prefilter limits
+MAX_INLINE_BYTES = 512 * 1024      # Files above this are streamed in chunks
+CHUNK_BYTES = 256 * 1024           # Streaming chunk size
+CHUNK_OVERLAP = 4096               # Carried between chunks so boundary matches are kept
+SNIFF_BYTES = 8192                 # Leading block inspected for binary/minified content
+MINIFIED_LINE_LENGTH = 1000        # Average line length that marks a minified bundle
+MINIFIED_SUFFIXES = ('.min.js', '.min.css', '.bundle.js', '.chunk.js')
+
+_COMPILED_SECRET_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), secret_type, severity)
+    for pattern, secret_type, severity in SECRET_PATTERNS
+]
+
+
+# ============================================================================
+#  FILE PREFILTER
+# ============================================================================
+
+def sniff_file(filepath: Path) -> Optional[str]:
+    """
+    Inspect the leading block of a file.
+    Returns a skip reason ("binary", "minified") or None if the file should be scanned.
+    """
+    if filepath.name.lower().endswith(MINIFIED_SUFFIXES):
+        return "minified"
+    
+    try:
+        with open(filepath, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return "unreadable"
+    
+    if b'\x00' in head:
+        return "binary"
+    
+    # A full sniff block with almost no newlines is a minified/generated bundle
+    if len(head) == SNIFF_BYTES:
+        line_count = head.count(b'\n') + 1
+        if len(head) / line_count > MINIFIED_LINE_LENGTH:
+            return "minified"
+    
+    return None
+
+
+def iter_scannable_files(project_path: str, extensions: Set[str], skipped: Dict[str, int],
+                         extra_names: Set[str] = frozenset()):
+    """
+    Yield files worth scanning from the shared source cache.
+    The cache applies the shared skip list and .gitignore; binary and minified
+    files are dropped here. Skip reasons are tallied into `skipped`.
+    """
+    cache = get_cache(project_path)
+    
+    for rel, is_dir in cache.ignored():
+        name = rel.rsplit('/', 1)[-1]
+        if is_dir or Path(name).suffix.lower() in extensions or name in extra_names:
+            skipped["gitignored"] = skipped.get("gitignored", 0) + 1
+    
+    root = Path(project_path).resolve()
+    for path in cache.files(extensions, under=root, names=extra_names):
+        filepath = Path(project_path) / path.relative_to(root)
+        reason = sniff_file(filepath)
+        if reason:
+            skipped[reason] = skipped.get(reason, 0) + 1
+            continue
+        yield filepath
+
+
+def iter_text_windows(filepath: Path):
+    """
+    Yield (offset, text) windows covering the whole file.
+    Small files come back as a single window from the shared cache; large files
+    are streamed in CHUNK_BYTES pieces, each prefixed with the last CHUNK_OVERLAP
+    characters of the previous window so matches that straddle a boundary are
+    still seen.
+    """
+    if filepath.stat().st_size <= MAX_INLINE_BYTES:
+        text = get_cache(filepath).read(filepath)
+        if text is None:
+            raise OSError(f"Cannot read {filepath}")
+        yield 0, text
+        return
+    
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        carry = ''
+        offset = 0
+        while True:
+            chunk = f.read(CHUNK_BYTES)
+            if not chunk:
+                break
+            window = carry + chunk
+            yield offset, window
+            carry = window[-CHUNK_OVERLAP:]
+            offset += len(window) - len(carry)
+
+
+def iter_lines(filepath: Path):
+    """Yield the lines of a file: cached for small files, lazily read for large ones."""
+    if filepath.stat().st_size <= MAX_INLINE_BYTES:
+        index = get_cache(filepath).line_index(filepath)
+        if index is None:
+            raise OSError(f"Cannot read {filepath}")
+        for number in range(1, len(index) + 1):
+            yield index.line(number)
+        return
+    
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        yield from f
+
+
+def count_pattern_matches(filepath: Path, patterns) -> Dict[int, int]:
+    """
+    Count matches for each compiled pattern across a file's windows.
+    Overlapping windows are de-duplicated by absolute match position.
+    Returns {pattern_index: count} for patterns that matched.
+    """
+    counts: Dict[int, int] = {}
+    last_end: Dict[int, int] = {}
+    
+    for offset, text in iter_text_windows(filepath):
+        for idx, (regex, *_rest) in enumerate(patterns):
+            for match in regex.finditer(text):
+                start = offset + match.start()
+                if start < last_end.get(idx, 0):
+                    continue  # Already counted in the previous window
+                last_end[idx] = offset + match.end()
+                counts[idx] = counts.get(idx, 0) + 1
+    
+    return counts
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+def _lockfile_digest(project_path: str, lockfiles: List[str]) -> Optional[Tuple[str, str]]:
+    """Return (lockfile name, sha256) for the first lockfile present, or None."""
+    for name in lockfiles:
+        path = Path(project_path) / name
+        if path.is_file():
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            return name, digest.hexdigest()
+    return None
+
+
+def _load_audit_cache(project_path: str) -> Dict[str, Any]:
+    try:
+        return json.loads((Path(project_path) / AUDIT_CACHE_FILE).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_audit_cache(project_path: str, cache: Dict[str, Any]) -> None:
+    cache_path = Path(project_path) / AUDIT_CACHE_FILE
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+    except OSError:
+        pass  # Cache is an optimization only
+
+
+class AuditError(Exception):
+    """An audit tool ran but produced no audit (network failure, bad lockfile)."""
+
+
+def audit_error(manager: str, audit_data: Any) -> Optional[str]:
+    """
+    Why parsed tool output is not an audit, or None if it is one. A non-zero
+    exit alone is not a failure: npm audit and pip-audit exit 1 when they
+    find advisories.
+    """
+    if not isinstance(audit_data, dict):
+        return "unexpected output"
+    if "error" in audit_data:
+        error = audit_data["error"]
+        detail = error.get("summary") or error.get("code") if isinstance(error, dict) else error
+        return str(audit_data.get("message") or detail or "tool reported an error")
+    expected = ("vulnerabilities", "metadata") if manager == "npm" else ("dependencies",)
+    if not any(key in audit_data for key in expected):
+        return "output has no audit results"
+    return None
+
+
+def summarize_audit(manager: str, audit_data: Dict[str, Any]) -> Dict[str, int]:
+    """Reduce raw `npm audit --json` / `pip-audit -f json` output to severity counts."""
+    severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
+    
+    if manager == "npm":
+        for vuln in audit_data.get("vulnerabilities", {}).values():
+            sev = vuln.get("severity", "low").lower()
+            if sev in severity_count:
+                severity_count[sev] += 1
+    else:
+        # pip-audit reports advisories without severities; count them as high
+        for dep in audit_data.get("dependencies", []):
+            if dep.get("vulns"):
+                severity_count["high"] += 1
+    
+    return severity_count
+
+
+def run_audit_tool(manager: str, project_path: str) -> Optional[Dict[str, int]]:
+    """
+    Run the audit command for a manager. Returns None if the tool is
+    unavailable; raises AuditError if it ran without producing an audit.
+    """
+    _, cmd = AUDIT_TOOLS[manager]
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+    except FileNotFoundError:
+        return None
+    except subprocess.TimeoutExpired:
+        raise AuditError("timed out after 60s")
+    try:
+        audit_data = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        stderr = result.stderr.strip().splitlines()
+        raise AuditError(f"exit code {result.returncode}" + (f": {stderr[-1]}" if stderr else ""))
+    error = audit_error(manager, audit_data)
+    if error is not None:
+        raise AuditError(f"exit code {result.returncode}: {error}" if result.returncode else error)
+    return summarize_audit(manager, audit_data)
+
+
+def scan_dependencies(project_path: str, offline: bool = False,
+                      advisory_snapshot: Optional[str] = None,
+                      use_cache: bool = True) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
-    Checks: npm audit, lock file presence, dependency age.
+    Checks: npm audit / pip-audit, lock file presence, dependency age.
+    
+    Audit results are cached in AUDIT_CACHE_FILE keyed by lockfile hash, so an
+    unchanged lockfile costs no subprocess calls; a failed audit is reported as
+    a finding and never cached. With `offline`, audits are
+    read from `advisory_snapshot` (a JSON file holding saved tool output under
+    "npm"/"pip" keys) or the cache, and never run a tool.
     """
     results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
     
@@ -128,49 +381,98 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                     "message": f"{manager}: No lock file found. Supply chain integrity at risk."
                 })
     
-    # Run npm audit if applicable
-    if (Path(project_path) / "package.json").exists():
+    snapshot = {}
+    if advisory_snapshot:
         try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
+            snapshot = json.loads(Path(advisory_snapshot).read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError) as e:
+            results["findings"].append({
+                "type": "Advisory Snapshot",
+                "severity": "medium",
+                "message": f"Could not read advisory snapshot: {e}"
+            })
+    
+    cache = _load_audit_cache(project_path) if use_cache else {}
+    cache_dirty = False
+    
+    # Resolve each manager from snapshot or cache first; only misses need a tool run
+    audits: Dict[str, Optional[Dict[str, int]]] = {}
+    failures: Dict[str, str] = {}
+    pending = []
+    for manager, (lockfiles, _) in AUDIT_TOOLS.items():
+        if manager == "npm" and not (Path(project_path) / "package.json").exists():
+            continue
+        digest = _lockfile_digest(project_path, lockfiles)
+        if digest is None:
+            continue
+        cache_key = f"{manager}:{digest[1]}"
+        
+        if manager in snapshot:
+            error = audit_error(manager, snapshot[manager])
+            if error is None:
+                audits[manager] = summarize_audit(manager, snapshot[manager])
+            else:
+                failures[manager] = error
+            results.setdefault("audit_source", {})[manager] = "snapshot"
+        elif cache_key in cache:
+            audits[manager] = cache[cache_key]
+            results.setdefault("audit_source", {})[manager] = "cache"
+        elif offline:
+            results.setdefault("audit_source", {})[manager] = "skipped (offline)"
+        else:
+            pending.append((manager, cache_key))
+    
+    # Run remaining audits concurrently
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            futures = {manager: (key, pool.submit(run_audit_tool, manager, project_path))
+                       for manager, key in pending}
+        for manager, (cache_key, future) in futures.items():
+            results.setdefault("audit_source", {})[manager] = "tool"
             try:
-                audit_data = json.loads(result.stdout)
-                vulnerabilities = audit_data.get("vulnerabilities", {})
-                
-                severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-                for vuln in vulnerabilities.values():
-                    sev = vuln.get("severity", "low").lower()
-                    if sev in severity_count:
-                        severity_count[sev] += 1
-                
-                if severity_count["critical"] > 0:
-                    results["status"] = "[!!] Critical vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "critical",
-                        "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
-                    })
-                elif severity_count["high"] > 0:
-                    results["status"] = "[!] High vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "high",
-                        "message": f"{severity_count['high']} high severity vulnerabilities"
-                    })
-                
-                results["npm_audit"] = severity_count
-                
-            except json.JSONDecodeError:
-                pass
-                
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+                audits[manager] = future.result()
+            except AuditError as e:
+                failures[manager] = str(e)  # Never cached: the next run tries again
+                continue
+            if audits[manager] is not None:
+                cache[cache_key] = audits[manager]
+                cache_dirty = True
+    
+    if use_cache and cache_dirty:
+        _save_audit_cache(project_path, cache)
+    
+    for manager, severity_count in audits.items():
+        if severity_count is None:
+            continue
+        label = "npm audit" if manager == "npm" else "pip-audit"
+        
+        if severity_count["critical"] > 0:
+            results["status"] = "[!!] Critical vulnerabilities"
+            results["findings"].append({
+                "type": label,
+                "severity": "critical",
+                "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
+            })
+        elif severity_count["high"] > 0:
+            results["status"] = "[!] High vulnerabilities"
+            results["findings"].append({
+                "type": label,
+                "severity": "high",
+                "message": f"{severity_count['high']} high severity vulnerabilities"
+            })
+        
+        results[f"{manager}_audit"] = severity_count
+    
+    # A failed audit is unknown, not clean: report it instead of 0/0/0/0
+    for manager, error in failures.items():
+        label = "npm audit" if manager == "npm" else "pip-audit"
+        results["findings"].append({
+            "type": label,
+            "severity": "medium",
+            "message": f"{label} failed, dependencies not audited: {error}"
+        })
+        if results["status"] == "[OK] Secure":
+            results["status"] = "[?] Dependency audit failed"
     
     if not results["findings"]:
         results["status"] = "[OK] Supply chain checks passed"
@@ -182,43 +484,35 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
+    Binary, minified and .gitignore'd files are skipped; large files are streamed.
     """
     results = {
         "tool": "secret_scanner",
         "findings": [],
         "status": "[OK] No secrets detected",
         "scanned_files": 0,
+        "skipped_files": {},
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    extensions = CODE_EXTENSIONS | CONFIG_EXTENSIONS
+    for filepath in iter_scannable_files(project_path, extensions, results["skipped_files"]):
+        results["scanned_files"] += 1
         
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
+        try:
+            counts = count_pattern_matches(filepath, _COMPILED_SECRET_PATTERNS)
+        except Exception:
+            continue
+        
+        for idx, count in sorted(counts.items()):
+            _, secret_type, severity = _COMPILED_SECRET_PATTERNS[idx]
+            results["findings"].append({
+                "file": str(filepath.relative_to(project_path)),
+                "type": secret_type,
+                "severity": severity,
+                "count": count
+            })
+            results["by_severity"][severity] += count
     
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -243,39 +537,30 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "findings": [],
         "status": "[OK] No dangerous patterns",
         "scanned_files": 0,
+        "skipped_files": {},
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    for filepath in iter_scannable_files(project_path, CODE_EXTENSIONS, results["skipped_files"]):
+        results["scanned_files"] += 1
         
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
+        try:
+            # Large files are iterated lazily so they never sit fully in memory
+            for line_num, line in enumerate(iter_lines(filepath), 1):
+                for pattern, name, severity, category in DANGEROUS_PATTERNS:
+                    if re.search(pattern, line, re.IGNORECASE):
+                        results["findings"].append({
+                            "file": str(filepath.relative_to(project_path)),
+                            "line": line_num,
+                            "pattern": name,
+                            "severity": severity,
+                            "category": category,
+                            "snippet": line.strip()[:80]
+                        })
+                        results["by_category"][category] = results["by_category"].get(category, 0) + 1
+                            
+        except Exception:
+            pass
     
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
@@ -315,30 +600,19 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
         (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
     ]
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    config_names = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+    for filepath in iter_scannable_files(project_path, CONFIG_EXTENSIONS, {}, config_names):
+        content = get_cache(filepath).read(filepath)
+        if content is None:
+            continue
         
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
+        for pattern, issue, severity in config_issues:
+            if re.search(pattern, content, re.IGNORECASE):
+                results["findings"].append({
+                    "file": str(filepath.relative_to(project_path)),
+                    "issue": issue,
+                    "severity": severity
+                })
     
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
@@ -369,8 +643,12 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", offline: bool = False,
+                  advisory_snapshot: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Execute security validation scans.
+    The dependency audit runs in a background thread while the file scanners work.
+    """
     
     report = {
         "project": project_path,
@@ -385,27 +663,44 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         }
     }
     
+    def deps_scanner(path: str) -> Dict[str, Any]:
+        return scan_dependencies(path, offline=offline, advisory_snapshot=advisory_snapshot,
+                                 use_cache=use_cache)
+    
     scanners = {
-        "deps": ("dependencies", scan_dependencies),
+        "deps": ("dependencies", deps_scanner),
         "secrets": ("secrets", scan_secrets),
         "patterns": ("code_patterns", scan_code_patterns),
         "config": ("configuration", scan_configuration),
     }
     
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
-            report["scans"][name] = result
-            
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
-                if sev == "critical":
-                    report["summary"]["critical"] += 1
-                elif sev == "high":
-                    report["summary"]["high"] += 1
+    selected = {key: entry for key, entry in scanners.items()
+                if scan_type == "all" or scan_type == key}
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        deps_future = pool.submit(deps_scanner, project_path) if "deps" in selected else None
+        
+        results = {}
+        for key, (name, scanner) in selected.items():
+            if key != "deps":
+                results[key] = scanner(project_path)
+        if deps_future is not None:
+            results["deps"] = deps_future.result()
+    
+    # Merge in declaration order so the report layout is stable
+    for key, (name, _) in selected.items():
+        result = results[key]
+        report["scans"][name] = result
+        
+        findings_count = len(result.get("findings", []))
+        report["summary"]["total_findings"] += findings_count
+        
+        for finding in result.get("findings", []):
+            sev = finding.get("severity", "low")
+            if sev == "critical":
+                report["summary"]["critical"] += 1
+            elif sev == "high":
+                report["summary"]["high"] += 1
     
     # Determine overall status
     if report["summary"]["critical"] > 0:
@@ -427,16 +722,35 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
-    
+    parser.add_argument("--offline", action="store_true",
+                        help="Never run audit tools; use the advisory snapshot or cache")
+    parser.add_argument("--advisories", metavar="FILE",
+                        help="Advisory snapshot JSON with saved npm/pip audit output")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and do not update the dependency audit cache")
+    
+    add_scope_arguments(parser)
     args = parser.parse_args()
+    try:
+        apply_scope(args.project_path, args)
+    except ChangeSetError as e:
+        parser.error(str(e))
     
-    if not os.path.isdir(args.project_path):
-        print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
-        sys.exit(1)
+    sys.exit(check(args.project_path, args.scan_type, args.output, offline=args.offline,
+                   advisory_snapshot=args.advisories, use_cache=not args.no_cache))
+
+
+def check(project_path: str, scan_type: str = "all", output: str = "json", offline: bool = False,
+          advisory_snapshot: Optional[str] = None, use_cache: bool = True) -> int:
+    """Print the scan report for a project; return the CLI exit code."""
+    if not os.path.isdir(project_path):
+        print(json.dumps({"error": f"Directory not found: {project_path}"}))
+        return 1
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    result = run_full_scan(project_path, scan_type, offline=offline,
+                           advisory_snapshot=advisory_snapshot, use_cache=use_cache)
     
-    if args.output == "summary":
+    if output == "summary":
         print(f"\n{'='*60}")
         print(f"Security Scan: {result['project']}")
         print(f"{'='*60}")
@@ -452,6 +766,12 @@ def main():
                 print(f"  - {finding}")
     else:
         print(json.dumps(result, indent=2))
+    return 0
+
+
+def run(project_path, url=None) -> Result:
+    """Check-runner entry point: the default CLI report, captured in-process."""
+    return capture_check(check, str(project_path))
 
 
 if __name__ == "__main__":